@@ -0,0 +1,243 @@
+"""
+콜드 스타트 벤치마크
+
+로컬 Zendesk 스텁 서버를 띄우고 `python -m src`를 새 프로세스로 반복 실행하여 측정합니다.
+
+- time-to-first-healthy: 프로세스 시작 → /health 200 응답
+- time-to-first-tool-response: 프로세스 시작 → initialize → tools/call(get_top_agents) 응답
+
+사용법:
+    python scripts/bench_startup.py                      # eager/lazy 모드 각 5회
+    python scripts/bench_startup.py --runs 10 --mode lazy
+    python scripts/bench_startup.py --upstream-delay 0.2  # 스텁 응답 지연 (초)
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MCP_HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+
+# 스텁 검색 결과 티켓 수
+STUB_TICKETS = 200
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def build_stub_app(delay: float) -> Starlette:
+    """Zendesk API 스텁 (users/me, search, users/show_many)"""
+    tickets = [
+        {
+            "id": i,
+            "subject": f"stub ticket {i}",
+            "status": "solved",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-02T00:00:00Z",
+            "assignee_id": 1000 + i % 7,
+            "tags": ["aws-support"],
+            "custom_fields": [],
+        }
+        for i in range(1, STUB_TICKETS + 1)
+    ]
+
+    async def users_me(request):
+        await asyncio.sleep(delay)
+        return JSONResponse({"user": {"id": 1, "name": "bench"}})
+
+    async def search(request):
+        await asyncio.sleep(delay)
+        return JSONResponse(
+            {"results": tickets, "next_page": None, "count": len(tickets)},
+            headers={"X-Rate-Limit": "700", "X-Rate-Limit-Remaining": "699"},
+        )
+
+    async def show_many(request):
+        await asyncio.sleep(delay)
+        ids = [int(uid) for uid in request.query_params["ids"].split(",")]
+        return JSONResponse({"users": [{"id": uid, "name": f"Agent {uid}"} for uid in ids]})
+
+    return Starlette(
+        routes=[
+            Route("/api/v2/users/me.json", users_me),
+            Route("/api/v2/search.json", search),
+            Route("/api/v2/users/show_many.json", show_many),
+        ]
+    )
+
+
+def start_stub(delay: float) -> str:
+    """스텁 서버를 백그라운드 스레드로 시작하고 API 기본 URL 반환"""
+    port = _free_port()
+    config = uvicorn.Config(
+        build_stub_app(delay), host="127.0.0.1", port=port, log_level="warning"
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/api/v2"
+
+
+def _rpc(client: httpx.Client, url: str, payload: dict, session_id: str | None = None):
+    headers = dict(MCP_HEADERS)
+    if session_id:
+        headers["mcp-session-id"] = session_id
+    return client.post(url, json=payload, headers=headers)
+
+
+def run_once(api_base_url: str, lazy: bool, timeout: float) -> tuple[float, float]:
+    """
+    서버 프로세스 1회 실행 측정
+
+    Returns:
+        (time-to-first-healthy, time-to-first-tool-response) 초
+    """
+    port = _free_port()
+    env = {
+        **os.environ,
+        "ZENDESK_SUBDOMAIN": "bench",
+        "ZENDESK_EMAIL": "bench@example.com",
+        "ZENDESK_API_TOKEN": "bench",
+        "ZENDESK_API_BASE_URL": api_base_url,
+        "ZENDESK_TENANTS": "",
+        "ZENDESK_TENANTS_FILE": "",
+        "ZENDESK_CACHE_BACKEND": "memory",
+        "ZENDESK_CACHE_DIR": "",
+        "ZENDESK_SEARCH_INDEX_PATH": "",
+        "ZENDESK_WARMER_ENABLED": "false",
+        "MCP_HOST": "127.0.0.1",
+        "MCP_PORT": str(port),
+        "MCP_WORKERS": "1",
+        "MCP_LAZY_STARTUP": "true" if lazy else "false",
+        # 응답 본문을 그대로 JSON으로 읽기 위해 SSE 대신 단일 JSON 응답 사용
+        "MCP_JSON_RESPONSE": "true",
+    }
+    base = f"http://127.0.0.1:{port}"
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "src"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(timeout=timeout) as client:
+            while True:
+                if time.perf_counter() - started > timeout:
+                    raise TimeoutError("server did not become healthy")
+                if proc.poll() is not None:
+                    raise RuntimeError(f"server exited with code {proc.returncode}")
+                try:
+                    if client.get(f"{base}/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+            healthy = time.perf_counter() - started
+
+            response = _rpc(
+                client,
+                f"{base}/mcp/",
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "initialize",
+                    "params": {
+                        "protocolVersion": "2025-06-18",
+                        "capabilities": {},
+                        "clientInfo": {"name": "bench_startup", "version": "1.0"},
+                    },
+                },
+            )
+            response.raise_for_status()
+            session_id = response.headers.get("mcp-session-id")
+            _rpc(
+                client,
+                f"{base}/mcp/",
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                session_id,
+            )
+            response = _rpc(
+                client,
+                f"{base}/mcp/",
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "method": "tools/call",
+                    "params": {"name": "get_top_agents", "arguments": {"period_days": 30}},
+                },
+                session_id,
+            )
+            response.raise_for_status()
+            if response.json().get("result", {}).get("isError"):
+                raise RuntimeError(f"tool call failed: {response.text[:200]}")
+            first_tool = time.perf_counter() - started
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+    return healthy, first_tool
+
+
+def _summary(values: list[float]) -> str:
+    ms = [v * 1000 for v in values]
+    return f"median {statistics.median(ms):7.0f} ms  (min {min(ms):.0f}, max {max(ms):.0f})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zendesk MCP 서버 콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="모드별 실행 횟수 (기본값: 5)")
+    parser.add_argument(
+        "--mode",
+        choices=["eager", "lazy", "both"],
+        default="both",
+        help="시작 모드 (MCP_LAZY_STARTUP, 기본값: both)",
+    )
+    parser.add_argument(
+        "--upstream-delay",
+        type=float,
+        default=0.05,
+        help="스텁 Zendesk 응답 지연 (초, 기본값: 0.05)",
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="실행당 최대 대기 시간 (초)")
+    args = parser.parse_args()
+
+    api_base_url = start_stub(args.upstream_delay)
+    modes = ["eager", "lazy"] if args.mode == "both" else [args.mode]
+
+    print(f"stub: {api_base_url}  runs: {args.runs}  upstream delay: {args.upstream_delay}s")
+    for mode in modes:
+        results = [run_once(api_base_url, mode == "lazy", args.timeout) for _ in range(args.runs)]
+        print(f"\n[{mode}]")
+        print(f"  time-to-first-healthy:       {_summary([r[0] for r in results])}")
+        print(f"  time-to-first-tool-response: {_summary([r[1] for r in results])}")
+
+
+if __name__ == "__main__":
+    main()
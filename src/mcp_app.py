@@ -0,0 +1,116 @@
+"""
+FastMCP 앱 정의 (도구 등록)
+
+FastMCP와 도구 모듈은 import 비용이 커서 src.server가 lifespan 시작 시
+별도 스레드에서 불러옵니다.
+"""
+
+import asyncio
+import os
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.server.dependencies import get_http_headers, get_http_request
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from src.services.tenants import (
+    TENANT_HEADER,
+    TenantError,
+    get_registry,
+    parse_bearer_token,
+    use_tenant,
+)
+from src.tools import (
+    fetch_search_page,
+    get_agent_response_times,
+    get_service_trends,
+    get_ticket_changes,
+    get_ticket_details,
+    get_top_agents,
+    search_tickets,
+)
+from src.utils.progress import ClientDisconnected
+
+# 단일 JSON 응답 모드 (true면 진행 알림 없이 최종 결과만 응답, SSE를 버퍼링하는 프록시용)
+JSON_RESPONSE = os.getenv("MCP_JSON_RESPONSE", "false").lower() == "true"
+
+# 클라이언트 연결 종료 확인 주기 (초)
+DISCONNECT_POLL_SECONDS = 1.0
+
+# FastMCP 서버 인스턴스 생성
+mcp = FastMCP(
+    name="zendesk-mcp",
+    instructions="Zendesk 티켓 데이터 분석을 위한 MCP 서버입니다. 티켓 검색, 담당자 성과 분석, 트렌드 분석 등을 제공합니다.",
+    version="1.1.0",
+)
+
+
+class TenantMiddleware(Middleware):
+    """도구 호출을 요청 헤더(X-Zendesk-Tenant 또는 Bearer 토큰)로 결정한 테넌트로 실행"""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        # stdio 전송 등 HTTP 요청이 없으면 빈 헤더 → 기본 테넌트
+        headers = get_http_headers(include={"authorization"})
+        try:
+            tenant = get_registry().resolve(
+                headers.get(TENANT_HEADER.lower()),
+                parse_bearer_token(headers.get("authorization")),
+            )
+        except TenantError as e:
+            raise ToolError(str(e)) from None
+
+        with use_tenant(tenant):
+            return await call_next(context)
+
+
+class DisconnectMiddleware(Middleware):
+    """
+    HTTP 클라이언트 연결이 끊기면 진행 중인 도구 호출(남은 Zendesk 스캔)을 취소
+
+    진행 알림 전송 중 연결 종료를 확인한 도구의 ClientDisconnected도 같은 오류로 변환합니다.
+    """
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        try:
+            request = get_http_request()
+        except RuntimeError:
+            # stdio 전송 등 HTTP 요청이 없는 경우
+            request = None
+
+        call = asyncio.create_task(call_next(context))
+        try:
+            while not call.done():
+                await asyncio.wait({call}, timeout=DISCONNECT_POLL_SECONDS)
+                if request is not None and not call.done() and await request.is_disconnected():
+                    raise ToolError("Client disconnected")
+            return call.result()
+        except (ClientDisconnected, ToolError) as e:
+            # 도구에서 발생한 예외는 FastMCP가 ToolError로 감싸서 전달
+            cause = e if isinstance(e, ClientDisconnected) else e.__cause__
+            if not isinstance(cause, ClientDisconnected):
+                raise
+            raise ToolError("Client disconnected") from None
+        finally:
+            # 연결 종료 또는 클라이언트 취소 요청(notifications/cancelled) 시 작업 정리
+            if not call.done():
+                call.cancel()
+                await asyncio.gather(call, return_exceptions=True)
+
+
+mcp.add_middleware(DisconnectMiddleware())
+mcp.add_middleware(TenantMiddleware())
+
+# Tools 등록
+mcp.tool(search_tickets)
+mcp.tool(get_ticket_details)
+mcp.tool(get_top_agents)
+mcp.tool(get_service_trends)
+mcp.tool(fetch_search_page)
+mcp.tool(get_agent_response_times)
+mcp.tool(get_ticket_changes)
+
+# Streamable HTTP 앱 (기본: SSE 응답으로 진행 알림 전송)
+mcp_app = mcp.http_app(
+    path="/",
+    json_response=JSON_RESPONSE,
+)
@@ -10,15 +10,23 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, computed_field
 
+from src.services.tenants import current_tenant
+
 
 # ============================================================
 # 공통 모델
 # ============================================================
 
-# Zendesk 서브도메인 (티켓 URL 생성용)
+# Zendesk 서브도메인 (티켓 URL 생성용, 테넌트에 서브도메인이 없을 때 사용)
 ZENDESK_SUBDOMAIN = os.getenv("ZENDESK_SUBDOMAIN", "saltware")
 
 
+def ticket_url(ticket_id: int) -> str:
+    """현재 테넌트의 티켓 URL"""
+    subdomain = current_tenant().subdomain or ZENDESK_SUBDOMAIN
+    return f"https://{subdomain}.zendesk.com/agent/tickets/{ticket_id}"
+
+
 class TicketInfo(BaseModel):
     """티켓 기본 정보"""
 
@@ -27,13 +35,14 @@ class TicketInfo(BaseModel):
     status: str = Field(description="티켓 상태")
     priority: Optional[str] = Field(default=None, description="우선순위")
     created_at: Optional[datetime] = Field(default=None, description="생성일시")
+    updated_at: Optional[datetime] = Field(default=None, description="최종 수정일시")
     company_name: Optional[str] = Field(default=None, description="요청 회사명")
 
     @computed_field
     @property
     def url(self) -> str:
         """티켓 URL"""
-        return f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/agent/tickets/{self.id}"
+        return ticket_url(self.id)
 
 
 class CompanyGroup(BaseModel):
@@ -49,6 +58,22 @@ class CompanyGroup(BaseModel):
 # ============================================================
 
 
+class SearchCoverage(BaseModel):
+    """검색 커버리지 (시간 예산 초과/오류로 누락된 쿼리 정보)"""
+
+    total_queries: int = Field(description="실행한 검색 쿼리 수")
+    completed_queries: int = Field(description="모든 페이지를 수집한 쿼리 수")
+    partial_queries: int = Field(
+        default=0, description="시간 예산 초과로 일부 페이지만 수집한 쿼리 수"
+    )
+    failed_queries: int = Field(
+        default=0, description="오류 또는 시간 예산 초과로 결과가 없는 쿼리 수"
+    )
+    indexed_tickets: int = Field(
+        default=0, description="로컬 검색 인덱스에서 찾은 티켓 수 (원격 검색 생략 기간)"
+    )
+
+
 class SearchResult(BaseModel):
     """통합 검색 결과"""
 
@@ -56,7 +81,61 @@ class SearchResult(BaseModel):
     total_tickets: int = Field(description="총 티켓 수")
     period: str = Field(description="검색 기간")
     companies: list[CompanyGroup] = Field(
-        description="회사별 그룹 (티켓 수 내림차순)"
+        description="회사별 그룹 첫 페이지 (티켓 수 내림차순)"
+    )
+    total_companies: int = Field(default=0, description="전체 회사 그룹 수")
+    handle: Optional[str] = Field(
+        default=None,
+        description="전체 결과 핸들 (fetch_search_page로 다음 페이지/회사별 전체 티켓 조회)",
+    )
+    next_cursor: Optional[str] = Field(
+        default=None, description="다음 페이지 커서 (마지막 페이지면 없음)"
+    )
+    complete: bool = Field(
+        default=True,
+        description="모든 검색 쿼리가 완료되었는지 여부 (false면 부분 결과)",
+    )
+    coverage: Optional[SearchCoverage] = Field(
+        default=None, description="검색 쿼리 수집 현황"
+    )
+
+
+class SearchPage(BaseModel):
+    """검색 결과 페이지 (fetch_search_page)"""
+
+    handle: str = Field(description="검색 결과 핸들")
+    search_params: str = Field(description="검색 조건 요약")
+    period: str = Field(description="검색 기간")
+    total_tickets: int = Field(description="총 티켓 수")
+    total_companies: int = Field(description="전체 회사 그룹 수")
+    companies: list[CompanyGroup] = Field(
+        description="회사별 그룹 페이지 (회사 지정 시 해당 회사 하나와 티켓 페이지)"
+    )
+    next_cursor: Optional[str] = Field(
+        default=None, description="다음 페이지 커서 (마지막 페이지면 없음)"
+    )
+
+
+# ============================================================
+# get_ticket_changes 관련 모델
+# ============================================================
+
+
+class TicketChangesResult(BaseModel):
+    """마지막 조회 이후 변경된 티켓"""
+
+    subscription: str = Field(description="커서 소유자 (구독 이름, MCP 세션 또는 클라이언트)")
+    since: datetime = Field(description="이번 조회 기준 시각 (이전 조회의 until)")
+    until: datetime = Field(description="다음 조회 기준 시각 (받은 티켓의 최종 수정일시)")
+    total_tickets: int = Field(description="변경된 티켓 수")
+    created_tickets: int = Field(description="그중 새로 생성된 티켓 수")
+    companies: list[CompanyGroup] = Field(
+        description="회사별 변경 티켓 (티켓 수 내림차순, 회사 없는 티켓 제외)"
+    )
+    complete: bool = Field(
+        default=True,
+        description="모든 변경을 조회했는지 여부 "
+                    "(false면 커서를 옮기지 않고 다음 조회에서 이어서 조회)",
     )
 
 
@@ -78,6 +157,53 @@ class TopAgentsResult(BaseModel):
 
     period: str = Field(description="검색 기간")
     agents: list[AgentPerformance] = Field(description="담당자 목록 (성과순)")
+    complete: bool = Field(
+        default=True,
+        description="모든 티켓을 집계했는지 여부 (false면 시간 예산 초과로 부분 집계)",
+    )
+
+
+# ============================================================
+# get_agent_response_times 관련 모델
+# ============================================================
+
+
+class ResponseTimeStats(BaseModel):
+    """응답/해결 시간 분위수 (분 단위, 근사값)"""
+
+    ticket_count: int = Field(description="집계한 티켓 수")
+    first_reply_p50_minutes: Optional[float] = Field(
+        default=None, description="첫 응답 시간 중앙값 (분)"
+    )
+    first_reply_p90_minutes: Optional[float] = Field(
+        default=None, description="첫 응답 시간 p90 (분)"
+    )
+    resolution_p50_minutes: Optional[float] = Field(
+        default=None, description="전체 해결 시간 중앙값 (분)"
+    )
+    resolution_p90_minutes: Optional[float] = Field(
+        default=None, description="전체 해결 시간 p90 (분)"
+    )
+
+
+class AgentResponseTime(ResponseTimeStats):
+    """담당자별 응답/해결 시간"""
+
+    name: str = Field(description="담당자 이름")
+    email: Optional[str] = Field(default=None, description="담당자 이메일")
+
+
+class AgentResponseTimesResult(BaseModel):
+    """담당자 응답/해결 시간 분석 결과"""
+
+    period: str = Field(description="분석 기간")
+    business_hours: bool = Field(description="업무 시간 기준 여부 (false면 달력 시간)")
+    agents: list[AgentResponseTime] = Field(description="담당자 목록 (해결 티켓 수순)")
+    overall: ResponseTimeStats = Field(description="전체 담당자 기준 분위수")
+    complete: bool = Field(
+        default=True,
+        description="모든 티켓을 집계했는지 여부 (false면 시간 예산 초과로 부분 집계)",
+    )
 
 
 # ============================================================
@@ -98,6 +224,10 @@ class ServiceTrendsResult(BaseModel):
     period: str = Field(description="분석 기간")
     total_tickets: int = Field(description="총 티켓 수")
     services: list[ServiceTrend] = Field(description="서비스별 티켓 수 (내림차순)")
+    complete: bool = Field(
+        default=True,
+        description="모든 티켓을 집계했는지 여부 (false면 시간 예산 초과로 부분 집계)",
+    )
 
 
 # ============================================================
@@ -124,4 +254,4 @@ class TicketDetails(BaseModel):
     @property
     def url(self) -> str:
         """티켓 URL"""
-        return f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/agent/tickets/{self.id}"
+        return ticket_url(self.id)
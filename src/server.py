@@ -2,59 +2,239 @@
 Zendesk MCP Server
 
 FastMCP 기반 MCP 서버 - Zendesk 티켓 데이터 분석
+
+콜드 스타트 단축을 위해 이 모듈은 Starlette만 import하고, FastMCP와 도구(src.mcp_app)는
+lifespan 시작 시 별도 스레드에서 불러옵니다. 그동안 Zendesk 연결(DNS, TLS, 인증)을 미리 엽니다.
+MCP_LAZY_STARTUP=true이면 로딩 완료를 기다리지 않고 바로 요청을 받습니다
+(/health는 즉시 응답, /mcp 요청은 로딩이 끝날 때까지 대기).
 """
 
+import asyncio
+import importlib
+import json
+import logging
 import os
+from contextlib import asynccontextmanager, suppress
 
-import uvicorn
 from dotenv import load_dotenv
-from fastmcp import FastMCP
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse
 from starlette.routing import Mount, Route
 
-from src.tools import (
-    get_service_trends,
-    get_ticket_details,
-    get_top_agents,
-    search_tickets,
-)
-
-# 환경변수 로드
+# 환경변수 로드 (서비스 모듈은 import 시점에 환경변수를 읽으므로 먼저 실행)
 load_dotenv()
 
-# FastMCP 서버 인스턴스 생성
-mcp = FastMCP(
-    name="zendesk-mcp",
-    instructions="Zendesk 티켓 데이터 분석을 위한 MCP 서버입니다. 티켓 검색, 담당자 성과 분석, 트렌드 분석 등을 제공합니다.",
-    version="1.1.0",
-)
+logger = logging.getLogger(__name__)
 
-# Tools 등록
-mcp.tool(search_tickets)
-mcp.tool(get_ticket_details)
-mcp.tool(get_top_agents)
-mcp.tool(get_service_trends)
+# FastMCP 앱 로딩 완료 전에 요청을 받을지 여부
+LAZY_STARTUP = os.getenv("MCP_LAZY_STARTUP", "false").lower() in ("1", "true", "yes")
 
-# Streamable HTTP 앱 (JSON 응답)
-mcp_app = mcp.http_app(
-    path="/",
-    json_response=True,
+# 시작 시 Zendesk 연결 미리 열기 여부
+PREWARM_CONNECTIONS = os.getenv("ZENDESK_PREWARM_CONNECTIONS", "true").lower() in (
+    "1",
+    "true",
+    "yes",
 )
 
 
+class MCPLoader:
+    """FastMCP 앱 지연 로딩 (/mcp 마운트용 ASGI 앱)"""
+
+    def __init__(self, module: str = "src.mcp_app"):
+        self.module = module
+        self.app = None
+        self.error: BaseException | None = None
+        self.ready = asyncio.Event()
+        self._stop = asyncio.Event()
+
+    @property
+    def status(self) -> str:
+        """로딩 상태 (starting / ready / error)"""
+        if self.error is not None:
+            return "error"
+        return "ready" if self.app is not None else "starting"
+
+    async def run(self, app) -> None:
+        """FastMCP 앱을 불러와 종료 요청(stop)까지 FastMCP lifespan 유지"""
+        try:
+            module = await asyncio.to_thread(importlib.import_module, self.module)
+            async with module.mcp_app.lifespan(app):
+                self.app = module.mcp_app
+                self.ready.set()
+                await self._stop.wait()
+        except Exception as e:
+            self.error = e
+            self.ready.set()
+            raise
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.ready.wait()
+        if self.app is None:
+            response = JSONResponse({"error": "MCP server failed to start"}, status_code=503)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+mcp_loader = MCPLoader()
+
+
 async def health_check(request):
-    """헬스체크 엔드포인트"""
-    return JSONResponse({"status": "healthy", "server": "zendesk-mcp"})
+    """헬스체크 엔드포인트 (mcp: FastMCP 앱 로딩 상태)"""
+    status = mcp_loader.status
+    return JSONResponse(
+        {
+            "status": "unhealthy" if status == "error" else "healthy",
+            "server": "zendesk-mcp",
+            "mcp": status,
+        },
+        status_code=503 if status == "error" else 200,
+    )
+
+
+async def metrics(request):
+    """
+    메트릭 엔드포인트 (프로세스 최대 RSS/스캔 임시 파일 사용량, 테넌트별 Rate Limit 여유,
+    엔드포인트별 응답 시간/헤지/서킷 상태)
+
+    FastMCP 앱 로딩 전에는 테넌트 정보 없이 반환합니다.
+    """
+    from src.utils.spill import spill_stats
+
+    body = {"mcp": mcp_loader.status, "process": spill_stats(), "tenants": {}}
+    if mcp_loader.app is None:
+        return JSONResponse(body)
+
+    from src.services.tenants import get_registry
+
+    for tenant in get_registry():
+        body["tenants"][tenant.name] = {
+            "rate_limit_headroom": round(tenant.rate_limit.headroom(), 3),
+            "endpoints": {
+                name: guard.stats() for name, guard in sorted(tenant.endpoints.items())
+            },
+        }
+    return JSONResponse(body)
+
+
+async def zendesk_webhook(request):
+    """
+    Zendesk Webhook 엔드포인트 (티켓/사용자 변경 이벤트 → 캐시 반영)
+
+    테넌트는 경로(/webhooks/zendesk/{tenant})로 지정하며, 생략 시 기본 테넌트입니다.
+    """
+    # 서비스 모듈은 FastMCP 앱과 함께 로딩됨
+    await mcp_loader.ready.wait()
+    from src.services.tenants import get_registry, use_tenant
+
+    registry = get_registry()
+    name = request.path_params.get("tenant")
+    tenant = registry.tenants.get(name) if name else registry.default
+    if tenant is None:
+        return JSONResponse({"error": f"unknown tenant: {name}"}, status_code=404)
+
+    with use_tenant(tenant):
+        return await _handle_webhook(request, tenant.cache)
+
+
+async def _handle_webhook(request, cache):
+    """현재 테넌트로 Webhook 서명 검증 후 이벤트 반영"""
+    from src.services.webhooks import (
+        SIGNATURE_HEADER,
+        TIMESTAMP_HEADER,
+        apply_event,
+        get_webhook_secret,
+        verify_signature,
+    )
+
+    secret = get_webhook_secret()
+    if not secret:
+        return JSONResponse({"error": "webhook not configured"}, status_code=503)
+
+    body = await request.body()
+    if not verify_signature(
+        secret,
+        request.headers.get(SIGNATURE_HEADER),
+        request.headers.get(TIMESTAMP_HEADER),
+        body,
+    ):
+        return JSONResponse({"error": "invalid signature"}, status_code=401)
+
+    try:
+        payload = json.loads(body)
+        result = await apply_event(cache, payload)
+    except (ValueError, TypeError, AttributeError) as e:
+        return JSONResponse({"error": f"invalid payload: {e}"}, status_code=400)
+
+    return JSONResponse({"status": "ok", **result})
+
+
+async def _prewarm_connections() -> None:
+    """모든 테넌트의 Zendesk 연결 미리 열기 (FastMCP 로딩과 동시에 진행)"""
+    try:
+        module = await asyncio.to_thread(importlib.import_module, "src.services.zendesk_client")
+        await module.prewarm_connections()
+    except Exception:
+        logger.exception("Connection prewarm failed")
+
+
+async def _run_warmer() -> None:
+    """FastMCP 로딩 완료 후 캐시 워머 실행"""
+    await mcp_loader.ready.wait()
+    from src.services.warmer import WARMER_ENABLED, warmer
+
+    if WARMER_ENABLED and mcp_loader.app is not None:
+        await warmer.run()
+
+
+async def _cancel(task: asyncio.Task | None) -> None:
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """FastMCP 로딩/lifespan + 연결 미리 열기 + 캐시 워머 + 테넌트 연결 풀 정리"""
+    loader_task = asyncio.create_task(mcp_loader.run(app))
+    prewarm_task = asyncio.create_task(_prewarm_connections()) if PREWARM_CONNECTIONS else None
+    warmer_task = asyncio.create_task(_run_warmer())
+
+    if not LAZY_STARTUP:
+        await mcp_loader.ready.wait()
+        if mcp_loader.error is not None:
+            await _cancel(prewarm_task)
+            await _cancel(warmer_task)
+            await loader_task  # 로딩 오류를 다시 발생시켜 서버 시작 중단
+
+    try:
+        yield
+    finally:
+        await _cancel(warmer_task)
+        await _cancel(prewarm_task)
+        mcp_loader.stop()
+        with suppress(Exception):
+            await loader_task
+        if mcp_loader.app is not None:
+            from src.services.tenants import get_registry
+
+            await get_registry().aclose()
 
 
 # 메인 앱 - lifespan 전달 필수!
 app = Starlette(
     routes=[
         Route("/health", health_check),
-        Mount("/mcp", app=mcp_app),
+        Route("/metrics", metrics),
+        Route("/webhooks/zendesk", zendesk_webhook, methods=["POST"]),
+        Route("/webhooks/zendesk/{tenant}", zendesk_webhook, methods=["POST"]),
+        Mount("/mcp", app=mcp_loader),
     ],
-    lifespan=mcp_app.lifespan,  # FastMCP lifespan 전달
+    lifespan=lifespan,  # FastMCP 앱 로딩 및 lifespan 포함
 )
 
 
@@ -62,12 +242,28 @@ def main():
     """MCP 서버 시작"""
     host = os.getenv("MCP_HOST", "0.0.0.0")
     port = int(os.getenv("MCP_PORT", "8000"))
+    workers = int(os.getenv("MCP_WORKERS", "1"))
 
     print(f"🚀 Starting Zendesk MCP Server...", flush=True)
     print(f"   Endpoint: http://{host}:{port}/mcp", flush=True)
     print(f"   Health:   http://{host}:{port}/health", flush=True)
+    print(f"   Metrics:  http://{host}:{port}/metrics", flush=True)
+    print(f"   Webhook:  http://{host}:{port}/webhooks/zendesk", flush=True)
+
+    import uvicorn
 
-    uvicorn.run(app, host=host, port=port)
+    if workers > 1:
+        # 워커별 캐시가 나뉘지 않도록 공유 캐시(redis) 사용 권장
+        if os.getenv("ZENDESK_CACHE_BACKEND", "memory").lower() != "redis":
+            print(
+                "   ⚠️  MCP_WORKERS > 1 without ZENDESK_CACHE_BACKEND=redis: "
+                "each worker keeps its own cache",
+                flush=True,
+            )
+        # 멀티 워커는 앱을 import 문자열로 전달해야 함
+        uvicorn.run("src.server:app", host=host, port=port, workers=workers)
+    else:
+        uvicorn.run(app, host=host, port=port)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,481 @@
+"""
+캐시 서비스
+
+Zendesk 조회 결과(사용자, 티켓, 검색 결과, 집계 결과)를 보관하는 TTL 캐시.
+Webhook 이벤트는 변경된 티켓을 포함하거나 새로 포함할 수 있는 검색 결과를 무효화하지만,
+Webhook이 누락되거나 지연되면 TTL 동안 오래된 결과가 남을 수 있으므로 TTL은 짧게 유지합니다.
+여러 테넌트는 하나의 백엔드를 키 접두사(NamespacedCache)로 나눠 씁니다.
+
+캐시 백엔드 (ZENDESK_CACHE_BACKEND):
+- memory: 프로세스 내 캐시 (ZENDESK_CACHE_DIR 설정 시 디스크 캐시 계층 추가)
+- redis: 여러 uvicorn 워커/레플리카가 공유하는 Redis 프로토콜 서버
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterator
+
+if TYPE_CHECKING:
+    from src.services.disk_cache import DiskCache
+
+# 캐시 기본 TTL (초)
+DEFAULT_TTL_SECONDS = int(os.getenv("ZENDESK_CACHE_TTL_SECONDS", "300"))
+
+# 인메모리 캐시 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거, 0이면 제한 없음)
+MAX_ENTRIES = int(os.getenv("ZENDESK_CACHE_MAX_ENTRIES", "10000"))
+
+# 캐시 백엔드 종류 (memory / redis)
+CACHE_BACKEND = os.getenv("ZENDESK_CACHE_BACKEND", "memory").lower()
+
+# 디스크 캐시 디렉토리 (memory 백엔드 전용, 미설정 시 인메모리 캐시만 사용)
+CACHE_DIR = os.getenv("ZENDESK_CACHE_DIR")
+
+# 캐시 네임스페이스
+USERS = "users"
+TICKETS = "tickets"
+SEARCH = "search"
+AGGREGATES = "aggregates"
+HANDLES = "handles"
+TICKET_METRICS = "ticket_metrics"
+VALIDATORS = "validators"
+CURSORS = "cursors"
+INVALIDATION = "invalidation"
+
+
+# 캐시 갱신 모드 - 설정되면 캐시 조회를 건너뛰고 새로 계산한 값으로 덮어씀 (캐시 워밍용)
+_refreshing: ContextVar[bool] = ContextVar("cache_refreshing", default=False)
+
+
+@contextmanager
+def refreshing() -> Iterator[None]:
+    """블록 안의 캐시 조회를 건너뛰고 결과를 새로 계산해 저장"""
+    token = _refreshing.set(True)
+    try:
+        yield
+    finally:
+        _refreshing.reset(token)
+
+
+def is_refreshing() -> bool:
+    """캐시 갱신 모드 여부"""
+    return _refreshing.get()
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        namespace: 캐시 네임스페이스 (USERS, TICKETS, SEARCH, AGGREGATES, HANDLES, TICKET_METRICS,
+            VALIDATORS, CURSORS, INVALIDATION)
+        parts: 키 구성 요소
+
+    Returns:
+        "namespace:part1:part2" 형식의 키
+    """
+    return ":".join([namespace, *(str(part) for part in parts)])
+
+
+def invalidation_key(key: str) -> str:
+    """
+    캐시 항목의 무효화 요약 키
+
+    검색/집계 결과 옆에 Webhook이 무효화 여부를 판단할 작은 요약(쿼리, 티켓 ID, 집계 기간 등)을
+    따로 저장하여, 이벤트마다 결과 본문을 읽지 않도록 합니다.
+    """
+    return make_key(INVALIDATION, key)
+
+
+async def set_with_summary(
+    cache: "CacheBackend",
+    key: str,
+    value: Any,
+    summary: dict[str, Any],
+    ttl: int | None = None,
+) -> None:
+    """
+    캐시 항목과 무효화 요약을 같은 TTL로 함께 저장
+
+    Args:
+        cache: 캐시 인스턴스
+        key: 캐시 키
+        value: 저장할 값
+        summary: 무효화 판단용 요약 (원래 키는 "key"로 추가)
+        ttl: 만료 시간 (초, None이면 기본 TTL)
+    """
+    await cache.set_many({key: value, invalidation_key(key): {**summary, "key": key}}, ttl)
+
+
+def hash_query(query: str) -> str:
+    """검색 쿼리 문자열을 캐시 키용 해시로 변환"""
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()
+
+
+class CacheBackend:
+    """
+    캐시 백엔드 인터페이스
+
+    값은 JSON 직렬화 가능한 형태로 저장하며, 반환된 값을 직접 수정하지 않아야 합니다.
+    구현체는 get/set/delete/keys/clear/ttl과 키 단위 잠금(lock)을 제공합니다.
+    get_many/set_many는 기본적으로 키마다 get/set을 호출하며, 원격 백엔드는 한 번의 왕복으로
+    처리하도록 재정의합니다.
+    """
+
+    # 프로세스 메모리에 값을 보관하는지 (많은 키를 오래 보관하면 메모리를 차지함)
+    in_process = False
+
+    def __init__(self, default_ttl: int = DEFAULT_TTL_SECONDS):
+        self.default_ttl = default_ttl
+        # 키별 (잠금, 대기 중인 요청 수) - 같은 프로세스 내 중복 계산 방지
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    async def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def ttl(self, key: str) -> float | None:
+        """남은 만료 시간 (초, 없거나 만료되면 None)"""
+        raise NotImplementedError
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        여러 키 조회
+
+        Returns:
+            {키: 값} (없거나 만료된 키는 제외)
+        """
+        values = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def set_many(self, values: dict[str, Any], ttl: int | None = None) -> None:
+        """여러 키 저장 (같은 TTL)"""
+        for key, value in values.items():
+            await self.set(key, value, ttl)
+
+    async def keys(self, prefix: str = "") -> list[str]:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    @asynccontextmanager
+    async def lock(self, key: str, timeout: float | None = None) -> AsyncIterator[bool]:
+        """
+        키 단위 잠금 (프로세스 내)
+
+        timeout 안에 잠금을 얻지 못하면 잠금 없이 진행합니다.
+
+        Args:
+            key: 잠글 캐시 키
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Yields:
+            잠금 획득 여부
+        """
+        lock, waiters = self._locks.get(key, (asyncio.Lock(), 0))
+        self._locks[key] = (lock, waiters + 1)
+        try:
+            try:
+                await asyncio.wait_for(lock.acquire(), timeout)
+                acquired = True
+            except asyncio.TimeoutError:
+                acquired = False
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    lock.release()
+        finally:
+            lock, waiters = self._locks[key]
+            if waiters <= 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, waiters - 1)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        wait_timeout: float | None = None,
+    ) -> Any:
+        """
+        캐시 조회 후 없으면 계산하여 저장 (singleflight)
+
+        같은 키를 동시에 요청하면 하나만 compute를 실행하고, 나머지는 잠금이
+        풀린 뒤 저장된 값을 사용합니다. compute가 예외를 던지거나 None을 반환하면
+        저장하지 않습니다 (None이면 대기하던 요청도 각자 계산).
+        갱신 모드(refreshing)에서는 기존 값을 무시하고 항상 새로 계산합니다.
+
+        Args:
+            key: 캐시 키
+            compute: 값을 계산하는 비동기 함수
+            ttl: 만료 시간 (초, None이면 기본 TTL)
+            wait_timeout: 다른 요청의 계산을 기다리는 최대 시간 (초)
+
+        Returns:
+            캐시된 값 또는 새로 계산한 값
+        """
+        if not is_refreshing():
+            value = await self.get(key)
+            if value is not None:
+                return value
+
+        async with self.lock(key, wait_timeout):
+            # 잠금 대기 중 다른 요청(워커)이 먼저 계산했는지 확인
+            value = None if is_refreshing() else await self.get(key)
+            if value is not None:
+                return value
+
+            value = await compute()
+            if value is not None:
+                await self.set(key, value, ttl)
+            return value
+
+
+class TTLCache(CacheBackend):
+    """
+    인메모리 TTL 캐시 (프로세스 내)
+
+    max_entries를 넘으면 만료된 항목을 먼저 정리하고, 그래도 넘으면 가장 오래 사용하지
+    않은 항목부터 제거합니다 (LRU).
+    """
+
+    def __init__(self, default_ttl: int = DEFAULT_TTL_SECONDS, max_entries: int = MAX_ENTRIES):
+        """
+        Args:
+            default_ttl: 기본 TTL (초)
+            max_entries: 최대 항목 수 (0이면 제한 없음)
+        """
+        super().__init__(default_ttl)
+        self.in_process = True
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 (없거나 만료되면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 만료 시간 (초, None이면 기본 TTL)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if self.max_entries and len(self._entries) > self.max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        """만료된 항목 정리 후 여전히 넘치면 LRU 순으로 제거"""
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """캐시 삭제"""
+        self._entries.pop(key, None)
+
+    async def ttl(self, key: str) -> float | None:
+        """남은 만료 시간 (초, 없거나 만료되면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry[0] - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    async def keys(self, prefix: str = "") -> list[str]:
+        """
+        접두사로 유효한 키 목록 조회
+
+        Args:
+            prefix: 키 접두사 (예: "search:")
+
+        Returns:
+            만료되지 않은 키 목록
+        """
+        now = time.monotonic()
+        return [
+            key
+            for key, (expires_at, _) in list(self._entries.items())
+            if key.startswith(prefix) and expires_at > now
+        ]
+
+    async def clear(self) -> None:
+        """전체 캐시 삭제"""
+        self._entries.clear()
+
+
+class TieredCache(TTLCache):
+    """
+    인메모리 + 디스크 2단계 캐시
+
+    조회 시 메모리에 없으면 디스크에서 읽어 남은 TTL만큼 메모리에 올리고,
+    저장/삭제는 두 계층에 모두 반영합니다.
+    """
+
+    def __init__(self, disk: "DiskCache", default_ttl: int = DEFAULT_TTL_SECONDS):
+        super().__init__(default_ttl)
+        self.disk = disk
+
+    async def get(self, key: str) -> Any | None:
+        value = await super().get(key)
+        if value is not None:
+            return value
+
+        entry = await self.disk.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        remaining = int(expires_at - time.time())
+        if remaining > 0:
+            await super().set(key, value, remaining)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        await super().set(key, value, ttl)
+        await self.disk.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await super().delete(key)
+        await self.disk.delete(key)
+
+    async def ttl(self, key: str) -> float | None:
+        remaining = await super().ttl(key)
+        if remaining is not None:
+            return remaining
+        entry = await self.disk.get(key)
+        if entry is None:
+            return None
+        remaining = entry[1] - time.time()
+        return remaining if remaining > 0 else None
+
+    async def keys(self, prefix: str = "") -> list[str]:
+        memory_keys = await super().keys(prefix)
+        disk_keys = await self.disk.keys(prefix)
+        return list(dict.fromkeys([*memory_keys, *disk_keys]))
+
+    async def clear(self) -> None:
+        await super().clear()
+        await self.disk.clear()
+
+
+class NamespacedCache(CacheBackend):
+    """
+    다른 캐시 백엔드를 키 접두사로 분리해 쓰는 뷰 (테넌트별 캐시)
+
+    키 조회(keys)는 접두사를 뗀 키를 반환하므로 호출하는 쪽은 접두사를 알 필요가 없습니다.
+    """
+
+    def __init__(self, backend: CacheBackend, prefix: str):
+        super().__init__(backend.default_ttl)
+        self.backend = backend
+        self.prefix = prefix
+        self.in_process = backend.in_process
+
+    async def get(self, key: str) -> Any | None:
+        return await self.backend.get(self.prefix + key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        await self.backend.set(self.prefix + key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.backend.delete(self.prefix + key)
+
+    async def ttl(self, key: str) -> float | None:
+        return await self.backend.ttl(self.prefix + key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        offset = len(self.prefix)
+        values = await self.backend.get_many([self.prefix + key for key in keys])
+        return {key[offset:]: value for key, value in values.items()}
+
+    async def set_many(self, values: dict[str, Any], ttl: int | None = None) -> None:
+        await self.backend.set_many(
+            {self.prefix + key: value for key, value in values.items()}, ttl
+        )
+
+    async def keys(self, prefix: str = "") -> list[str]:
+        offset = len(self.prefix)
+        return [key[offset:] for key in await self.backend.keys(self.prefix + prefix)]
+
+    async def clear(self) -> None:
+        for key in await self.keys():
+            await self.delete(key)
+
+    @asynccontextmanager
+    async def lock(self, key: str, timeout: float | None = None) -> AsyncIterator[bool]:
+        async with self.backend.lock(self.prefix + key, timeout) as acquired:
+            yield acquired
+
+
+# 프로세스 단위 캐시 인스턴스
+_cache: CacheBackend | None = None
+
+
+def get_cache() -> CacheBackend:
+    """
+    공용 캐시 인스턴스 반환
+
+    디스크 DB와 Redis 연결은 첫 조회/저장 시점에 열립니다.
+
+    Raises:
+        ValueError: 알 수 없는 ZENDESK_CACHE_BACKEND 값
+    """
+    global _cache
+    if _cache is None:
+        if CACHE_BACKEND == "redis":
+            from src.services.redis_cache import RedisCache
+
+            _cache = RedisCache.from_env()
+        elif CACHE_BACKEND != "memory":
+            raise ValueError(
+                f"Unknown ZENDESK_CACHE_BACKEND: {CACHE_BACKEND!r} (expected memory or redis)"
+            )
+        elif CACHE_DIR:
+            from src.services.disk_cache import DiskCache
+
+            _cache = TieredCache(DiskCache(os.path.join(CACHE_DIR, "cache.sqlite3")))
+        else:
+            _cache = TTLCache()
+    return _cache
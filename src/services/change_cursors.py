@@ -0,0 +1,111 @@
+"""
+변경 조회 커서
+
+get_ticket_changes의 "마지막 조회 이후" 기준점을 구독 이름(없으면 MCP 세션/클라이언트)과
+조회 조건별로 캐시 백엔드에 보관합니다. redis 백엔드를 쓰면 워커/레플리카가 커서를 공유합니다.
+
+커서에는 지금까지 전달한 티켓의 최대 updated_at(워터마크)과 워터마크 직전 구간에서
+전달한 티켓 버전을 함께 저장합니다. 검색 색인 지연으로 늦게 잡히는 변경을 놓치지 않도록
+다음 조회는 이 구간(CHANGE_OVERLAP_SECONDS)을 겹쳐 검색하고, 이미 전달한 버전은 제외합니다.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from src.services.cache import CURSORS, CacheBackend, hash_query, make_key
+from src.utils.date_utils import parse_zendesk_datetime
+
+# 커서 보관 기간 (초, 마지막 조회 이후 이 기간 동안 조회가 없으면 처음부터 다시 시작)
+CHANGE_CURSOR_TTL_SECONDS = int(
+    os.getenv("ZENDESK_CHANGE_CURSOR_TTL_SECONDS", str(30 * 24 * 60 * 60))
+)
+
+# 워터마크 이전으로 겹쳐 검색하는 구간 (초, 검색 색인 지연 대비)
+CHANGE_OVERLAP_SECONDS = 300
+
+
+def cursor_key(owner: str, filters: dict[str, Any]) -> str:
+    """
+    커서 캐시 키
+
+    Args:
+        owner: 커서 소유자 ("subscription:이름", "session:ID", "client:토큰 해시")
+        filters: 조회 조건 (조건이 다르면 커서도 따로 보관)
+    """
+    encoded = json.dumps(filters, sort_keys=True, ensure_ascii=False)
+    return make_key(CURSORS, owner, hash_query(encoded))
+
+
+def format_search_datetime(value: datetime) -> str:
+    """검색 쿼리용 UTC 일시 (예: 2026-10-19T09:30:00Z)"""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ChangeCursor:
+    """조회 기준점 (워터마크 + 겹침 구간에서 전달한 티켓 버전)"""
+
+    def __init__(self, watermark: datetime, delivered: dict[str, str] | None = None):
+        """
+        Args:
+            watermark: 전달한 티켓의 최대 updated_at (처음이면 조회 시작 시각)
+            delivered: 겹침 구간에서 전달한 티켓 ID → updated_at 문자열
+        """
+        self.watermark = watermark
+        self.delivered = dict(delivered or {})
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ChangeCursor":
+        return cls(datetime.fromisoformat(data["watermark"]), data.get("delivered"))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"watermark": self.watermark.isoformat(), "delivered": self.delivered}
+
+    @property
+    def search_since(self) -> datetime:
+        """검색 시작 시각 (워터마크 - 겹침 구간)"""
+        return self.watermark - timedelta(seconds=CHANGE_OVERLAP_SECONDS)
+
+    def is_new(self, ticket: dict[str, Any]) -> bool:
+        """검색 구간 안의 아직 전달하지 않은 티켓 버전인지"""
+        updated_at = parse_zendesk_datetime(ticket.get("updated_at"))
+        if updated_at is None or updated_at <= self.search_since:
+            return False
+        return self.delivered.get(str(ticket.get("id"))) != ticket.get("updated_at")
+
+    def advance(self, tickets: list[dict[str, Any]], move_watermark: bool = True) -> None:
+        """
+        전달한 티켓 반영
+
+        Args:
+            tickets: 이번에 전달한 티켓 목록
+            move_watermark: 워터마크 이동 여부 (일부만 조회한 경우 False - 내보내기 결과는
+                수정일시 순이 아니므로 옮기면 받지 못한 변경을 건너뜀)
+        """
+        for ticket in tickets:
+            updated_at = parse_zendesk_datetime(ticket.get("updated_at"))
+            if updated_at is None:
+                continue
+            self.delivered[str(ticket.get("id"))] = ticket["updated_at"]
+            if move_watermark and updated_at > self.watermark:
+                self.watermark = updated_at
+
+        # 다음 검색 구간보다 오래된 버전은 다시 조회되지 않으므로 정리
+        since = self.search_since
+        self.delivered = {
+            ticket_id: updated_at
+            for ticket_id, updated_at in self.delivered.items()
+            if (parse_zendesk_datetime(updated_at) or since) > since
+        }
+
+
+async def load_cursor(cache: CacheBackend, key: str) -> ChangeCursor | None:
+    """저장된 커서 조회 (없거나 만료되면 None)"""
+    data = await cache.get(key)
+    return ChangeCursor.from_dict(data) if data is not None else None
+
+
+async def save_cursor(cache: CacheBackend, key: str, cursor: ChangeCursor) -> None:
+    """커서 저장 (조회할 때마다 보관 기간 연장)"""
+    await cache.set(key, cursor.to_dict(), CHANGE_CURSOR_TTL_SECONDS)
@@ -0,0 +1,240 @@
+"""
+디스크 캐시 서비스
+
+재시작/재배포 후에도 유지되는 SQLite 기반 캐시 계층.
+값은 zlib 압축 JSON으로 저장하고, 용량 상한을 넘으면 가장 오래 사용되지 않은 항목부터
+제거합니다(LRU). 키에는 스키마 버전이 포함되어 `src/models/schemas.py` 모델이 바뀌면
+이전 항목은 자동으로 무시/정리됩니다.
+
+전체 크기는 트리거로 meta 테이블에 누적하므로 저장할 때마다 테이블 전체를 합산하지 않습니다
+(같은 파일을 쓰는 여러 워커 프로세스 사이에서도 일치).
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.models import schemas
+
+# 캐시 포맷 버전 (저장 형식이 바뀌면 올림)
+CACHE_FORMAT_VERSION = 1
+
+# 디스크 캐시 기본 용량 상한 (MB)
+DEFAULT_MAX_MB = int(os.getenv("ZENDESK_CACHE_MAX_MB", "256"))
+
+# 용량 초과 시 이 비율까지 줄임
+EVICTION_TARGET_RATIO = 0.9
+
+
+def compute_schema_version() -> str:
+    """
+    캐시 키 버전 계산
+
+    schemas 모듈의 모든 Pydantic 모델 JSON 스키마와 캐시 포맷 버전을 해시합니다.
+
+    Returns:
+        12자리 버전 문자열
+    """
+    model_schemas = {
+        name: obj.model_json_schema()
+        for name, obj in sorted(vars(schemas).items())
+        if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel
+    }
+    payload = json.dumps(
+        {"format": CACHE_FORMAT_VERSION, "models": model_schemas},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+class DiskCache:
+    """
+    SQLite 기반 디스크 캐시 (압축, 용량 상한, LRU 제거)
+
+    DB 파일은 첫 사용 시점에 열며, SQLite 작업은 스레드에서 실행하여
+    이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._version: str | None = None
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (최초 호출 시 테이블 생성 및 다른 버전 항목 정리)"""
+        if self._conn is not None:
+            return self._conn
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)")
+
+        # 전체 항목 크기 (트리거로 갱신, 기존 DB는 처음 한 번만 합산)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (name, value)"
+                " SELECT 'total_size', COALESCE(SUM(size), 0) FROM entries"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_size_insert AFTER INSERT ON entries"
+                " BEGIN UPDATE meta SET value = value + NEW.size WHERE name = 'total_size'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_size_update AFTER UPDATE OF size ON entries"
+                " BEGIN UPDATE meta SET value = value - OLD.size + NEW.size"
+                " WHERE name = 'total_size'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_size_delete AFTER DELETE ON entries"
+                " BEGIN UPDATE meta SET value = value - OLD.size WHERE name = 'total_size'; END"
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+        self._version = compute_schema_version()
+        conn.execute(
+            "DELETE FROM entries WHERE substr(key, 1, ?) != ? OR expires_at <= ?",
+            (len(self._version) + 1, f"{self._version}:", time.time()),
+        )
+        self._conn = conn
+        return conn
+
+    def _versioned(self, key: str) -> str:
+        return f"{self._version}:{key}"
+
+    def _get(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?",
+                (self._versioned(key),),
+            ).fetchone()
+            if row is None:
+                return None
+
+            blob, expires_at = row
+            now = time.time()
+            if expires_at <= now:
+                conn.execute("DELETE FROM entries WHERE key = ?", (self._versioned(key),))
+                return None
+
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                (now, self._versioned(key)),
+            )
+        return json.loads(zlib.decompress(blob)), expires_at
+
+    def _set(self, key: str, value: Any, ttl: int) -> None:
+        blob = zlib.compress(
+            json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            # REPLACE는 삭제 트리거를 실행하지 않으므로 UPSERT로 갱신
+            conn.execute(
+                "INSERT INTO entries (key, value, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size,"
+                " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                (self._versioned(key), blob, len(blob), now + ttl, now),
+            )
+            self._evict(conn)
+
+    def _total_size(self, conn: sqlite3.Connection) -> int:
+        (total,) = conn.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()
+        return total
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """용량 상한 초과 시 만료 항목 → 오래 사용되지 않은 항목 순으로 제거"""
+        if self._total_size(conn) <= self.max_bytes:
+            return
+
+        conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        excess = self._total_size(conn) - int(self.max_bytes * EVICTION_TARGET_RATIO)
+
+        # 목표 크기까지 줄이는 데 필요한 만큼만 오래된 순으로 읽음
+        evicted = []
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed_at")
+        for key, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        rows.close()
+        conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM entries WHERE key = ?", (self._versioned(key),)
+            )
+
+    def _keys(self, prefix: str) -> list[str]:
+        with self._lock:
+            conn = self._connect()
+            versioned_prefix = self._versioned(prefix)
+            rows = conn.execute(
+                "SELECT key FROM entries WHERE substr(key, 1, ?) = ? AND expires_at > ?",
+                (len(versioned_prefix), versioned_prefix, time.time()),
+            ).fetchall()
+        offset = len(self._version) + 1
+        return [key[offset:] for (key,) in rows]
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (값, 만료 시각 epoch) 튜플 (없거나 만료되면 None)
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """캐시 저장 (ttl: 만료 시간, 초)"""
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        """캐시 삭제"""
+        await asyncio.to_thread(self._delete, key)
+
+    async def keys(self, prefix: str = "") -> list[str]:
+        """접두사로 유효한 키 목록 조회"""
+        return await asyncio.to_thread(self._keys, prefix)
+
+    async def clear(self) -> None:
+        """전체 캐시 삭제"""
+        await asyncio.to_thread(self._clear)
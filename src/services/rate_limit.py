@@ -0,0 +1,109 @@
+"""
+Zendesk API Rate Limit 상태 추적
+
+응답 헤더(X-Rate-Limit, X-Rate-Limit-Remaining)로 남은 호출 여유를 기록합니다.
+백그라운드 작업(캐시 워밍 등)은 여유가 적을 때 호출을 미루며, reserve_headroom 블록 안에서는
+요청(페이지)마다 여유를 확인해 기준 미만이면 HeadroomExhausted로 작업을 중단합니다.
+한도는 Zendesk 계정 단위이므로 상태는 테넌트별로 보관합니다 (Tenant.rate_limit).
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import httpx
+
+# 헤더 정보가 이 시간(초)보다 오래되면 분당 한도가 회복된 것으로 간주
+STALE_AFTER_SECONDS = 60.0
+
+# 현재 작업이 남겨 둬야 하는 최소 호출 여유 (None이면 제한 없음)
+_min_headroom: ContextVar[float | None] = ContextVar("min_headroom", default=None)
+
+
+class HeadroomExhausted(Exception):
+    """reserve_headroom 블록 안에서 호출 여유가 기준 미만으로 떨어짐"""
+
+    def __init__(self, headroom: float):
+        super().__init__(f"Rate limit headroom {headroom:.0%} below reserve")
+        self.headroom = headroom
+
+
+@contextmanager
+def reserve_headroom(min_headroom: float) -> Iterator[None]:
+    """
+    블록 안의 Zendesk 요청이 호출 여유를 min_headroom 미만으로 쓰지 않도록 제한
+
+    Args:
+        min_headroom: 남겨 둘 최소 호출 여유 비율 (0.0 ~ 1.0)
+    """
+    token = _min_headroom.set(min_headroom)
+    try:
+        yield
+    finally:
+        _min_headroom.reset(token)
+
+
+class RateLimitState:
+    """최근 응답 기준 Rate Limit 상태"""
+
+    def __init__(self):
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.updated_at: float | None = None
+
+    def update(self, headers: httpx.Headers) -> None:
+        """
+        응답 헤더로 상태 갱신
+
+        Args:
+            headers: Zendesk API 응답 헤더
+        """
+        limit = headers.get("X-Rate-Limit") or headers.get("ratelimit-limit")
+        remaining = headers.get("X-Rate-Limit-Remaining") or headers.get("ratelimit-remaining")
+        if limit is None or remaining is None:
+            return
+
+        try:
+            self.limit = int(limit)
+            self.remaining = int(remaining)
+        except ValueError:
+            return
+        self.updated_at = time.monotonic()
+
+    def consume(self, count: int = 1) -> None:
+        """
+        응답 헤더를 받기 전에 호출 여유 차감 (헤지 요청 등 추가 호출)
+
+        Args:
+            count: 차감할 호출 수
+        """
+        if self.remaining is not None:
+            self.remaining = max(0, self.remaining - count)
+
+    def headroom(self) -> float:
+        """
+        남은 호출 여유 비율 (0.0 ~ 1.0)
+
+        헤더를 받은 적이 없거나 정보가 오래되었으면 1.0을 반환합니다.
+        """
+        if (
+            self.limit is None
+            or self.remaining is None
+            or self.updated_at is None
+            or not self.limit
+            or time.monotonic() - self.updated_at > STALE_AFTER_SECONDS
+        ):
+            return 1.0
+        return max(0.0, min(1.0, self.remaining / self.limit))
+
+    def check_reserve(self) -> None:
+        """
+        reserve_headroom 블록 안이면 요청 전에 여유 확인
+
+        Raises:
+            HeadroomExhausted: 여유가 기준 미만인 경우
+        """
+        reserve = _min_headroom.get()
+        if reserve is not None and self.headroom() < reserve:
+            raise HeadroomExhausted(self.headroom())
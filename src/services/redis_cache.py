@@ -0,0 +1,245 @@
+"""
+Redis 캐시 백엔드
+
+여러 uvicorn 워커/레플리카가 하나의 캐시를 공유하도록 Redis 프로토콜 서버를 사용합니다.
+키 잠금은 `SET NX PX` 기반 분산 잠금으로, 워커 N개가 같은 검색을 동시에 요청해도
+Zendesk 스캔은 한 번만 실행됩니다.
+
+Redis에 연결할 수 없으면 오류를 로그로 남기고 캐시 없이 동작합니다 (조회는 미스, 저장은 무시,
+잠금은 획득 실패로 처리하여 각 요청이 직접 계산).
+
+`redis` 패키지가 필요합니다 (pip install "zendesk-mcp[redis]").
+테스트에서는 Redis 프로토콜 호환 클라이언트(예: fakeredis)를 직접 주입할 수 있습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from src.services.cache import DEFAULT_TTL_SECONDS, CacheBackend
+
+# Redis 키 접두사 (같은 Redis를 다른 서비스와 공유할 때 충돌 방지)
+KEY_PREFIX = os.getenv("ZENDESK_REDIS_PREFIX", "zendesk-mcp:")
+
+# 분산 잠금 자동 해제 시간 (초) - 잠금을 잡은 워커가 죽어도 풀리도록
+LOCK_TTL_SECONDS = int(os.getenv("ZENDESK_REDIS_LOCK_TTL_SECONDS", "60"))
+
+# 잠금 대기 중 재시도 간격 (초)
+LOCK_POLL_INTERVAL = 0.05
+
+# 잠금 해제 스크립트 - 소유자 토큰이 일치할 때만 삭제 (GET과 DEL 사이에 만료/재획득된 잠금 보호)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# 임대 획득/연장 스크립트 - 소유자면 만료 연장, 비어 있으면 획득
+HOLD_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+if redis.call("SET", KEYS[1], ARGV[1], "NX", "PX", ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # redis 패키지 없이 호환 클라이언트를 주입한 경우
+    RedisError = ConnectionError
+
+# Redis 장애로 보고 캐시 없이 진행할 오류
+REDIS_ERRORS = (RedisError, OSError, asyncio.TimeoutError)
+
+logger = logging.getLogger(__name__)
+
+
+def _decode(value: Any) -> str:
+    """Redis 응답(bytes/str)을 문자열로 변환"""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class RedisCache(CacheBackend):
+    """Redis 공유 캐시 백엔드"""
+
+    def __init__(
+        self,
+        client: Any,
+        default_ttl: int = DEFAULT_TTL_SECONDS,
+        prefix: str = KEY_PREFIX,
+    ):
+        """
+        Args:
+            client: redis.asyncio.Redis 호환 클라이언트
+            default_ttl: 기본 TTL (초)
+            prefix: Redis 키 접두사
+        """
+        super().__init__(default_ttl)
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_env(cls) -> "RedisCache":
+        """
+        ZENDESK_REDIS_URL 설정으로 인스턴스 생성
+
+        Raises:
+            ImportError: redis 패키지가 설치되지 않은 경우
+        """
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError(
+                "ZENDESK_CACHE_BACKEND=redis requires the 'redis' package. "
+                'Install it with: pip install "zendesk-mcp[redis]"'
+            ) from e
+
+        url = os.getenv("ZENDESK_REDIS_URL", "redis://localhost:6379/0")
+        return cls(Redis.from_url(url))
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            raw = await self.client.get(self._key(key))
+        except REDIS_ERRORS as e:
+            logger.warning("Redis GET failed for %s, treating as cache miss: %s", key, e)
+            return None
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        try:
+            await self.client.set(self._key(key), raw, ex=max(1, int(ttl)))
+        except REDIS_ERRORS as e:
+            logger.warning("Redis SET failed for %s, result not cached: %s", key, e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(self._key(key))
+        except REDIS_ERRORS as e:
+            logger.warning("Redis DEL failed for %s: %s", key, e)
+
+    async def ttl(self, key: str) -> float | None:
+        # PTTL: -2 = 키 없음, -1 = 만료 없음
+        try:
+            remaining = await self.client.pttl(self._key(key))
+        except REDIS_ERRORS as e:
+            logger.warning("Redis PTTL failed for %s: %s", key, e)
+            return None
+        return remaining / 1000 if remaining > 0 else None
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        if not keys:
+            return {}
+        try:
+            raws = await self.client.mget([self._key(key) for key in keys])
+        except REDIS_ERRORS as e:
+            logger.warning("Redis MGET failed for %d keys, treating as misses: %s", len(keys), e)
+            return {}
+        return {key: json.loads(raw) for key, raw in zip(keys, raws) if raw is not None}
+
+    async def set_many(self, values: dict[str, Any], ttl: int | None = None) -> None:
+        if not values:
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+                    pipe.set(self._key(key), raw, ex=max(1, int(ttl)))
+                await pipe.execute()
+        except REDIS_ERRORS as e:
+            logger.warning("Redis pipeline SET failed for %d keys: %s", len(values), e)
+
+    async def keys(self, prefix: str = "") -> list[str]:
+        # SCAN 패턴의 glob 특수문자 이스케이프
+        pattern = re.sub(r"([\[\]*?\\])", r"\\\1", self._key(prefix)) + "*"
+        offset = len(self.prefix)
+        keys = []
+        try:
+            async for raw_key in self.client.scan_iter(match=pattern):
+                keys.append(_decode(raw_key)[offset:])
+        except REDIS_ERRORS as e:
+            logger.warning("Redis SCAN failed for %s: %s", prefix, e)
+        return keys
+
+    async def clear(self) -> None:
+        for key in await self.keys():
+            await self.delete(key)
+
+    async def hold_lease(self, key: str, owner: str, ttl: float) -> bool:
+        """
+        만료 임대 획득 또는 연장 (워커 중 하나만 실행할 백그라운드 작업용)
+
+        Args:
+            key: 임대 키
+            owner: 소유자 토큰 (워커마다 고유)
+            ttl: 임대 유지 시간 (초, 이 시간 안에 다시 호출하지 않으면 다른 워커가 획득 가능)
+
+        Returns:
+            이 소유자가 임대를 보유하면 True (Redis에 연결할 수 없으면 False)
+        """
+        try:
+            held = await self.client.eval(
+                HOLD_LEASE_SCRIPT, 1, self._key(key), owner, max(1, int(ttl * 1000))
+            )
+        except REDIS_ERRORS as e:
+            logger.warning("Redis lease failed for %s: %s", key, e)
+            return False
+        return bool(held)
+
+    @asynccontextmanager
+    async def lock(self, key: str, timeout: float | None = None) -> AsyncIterator[bool]:
+        """
+        키 단위 분산 잠금 (워커/레플리카 간)
+
+        같은 프로세스 내 요청은 먼저 프로세스 잠금으로 줄을 세운 뒤 Redis 잠금을 시도합니다.
+        timeout 안에 잠금을 얻지 못하거나 Redis에 연결할 수 없으면 잠금 없이 진행합니다.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async with super().lock(key, timeout) as local_acquired:
+            if not local_acquired:
+                yield False
+                return
+
+            lock_key = self._key(f"lock:{key}")
+            token = uuid.uuid4().hex
+            acquired = False
+            while True:
+                try:
+                    acquired = bool(
+                        await self.client.set(lock_key, token, nx=True, px=LOCK_TTL_SECONDS * 1000)
+                    )
+                except REDIS_ERRORS as e:
+                    logger.warning("Redis lock failed for %s, continuing unlocked: %s", key, e)
+                    break
+                if acquired:
+                    break
+                if timeout is not None and loop.time() - started >= timeout:
+                    break
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+            try:
+                yield acquired
+            finally:
+                # 잠금 소유자일 때만 원자적으로 삭제 (실패하면 LOCK_TTL_SECONDS 후 자동 해제)
+                if acquired:
+                    try:
+                        await self.client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                    except REDIS_ERRORS as e:
+                        logger.warning("Redis lock release failed for %s: %s", key, e)
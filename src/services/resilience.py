@@ -0,0 +1,195 @@
+"""
+Zendesk API 꼬리 지연 대응 (헤지 요청, 서킷 브레이커)
+
+엔드포인트 종류(search, tickets, users)마다 응답 시간 분포를 추적하여
+
+- 헤지 요청: 응답이 최근 p95보다 늦어지면 같은 GET 요청을 한 번 더 보내고 먼저 온 응답을 사용
+  (멱등 GET만 대상, 전체 요청 대비 비율과 Rate Limit 여유 안에서만 발생)
+- 서킷 브레이커: 연속 실패(타임아웃, 연결 오류, 5xx)가 쌓이면 일정 시간 요청을 보내지 않고
+  즉시 실패하여, 호출하는 쪽이 캐시된 값으로 응답하게 함
+
+상태는 Zendesk 계정 단위이므로 테넌트별로 보관합니다 (Tenant.endpoint()).
+"""
+
+import os
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+from src.utils.deadline import DeadlineExceeded
+from src.utils.quantile_sketch import KLLSketch
+
+# 엔드포인트 종류
+SEARCH = "search"
+TICKETS = "tickets"
+USERS = "users"
+OTHER = "other"
+
+# 헤지 요청 활성화 여부
+HEDGE_ENABLED = os.getenv("ZENDESK_HEDGE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 헤지 지연 기준 분위 (이 분위보다 늦어진 요청을 헤지)
+HEDGE_PERCENTILE = float(os.getenv("ZENDESK_HEDGE_PERCENTILE", "0.95"))
+
+# 헤지 지연 하한 / 응답 시간 표본이 부족할 때의 헤지 지연 (초)
+HEDGE_MIN_DELAY_SECONDS = 0.5
+HEDGE_INITIAL_DELAY_SECONDS = 5.0
+
+# 분위 계산에 필요한 최소 표본 수
+HEDGE_MIN_SAMPLES = 20
+
+# 전체 요청 대비 헤지 요청 최대 비율
+HEDGE_BUDGET_RATIO = float(os.getenv("ZENDESK_HEDGE_BUDGET_RATIO", "0.1"))
+
+# 헤지를 허용할 최소 Rate Limit 여유 비율
+HEDGE_MIN_HEADROOM = 0.2
+
+# 응답 시간 표본 창 크기 (이 수만큼 쌓이면 이전 창을 버림)
+LATENCY_WINDOW = 500
+
+# 서킷을 여는 연속 실패 수
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("ZENDESK_BREAKER_FAILURE_THRESHOLD", "5"))
+
+# 서킷을 연 뒤 재시도(half-open)까지 대기 시간 (초)
+BREAKER_COOLDOWN_SECONDS = float(os.getenv("ZENDESK_BREAKER_COOLDOWN_SECONDS", "30"))
+
+# 시간 예산 때문에 끊긴 요청도 이 시간(초) 이상 응답이 없었으면 실패로 기록 (응답 정체)
+BREAKER_STALL_SECONDS = 10.0
+
+
+class CircuitOpenError(DeadlineExceeded):
+    """
+    서킷이 열려 요청을 보내지 않음
+
+    시간 예산 초과와 같이 다루어 도구는 수집된(또는 캐시된) 결과로 부분 응답합니다.
+    """
+
+    def __init__(self, endpoint: str, partial: list | None = None):
+        super().__init__(partial)
+        self.endpoint = endpoint
+        self.args = (f"Zendesk {endpoint} API is unavailable (circuit open)",)
+
+
+def endpoint_class(url: str) -> str:
+    """요청 URL의 엔드포인트 종류 (/api/v2/ 다음 경로 첫 부분)"""
+    path = urlparse(url).path
+    _, _, rest = path.partition("/api/v2/")
+    first = rest.split("/", 1)[0].removesuffix(".json")
+    return first if first in (SEARCH, TICKETS, USERS) else OTHER
+
+
+class LatencyTracker:
+    """최근 응답 시간 분포 (두 개의 KLL 스케치 창을 번갈아 사용)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._current = KLLSketch()
+        self._previous = KLLSketch()
+
+    def observe(self, seconds: float) -> None:
+        if self._current.count >= self.window:
+            self._previous, self._current = self._current, KLLSketch()
+        self._current.add(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """최근 두 창을 합친 분위수 (표본이 부족하면 None)"""
+        if self._current.count + self._previous.count < HEDGE_MIN_SAMPLES:
+            return None
+        merged = KLLSketch()
+        merged.merge(self._previous)
+        merged.merge(self._current)
+        return merged.quantile(q)
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        # 진행 중인 시험 요청 시작 시각 (취소되어 결과가 기록되지 않으면 대기 시간 후 다시 허용)
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 (half_open에서는 한 번에 하나의 시험 요청만 허용)"""
+        state = self.state
+        if state == "closed":
+            return True
+        now = time.monotonic()
+        if state == "half_open" and (
+            self._probe_started is None or now - self._probe_started >= self.cooldown
+        ):
+            self._probe_started = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_started = None
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            # 시험 요청 실패 시 대기 시간을 다시 시작
+            self.opened_at = time.monotonic()
+
+
+class EndpointGuard:
+    """엔드포인트 종류 하나의 응답 시간 분포, 헤지 예산, 서킷 브레이커"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self, headroom: float) -> float | None:
+        """
+        헤지 요청을 보낼 때까지의 대기 시간
+
+        Args:
+            headroom: 테넌트 Rate Limit 여유 비율
+
+        Returns:
+            대기 시간 (초, 헤지하지 않으면 None)
+        """
+        if not HEDGE_ENABLED or headroom < HEDGE_MIN_HEADROOM:
+            return None
+        if self.hedges >= self.requests * HEDGE_BUDGET_RATIO:
+            return None
+        delay = self.latency.quantile(HEDGE_PERCENTILE)
+        if delay is None:
+            return HEDGE_INITIAL_DELAY_SECONDS
+        return max(HEDGE_MIN_DELAY_SECONDS, delay)
+
+    def stats(self) -> dict[str, Any]:
+        """메트릭용 상태"""
+        p50 = self.latency.quantile(0.5)
+        p95 = self.latency.quantile(0.95)
+        return {
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "latency_p50_ms": round(p50 * 1000) if p50 is not None else None,
+            "latency_p95_ms": round(p95 * 1000) if p95 is not None else None,
+        }
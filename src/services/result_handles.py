@@ -0,0 +1,70 @@
+"""
+검색 결과 핸들
+
+그룹핑된 전체 검색 결과를 캐시에 짧은 기간 보관하고 핸들로 식별합니다.
+첫 응답에는 요약과 첫 페이지만 담고, 나머지는 fetch_search_page로 같은 검색을
+다시 실행하지 않고 페이지 단위로 조회합니다.
+"""
+
+import os
+import secrets
+from typing import Any
+
+from src.services.cache import HANDLES, CacheBackend, make_key
+
+# 검색 결과 핸들 유지 시간 (초)
+HANDLE_TTL_SECONDS = int(os.getenv("ZENDESK_SEARCH_HANDLE_TTL_SECONDS", "900"))
+
+# 페이지 크기 상한 (고객사 그룹 수 또는 티켓 수)
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(offset: int) -> str:
+    """페이지 시작 위치를 커서 문자열로 변환"""
+    return str(offset)
+
+
+def decode_cursor(cursor: str | None) -> int:
+    """
+    커서 문자열을 페이지 시작 위치로 변환
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    if not cursor:
+        return 0
+    if not cursor.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(cursor)
+
+
+def next_cursor(offset: int, page_size: int, total: int) -> str | None:
+    """다음 페이지 커서 (마지막 페이지이거나 커서가 앞으로 가지 않으면 None)"""
+    end = offset + page_size
+    return encode_cursor(end) if offset < end < total else None
+
+
+async def save_result(cache: CacheBackend, payload: dict[str, Any]) -> str:
+    """
+    검색 결과 저장
+
+    Args:
+        cache: 캐시 인스턴스
+        payload: JSON 직렬화 가능한 전체 검색 결과
+
+    Returns:
+        결과 핸들
+    """
+    handle = secrets.token_urlsafe(9)
+    await cache.set(make_key(HANDLES, handle), payload, HANDLE_TTL_SECONDS)
+    return handle
+
+
+async def load_result(cache: CacheBackend, handle: str) -> dict[str, Any] | None:
+    """
+    검색 결과 조회
+
+    Returns:
+        저장된 검색 결과 (만료되었거나 없으면 None)
+    """
+    return await cache.get(make_key(HANDLES, handle))
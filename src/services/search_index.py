@@ -0,0 +1,371 @@
+"""
+로컬 전문 검색 인덱스
+
+이미 조회한 티켓의 제목, 설명, 태그를 SQLite FTS5 인덱스에 저장하여
+키워드 OR 검색을 Zendesk 원격 검색 없이 처리합니다.
+
+- 한글은 글자 2-gram으로 색인하여 조사/어미가 붙은 형태("모니터링을")도 부분 일치로 검색
+- 영문/숫자는 단어 단위로 색인 (Zendesk 검색과 같은 단어 일치)
+- 기간 전체를 스캔한 경우(get_service_trends 등)에만 해당 기간을 "색인 완료"로 기록하고,
+  색인 이후 기간은 원격 검색으로 보완합니다.
+- 색인된 티켓의 상태/태그 변경은 Webhook으로만 반영되므로, Webhook 시크릿이 없는 테넌트의
+  색인 완료 기록은 검색 캐시 TTL(ZENDESK_CACHE_TTL_SECONDS) 동안만 사용합니다.
+- Webhook으로 티켓 생성 이벤트를 받으면 색인 완료 시점을 티켓 생성 시각 이전으로 당겨
+  새 티켓이 포함된 기간은 원격 검색으로 조회합니다.
+
+ZENDESK_SEARCH_INDEX_PATH를 설정하면 활성화됩니다.
+ZENDESK_TENANTS로 등록한 테넌트는 같은 경로에 테넌트 이름을 붙인 별도 DB를 사용합니다.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from src.services.cache import DEFAULT_TTL_SECONDS
+from src.services.tenants import current_tenant
+from src.utils.query_filters import COMPANY_FIELD_ID
+
+# 인덱스 DB 경로 (미설정 시 비활성화)
+SEARCH_INDEX_PATH = os.getenv("ZENDESK_SEARCH_INDEX_PATH")
+
+# 보관할 색인 완료 구간 수
+MAX_COVERAGE_ROWS = 20
+
+# 한글 음절/자모
+_HANGUL = "가-힣ㄱ-ㅎㅏ-ㅣ"
+_TOKEN_RE = re.compile(rf"[{_HANGUL}]+|[^\W_{_HANGUL}]+")
+_HANGUL_RE = re.compile(rf"[{_HANGUL}]")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """
+    색인/검색용 토큰 분리
+
+    한글 구간은 글자 2-gram(한 글자면 그대로), 그 외 구간은 단어 단위로 분리합니다.
+
+    Args:
+        text: 원문
+
+    Returns:
+        토큰 목록 (소문자)
+    """
+    tokens: list[str] = []
+    for run in _TOKEN_RE.findall((text or "").lower()):
+        if _HANGUL_RE.match(run) and len(run) > 1:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def normalize_tag(tag: str) -> str:
+    """태그 검색 형식으로 정규화 (search_tickets의 tags: 조건과 동일)"""
+    return tag.lower().replace(" ", "-")
+
+
+def _phrase(tokens: list[str]) -> str:
+    """토큰 목록을 FTS5 구문(phrase) 쿼리로 변환"""
+    if len(tokens) == 1 and _HANGUL_RE.match(tokens[0]) and len(tokens[0]) == 1:
+        # 한 글자 한글은 2-gram 접두사로 검색
+        return f'"{tokens[0]}" *'
+    return '"' + " ".join(token.replace('"', '""') for token in tokens) + '"'
+
+
+def build_match_query(keywords: list[str]) -> str | None:
+    """
+    키워드 OR 검색용 FTS5 MATCH 쿼리 생성
+
+    각 키워드는 태그 정확 일치 또는 제목/설명 구문 일치로 검색합니다.
+
+    Args:
+        keywords: 검색 키워드 목록
+
+    Returns:
+        MATCH 쿼리 문자열 (검색 가능한 토큰이 없으면 None)
+    """
+    clauses = []
+    for keyword in keywords:
+        tag = normalize_tag(keyword).replace('"', '""')
+        clauses.append(f'tags : "{tag}"')
+        tokens = tokenize(keyword)
+        if tokens:
+            clauses.append(f"{{subject description}} : {_phrase(tokens)}")
+    return " OR ".join(clauses) if clauses else None
+
+
+def _extract_company(ticket: dict[str, Any], company_field_id: str) -> str | None:
+    for field in ticket.get("custom_fields", []):
+        if str(field.get("id")) == company_field_id:
+            return field.get("value")
+    return None
+
+
+class SearchIndex:
+    """SQLite FTS5 기반 로컬 티켓 검색 인덱스"""
+
+    def __init__(
+        self,
+        path: str,
+        company_field_id: str = COMPANY_FIELD_ID,
+        coverage_ttl: int | None = None,
+    ):
+        """
+        Args:
+            path: 인덱스 DB 경로
+            company_field_id: 요청 회사 커스텀 필드 ID
+            coverage_ttl: 색인 완료 기록 유효 기간 (초, None이면 만료 없음)
+        """
+        self.path = path
+        self.company_field_id = company_field_id
+        self.coverage_ttl = coverage_ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tickets ("
+            " id INTEGER PRIMARY KEY,"
+            " created_at TEXT,"
+            " status TEXT,"
+            " company TEXT,"
+            " data BLOB NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tickets_created ON tickets(created_at)")
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5("
+            " subject, description, tags, tokenize=\"unicode61 tokenchars '-_'\")"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS coverage ("
+            " start_date TEXT NOT NULL,"
+            " until TEXT NOT NULL)"
+        )
+        self._conn = conn
+        return conn
+
+    def _upsert(self, conn: sqlite3.Connection, ticket: dict[str, Any]) -> None:
+        ticket_id = int(ticket["id"])
+        conn.execute(
+            "INSERT OR REPLACE INTO tickets (id, created_at, status, company, data)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                ticket_id,
+                ticket.get("created_at"),
+                ticket.get("status"),
+                _extract_company(ticket, self.company_field_id),
+                zlib.compress(json.dumps(ticket, ensure_ascii=False).encode("utf-8")),
+            ),
+        )
+        conn.execute("DELETE FROM tickets_fts WHERE rowid = ?", (ticket_id,))
+        conn.execute(
+            "INSERT INTO tickets_fts (rowid, subject, description, tags) VALUES (?, ?, ?, ?)",
+            (
+                ticket_id,
+                " ".join(tokenize(ticket.get("subject"))),
+                " ".join(tokenize(ticket.get("description"))),
+                " ".join(normalize_tag(tag) for tag in ticket.get("tags", [])),
+            ),
+        )
+
+    def _add_tickets(self, tickets: list[dict[str, Any]]) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                for ticket in tickets:
+                    if ticket.get("id"):
+                        self._upsert(conn, ticket)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _update_ticket(self, ticket_id: int, changes: dict[str, Any]) -> bool:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT data FROM tickets WHERE id = ?", (ticket_id,)).fetchone()
+            if row is None:
+                return False
+            ticket = {**json.loads(zlib.decompress(row[0])), **changes}
+            self._upsert(conn, ticket)
+        return True
+
+    def _mark_covered(self, start_date: str, until: datetime) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO coverage (start_date, until) VALUES (?, ?)",
+                (start_date, until.astimezone(timezone.utc).isoformat()),
+            )
+            conn.execute(
+                "DELETE FROM coverage WHERE rowid NOT IN"
+                " (SELECT rowid FROM coverage ORDER BY until DESC LIMIT ?)",
+                (MAX_COVERAGE_ROWS,),
+            )
+
+    def _covered_until(self, start_date: str) -> datetime | None:
+        sql = "SELECT MAX(until) FROM coverage WHERE start_date <= ?"
+        params: list[Any] = [start_date]
+        if self.coverage_ttl is not None:
+            # 유효 기간이 지난 기록은 색인 이후 변경이 반영되지 않았을 수 있으므로 무시
+            expires = datetime.now(timezone.utc) - timedelta(seconds=self.coverage_ttl)
+            sql += " AND until >= ?"
+            params.append(expires.isoformat())
+        with self._lock:
+            row = self._connect().execute(sql, params).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def _truncate_coverage(self, created_at: datetime) -> int:
+        until = created_at.astimezone(timezone.utc).isoformat()
+        with self._lock:
+            cursor = self._connect().execute(
+                "UPDATE coverage SET until = ? WHERE until > ?", (until, until)
+            )
+        return cursor.rowcount
+
+    def _search(
+        self,
+        match_query: str,
+        start_date: str,
+        status: str | None,
+        company: str | None,
+    ) -> list[dict[str, Any]]:
+        sql = (
+            "SELECT t.data FROM tickets_fts f JOIN tickets t ON t.id = f.rowid"
+            " WHERE tickets_fts MATCH ? AND t.created_at > ?"
+        )
+        params: list[Any] = [match_query, start_date]
+        if status:
+            sql += " AND t.status = ?"
+            params.append(status)
+        if company:
+            sql += " AND t.company = ?"
+            params.append(company)
+        sql += " ORDER BY bm25(tickets_fts)"
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [json.loads(zlib.decompress(data)) for (data,) in rows]
+
+    async def add_tickets(self, tickets: list[dict[str, Any]]) -> None:
+        """
+        티켓 색인 (이미 있으면 갱신)
+
+        Args:
+            tickets: Zendesk 검색 결과 티켓 목록
+        """
+        if tickets:
+            await asyncio.to_thread(self._add_tickets, tickets)
+
+    async def update_ticket(self, ticket_id: int, changes: dict[str, Any]) -> bool:
+        """
+        색인된 티켓에 변경 내용 반영 (Webhook 이벤트용)
+
+        Returns:
+            색인되어 있던 티켓이면 True
+        """
+        return await asyncio.to_thread(self._update_ticket, ticket_id, changes)
+
+    async def mark_covered(self, start_date: str, until: datetime) -> None:
+        """
+        기간 전체 스캔 완료 기록 (start_date 이후 ~ until 시점까지 생성된 티켓 색인 완료)
+
+        Args:
+            start_date: 스캔 시작일 (YYYY-MM-DD)
+            until: 스캔 시작 시각
+        """
+        await asyncio.to_thread(self._mark_covered, start_date, until)
+
+    async def covered_until(self, start_date: str) -> datetime | None:
+        """
+        start_date 이후 기간이 어느 시점까지 색인되었는지 조회
+
+        Returns:
+            색인 완료 시각 (해당 기간 색인 기록이 없으면 None)
+        """
+        return await asyncio.to_thread(self._covered_until, start_date)
+
+    async def truncate_coverage(self, created_at: datetime) -> int:
+        """
+        색인 이후 생성된 티켓 반영 (색인 완료 시점을 티켓 생성 시각으로 당김)
+
+        새 티켓은 색인에 없으므로 생성 시각 이후 기간은 원격 검색으로 조회하게 합니다.
+
+        Args:
+            created_at: 새 티켓 생성 시각
+
+        Returns:
+            조정한 색인 완료 기록 수
+        """
+        return await asyncio.to_thread(self._truncate_coverage, created_at)
+
+    async def search(
+        self,
+        keywords: list[str],
+        start_date: str,
+        status: str | None = None,
+        company: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        키워드 OR 검색 (관련도 순)
+
+        Args:
+            keywords: 검색 키워드 목록
+            start_date: 검색 시작일 (YYYY-MM-DD, 이후 생성된 티켓만)
+            status: 티켓 상태 필터
+            company: 고객사명 필터 (정확히 일치)
+
+        Returns:
+            티켓 목록 (관련도 내림차순)
+        """
+        match_query = build_match_query(keywords)
+        if match_query is None:
+            return []
+        return await asyncio.to_thread(self._search, match_query, start_date, status, company)
+
+
+def gap_start_date(covered_until: datetime, start_date: str) -> str:
+    """
+    색인 이후 원격 검색으로 보완할 기간의 시작일
+
+    날짜 단위 검색 경계에서 누락되지 않도록 하루 겹치게 잡습니다.
+    """
+    gap = (covered_until - timedelta(days=1)).strftime("%Y-%m-%d")
+    return max(gap, start_date)
+
+
+# 테넌트별 인덱스 인스턴스
+_indexes: dict[str, SearchIndex] = {}
+
+
+def get_search_index() -> SearchIndex | None:
+    """현재 테넌트의 로컬 검색 인덱스 반환 (ZENDESK_SEARCH_INDEX_PATH 미설정 시 None)"""
+    if not SEARCH_INDEX_PATH:
+        return None
+
+    tenant = current_tenant()
+    index = _indexes.get(tenant.name)
+    if index is None:
+        path = SEARCH_INDEX_PATH
+        if tenant.cache_prefix:
+            # 등록된 테넌트: search_index.sqlite3 → search_index.<tenant>.sqlite3
+            root, ext = os.path.splitext(SEARCH_INDEX_PATH)
+            path = f"{root}.{tenant.name}{ext}"
+        # Webhook이 없으면 색인된 티켓의 변경을 알 수 없으므로 색인 완료 기록을 캐시 TTL 동안만 사용
+        coverage_ttl = None if tenant.webhook_secret else DEFAULT_TTL_SECONDS
+        index = _indexes[tenant.name] = SearchIndex(
+            path, tenant.company_field_id, coverage_ttl
+        )
+    return index
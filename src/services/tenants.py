@@ -0,0 +1,354 @@
+"""
+테넌트(Zendesk 계정) 레지스트리
+
+하나의 서버에서 여러 Zendesk 서브도메인을 제공합니다.
+도구 호출은 X-Zendesk-Tenant 헤더 또는 Bearer 토큰으로 테넌트를 결정하며,
+테넌트마다 다음을 따로 가집니다.
+
+- HTTP 연결 풀: 한 테넌트의 대량 스캔이 다른 테넌트의 연결을 점유하지 않음
+- Rate Limit 상태: 캐시 워머가 테넌트별 여유를 기준으로 워밍
+- 엔드포인트별 응답 시간 분포와 서킷 브레이커: 한 계정의 장애가 다른 테넌트 요청을 막지 않음
+- 캐시 네임스페이스: 같은 캐시 백엔드를 키 접두사로 분리
+- 요청 회사 커스텀 필드 ID
+
+설정 (ZENDESK_TENANTS에 JSON 객체, 또는 ZENDESK_TENANTS_FILE에 JSON 파일 경로):
+
+    {
+      "acme": {
+        "subdomain": "acme",
+        "email": "bot@acme.com",
+        "api_token": "...",
+        "company_field_id": "360012345678",
+        "webhook_secret": "...",
+        "tokens": ["mcp-client-token"]
+      }
+    }
+
+미설정 시 기존 ZENDESK_* 환경변수로 단일 기본 테넌트를 구성합니다 (캐시 키 접두사 없음).
+
+테넌트가 둘 이상이면 모든 테넌트는 tokens에 있는 Bearer 토큰이 있어야 사용할 수 있습니다.
+헤더만으로 선택하려면 ZENDESK_ALLOW_TENANT_HEADER_ONLY=true로 명시적으로 허용합니다
+(신뢰할 수 있는 프록시 뒤에서만 사용).
+"""
+
+import asyncio
+import hmac
+import json
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+import httpx
+
+from src.services.cache import CacheBackend, NamespacedCache, get_cache
+from src.services.rate_limit import RateLimitState
+from src.services.resilience import EndpointGuard
+from src.utils.deadline import MAX_REQUEST_TIMEOUT
+from src.utils.query_filters import COMPANY_FIELD_ID
+
+# 테넌트 선택 헤더
+TENANT_HEADER = "X-Zendesk-Tenant"
+
+# 기본 테넌트 이름 (ZENDESK_TENANTS 미설정 시)
+DEFAULT_TENANT_NAME = "default"
+
+# 테넌트가 둘 이상일 때 tokens 없는 테넌트를 헤더/기본값만으로 선택 허용 (명시적 허용 필요)
+ALLOW_TENANT_HEADER_ONLY = (
+    os.getenv("ZENDESK_ALLOW_TENANT_HEADER_ONLY", "false").lower() in ("1", "true", "yes")
+)
+
+# 테넌트당 최대 동시 연결 수
+MAX_CONNECTIONS = int(os.getenv("ZENDESK_MAX_CONNECTIONS", "20"))
+
+
+class TenantError(Exception):
+    """테넌트를 결정할 수 없거나 접근이 거부된 경우"""
+
+
+class Tenant:
+    """Zendesk 계정 하나의 설정과 연결/캐시/Rate Limit 상태"""
+
+    def __init__(
+        self,
+        name: str,
+        subdomain: str | None,
+        email: str | None = None,
+        api_token: str | None = None,
+        oauth_access_token: str | None = None,
+        company_field_id: str = COMPANY_FIELD_ID,
+        webhook_secret: str | None = None,
+        tokens: list[str] | None = None,
+        max_connections: int = MAX_CONNECTIONS,
+        api_base_url: str | None = None,
+        cache_prefix: str | None = None,
+    ):
+        """
+        Args:
+            name: 테넌트 이름
+            subdomain: Zendesk 서브도메인
+            email: API 사용자 이메일
+            api_token: API 토큰
+            oauth_access_token: OAuth 액세스 토큰 (있으면 API 토큰보다 우선)
+            company_field_id: 요청 회사 커스텀 필드 ID
+            webhook_secret: Webhook 서명 시크릿
+            tokens: 이 테넌트를 사용할 수 있는 MCP 클라이언트 Bearer 토큰 목록
+            max_connections: 최대 동시 연결 수
+            api_base_url: API 기본 URL (None이면 https://{subdomain}.zendesk.com/api/v2)
+            cache_prefix: 캐시 키 접두사 (None이면 "tenant:{name}:")
+        """
+        self.name = name
+        self.subdomain = subdomain
+        self.email = email
+        self.api_token = api_token
+        self.oauth_access_token = oauth_access_token
+        self.company_field_id = str(company_field_id)
+        self.webhook_secret = webhook_secret
+        self.tokens = list(tokens or [])
+        self.max_connections = max_connections
+        self.api_base_url = api_base_url.rstrip("/") if api_base_url else None
+        self.cache_prefix = f"tenant:{name}:" if cache_prefix is None else cache_prefix
+
+        self.rate_limit = RateLimitState()
+        self.endpoints: dict[str, EndpointGuard] = {}
+        self._cache: CacheBackend | None = None
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def from_env(cls) -> "Tenant":
+        """기존 ZENDESK_* 환경변수로 기본 테넌트 생성"""
+        return cls(
+            name=DEFAULT_TENANT_NAME,
+            subdomain=os.getenv("ZENDESK_SUBDOMAIN"),
+            email=os.getenv("ZENDESK_EMAIL"),
+            api_token=os.getenv("ZENDESK_API_TOKEN"),
+            oauth_access_token=os.getenv("ZENDESK_OAUTH_ACCESS_TOKEN"),
+            webhook_secret=os.getenv("ZENDESK_WEBHOOK_SECRET") or None,
+            api_base_url=os.getenv("ZENDESK_API_BASE_URL") or None,
+            cache_prefix="",
+        )
+
+    @classmethod
+    def from_config(cls, name: str, config: dict[str, Any]) -> "Tenant":
+        """
+        ZENDESK_TENANTS 항목으로 테넌트 생성
+
+        Raises:
+            ValueError: 알 수 없는 설정 키
+        """
+        allowed = {
+            "subdomain",
+            "email",
+            "api_token",
+            "oauth_access_token",
+            "company_field_id",
+            "webhook_secret",
+            "tokens",
+            "max_connections",
+            "api_base_url",
+        }
+        unknown = set(config) - allowed
+        if unknown:
+            raise ValueError(f"Unknown settings for tenant {name!r}: {sorted(unknown)}")
+        return cls(name=name, **config)
+
+    @property
+    def cache(self) -> CacheBackend:
+        """테넌트 캐시 (공용 캐시 백엔드의 네임스페이스)"""
+        if self._cache is None:
+            backend = get_cache()
+            self._cache = (
+                NamespacedCache(backend, self.cache_prefix) if self.cache_prefix else backend
+            )
+        return self._cache
+
+    def endpoint(self, name: str) -> EndpointGuard:
+        """엔드포인트 종류(search, tickets, users)별 헤지/서킷 브레이커 상태"""
+        guard = self.endpoints.get(name)
+        if guard is None:
+            guard = self.endpoints[name] = EndpointGuard(name)
+        return guard
+
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        테넌트 연결 풀 반환
+
+        이벤트 루프마다 하나씩 생성합니다 (루프가 바뀌면 새 풀 생성).
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=MAX_REQUEST_TIMEOUT,
+            )
+            self._http_loop = loop
+        return self._http
+
+    def accepts(self, token: str | None) -> bool:
+        """MCP 클라이언트 토큰이 이 테넌트에 허용되는지 확인"""
+        if token is None:
+            return False
+        return any(hmac.compare_digest(token, allowed) for allowed in self.tokens)
+
+    async def aclose(self) -> None:
+        """연결 풀 종료"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._http_loop = None
+
+
+class TenantRegistry:
+    """테넌트 목록과 요청별 테넌트 결정"""
+
+    def __init__(
+        self,
+        tenants: list[Tenant],
+        default: str | None = None,
+        allow_header_only: bool = ALLOW_TENANT_HEADER_ONLY,
+    ):
+        """
+        Args:
+            tenants: 테넌트 목록
+            default: 헤더/토큰으로 테넌트를 지정하지 않은 요청의 테넌트 이름
+            allow_header_only: 테넌트가 둘 이상일 때 토큰 없이 헤더/기본값으로 선택 허용
+        """
+        self.tenants = {tenant.name: tenant for tenant in tenants}
+        if default is not None and default not in self.tenants:
+            raise ValueError(f"Unknown default tenant: {default!r}")
+        self.default = self.tenants.get(default) if default else None
+        self.allow_header_only = allow_header_only
+
+    @classmethod
+    def from_env(cls) -> "TenantRegistry":
+        """
+        ZENDESK_TENANTS / ZENDESK_TENANTS_FILE 설정으로 레지스트리 생성
+
+        기본 테넌트는 ZENDESK_DEFAULT_TENANT, 테넌트가 하나뿐이면 그 테넌트입니다.
+        """
+        raw = os.getenv("ZENDESK_TENANTS")
+        path = os.getenv("ZENDESK_TENANTS_FILE")
+        if not raw and path:
+            with open(path, encoding="utf-8") as f:
+                raw = f.read()
+        if not raw:
+            return cls([Tenant.from_env()], default=DEFAULT_TENANT_NAME)
+
+        tenants = [Tenant.from_config(name, config) for name, config in json.loads(raw).items()]
+        default = os.getenv("ZENDESK_DEFAULT_TENANT") or None
+        if default is None and len(tenants) == 1:
+            default = tenants[0].name
+        return cls(tenants, default=default)
+
+    def get(self, name: str) -> Tenant:
+        """
+        이름으로 테넌트 조회
+
+        Raises:
+            TenantError: 등록되지 않은 테넌트
+        """
+        tenant = self.tenants.get(name)
+        if tenant is None:
+            raise TenantError(f"Unknown tenant: {name}")
+        return tenant
+
+    def resolve(self, name: str | None = None, token: str | None = None) -> Tenant:
+        """
+        요청 헤더로 테넌트 결정
+
+        1. 테넌트 이름(X-Zendesk-Tenant)이 있으면 해당 테넌트
+        2. Bearer 토큰이 테넌트의 tokens에 있으면 해당 테넌트
+        3. 기본 테넌트
+
+        tokens가 설정된 테넌트는 일치하는 토큰이 있어야 사용할 수 있고, 테넌트가 둘 이상이면
+        allow_header_only가 아닌 한 모든 테넌트에 일치하는 토큰이 필요합니다 (헤더만으로
+        다른 계정의 데이터를 조회하지 못하도록).
+
+        Args:
+            name: 테넌트 이름
+            token: MCP 클라이언트 Bearer 토큰
+
+        Raises:
+            TenantError: 테넌트를 결정할 수 없거나 토큰이 맞지 않는 경우
+        """
+        if name:
+            tenant = self.get(name)
+        else:
+            tenant = next((t for t in self.tenants.values() if t.accepts(token)), self.default)
+            if tenant is None:
+                raise TenantError(f"No tenant selected. Set the {TENANT_HEADER} header.")
+
+        if tenant.accepts(token):
+            return tenant
+        if tenant.tokens:
+            raise TenantError(f"Access denied for tenant: {tenant.name}")
+        if len(self.tenants) > 1 and not self.allow_header_only:
+            raise TenantError(
+                f"Access denied for tenant: {tenant.name}. Multi-tenant servers require a "
+                "Bearer token listed in the tenant's tokens "
+                "(or set ZENDESK_ALLOW_TENANT_HEADER_ONLY=true)."
+            )
+        return tenant
+
+    def __iter__(self) -> Iterator[Tenant]:
+        return iter(self.tenants.values())
+
+    async def aclose(self) -> None:
+        """모든 테넌트의 연결 풀 종료"""
+        for tenant in self.tenants.values():
+            await tenant.aclose()
+
+
+def parse_bearer_token(authorization: str | None) -> str | None:
+    """Authorization 헤더에서 Bearer 토큰 추출"""
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    return token.strip() or None
+
+
+# 프로세스 단위 레지스트리
+_registry: TenantRegistry | None = None
+
+# 현재 요청의 테넌트
+_current_tenant: ContextVar[Tenant | None] = ContextVar("zendesk_tenant", default=None)
+
+
+def get_registry() -> TenantRegistry:
+    """공용 테넌트 레지스트리 반환"""
+    global _registry
+    if _registry is None:
+        _registry = TenantRegistry.from_env()
+    return _registry
+
+
+@contextmanager
+def use_tenant(tenant: Tenant) -> Iterator[Tenant]:
+    """블록 안의 Zendesk 호출/캐시를 지정한 테넌트로 실행"""
+    token = _current_tenant.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _current_tenant.reset(token)
+
+
+def current_tenant() -> Tenant:
+    """
+    현재 요청의 테넌트 (지정되지 않았으면 기본 테넌트)
+
+    Raises:
+        TenantError: 테넌트가 지정되지 않았고 기본 테넌트도 없는 경우
+    """
+    tenant = _current_tenant.get()
+    if tenant is not None:
+        return tenant
+    default = get_registry().default
+    if default is None:
+        raise TenantError(f"No tenant selected. Set the {TENANT_HEADER} header.")
+    return default
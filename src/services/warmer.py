@@ -0,0 +1,380 @@
+"""
+캐시 워머
+
+자주 호출되는 분석 쿼리(get_top_agents, get_service_trends, search_tickets)와
+설정된 워밍 쿼리를 캐시 만료 전에 미리 다시 계산합니다.
+
+- 인기도: 도구 호출 시 record_query로 기록, 시간이 지나면 점수가 절반씩 감소
+- 갱신 주기: 캐시 TTL의 일정 비율이 지나면 만료 전에 갱신
+- 호출 여유: Zendesk Rate Limit 여유가 적으면 워밍을 미루고 대기 시간을 늘림
+  (워밍 중에도 페이지마다 여유를 확인해 기준 미만이면 해당 쿼리를 중단)
+- 테넌트: 인기도는 테넌트별로 집계하고, 여유가 부족한 테넌트의 쿼리만 미룸
+  (설정 쿼리에 tenant가 없으면 모든 테넌트에 대해 워밍)
+- 선출: 워커/레플리카 중 하나만 워밍 (redis 백엔드는 만료 임대 키, memory 백엔드의
+  멀티 워커는 잠금 파일). 인기도는 워밍을 맡은 워커가 받은 호출 기준입니다.
+"""
+
+import asyncio
+import functools
+import importlib
+import inspect
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+import uuid
+from typing import IO, Any
+
+from pydantic.fields import FieldInfo
+
+from src.services.cache import DEFAULT_TTL_SECONDS, get_cache, is_refreshing, refreshing
+from src.services.rate_limit import HeadroomExhausted, reserve_headroom
+from src.services.redis_cache import RedisCache
+from src.services.tenants import current_tenant, get_registry, use_tenant
+
+logger = logging.getLogger(__name__)
+
+# 워머 활성화 여부
+WARMER_ENABLED = os.getenv("ZENDESK_WARMER_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# 워밍 점검 주기 (초)
+WARM_INTERVAL_SECONDS = int(os.getenv("ZENDESK_WARM_INTERVAL_SECONDS", "60"))
+
+# 인기 쿼리 중 워밍할 개수
+WARM_TOP_N = int(os.getenv("ZENDESK_WARM_TOP_N", "5"))
+
+# 이 비율 미만으로 Rate Limit 여유가 남으면 워밍 중단
+WARM_MIN_HEADROOM = float(os.getenv("ZENDESK_WARM_MIN_HEADROOM", "0.5"))
+
+# 캐시 TTL 대비 갱신 시점 비율 (0.8 → TTL의 80%가 지나면 갱신)
+REFRESH_AHEAD_RATIO = 0.8
+
+# 인기도 점수 반감기 (초) - 매일 아침 반복되는 질문을 유지할 수 있도록 하루
+POPULARITY_HALF_LIFE_SECONDS = 24 * 60 * 60
+
+# 인기도를 추적할 최대 쿼리 수
+MAX_TRACKED_QUERIES = 500
+
+# Rate Limit 여유 부족 시 최대 대기 시간 (초)
+MAX_BACKOFF_SECONDS = 15 * 60
+
+# 워머 선출 임대 키 (redis 백엔드)
+LEADER_KEY = "warmer:leader"
+
+# 워머 선출 잠금 파일 (memory 백엔드 멀티 워커, 같은 포트의 워커끼리 공유)
+LEADER_LOCK_FILE = os.path.join(
+    tempfile.gettempdir(), f"zendesk-mcp-warmer-{os.getenv('MCP_PORT', '8000')}.lock"
+)
+
+# 워밍 가능한 도구 (이름 → 모듈 경로)
+WARMABLE_TOOLS = {
+    "get_top_agents": "src.tools.get_top_agents",
+    "get_service_trends": "src.tools.get_service_trends",
+    "search_tickets": "src.tools.search_tickets",
+    "get_agent_response_times": "src.tools.get_agent_response_times",
+}
+
+# 인기도 집계에서 제외할 파라미터 (결과에 영향 없음)
+IGNORED_ARGS = {"deadline_seconds", "page_size", "ctx"}
+
+# ZENDESK_WARM_QUERIES 미설정 시 기본 워밍 쿼리 (대시보드성 질문)
+DEFAULT_WARM_QUERIES = [
+    {"tool": "get_top_agents", "args": {"period_days": 30}},
+    {"tool": "get_service_trends", "args": {"period_days": 90}},
+]
+
+
+def _get_tool(tool: str) -> Any:
+    """도구 이름으로 도구 함수 조회 (도구 모듈 import 순환을 피하기 위해 지연 import)"""
+    module = importlib.import_module(WARMABLE_TOOLS[tool])
+    return getattr(module, tool)
+
+
+@functools.cache
+def _tool_defaults(tool: str) -> dict[str, Any]:
+    """
+    도구 파라미터 기본값 (FastMCP용 Field 기본값 포함, 도구별로 한 번만 계산)
+
+    Returns:
+        {파라미터 이름: 기본값} (기본값이 없는 파라미터는 inspect.Parameter.empty)
+    """
+    defaults = {}
+    for name, param in inspect.signature(_get_tool(tool)).parameters.items():
+        if name == "ctx":
+            # FastMCP 등록 후에는 컨텍스트 주입 객체가 기본값이 되므로 워밍은 컨텍스트 없이 실행
+            defaults[name] = None
+        elif isinstance(param.default, FieldInfo):
+            defaults[name] = param.default.default
+        else:
+            defaults[name] = param.default
+    return defaults
+
+
+def _complete_args(tool: str, args: dict[str, Any]) -> dict[str, Any]:
+    """
+    빠진 파라미터를 도구 기본값으로 채움
+
+    도구 함수는 FastMCP용 Field 기본값을 가지므로 직접 호출하려면 모든 값을 넘겨야 하고,
+    같은 쿼리가 파라미터 생략 여부에 따라 다른 키로 집계되지 않도록 합니다.
+    """
+    return {
+        name: args[name] if name in args else default
+        for name, default in _tool_defaults(tool).items()
+        if name in args or default is not inspect.Parameter.empty
+    }
+
+
+def _query_key(tool: str, args: dict[str, Any], tenant: str) -> str:
+    """테넌트, 도구 이름과 (기본값을 채운) 파라미터로 쿼리 식별 키 생성"""
+    completed = {
+        k: v for k, v in _complete_args(tool, args).items() if k not in IGNORED_ARGS
+    }
+    return json.dumps(
+        {"tenant": tenant, "tool": tool, "args": completed},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+
+
+def load_warm_queries() -> list[dict[str, Any]]:
+    """
+    설정된 워밍 쿼리 목록 로드
+
+    ZENDESK_WARM_QUERIES에 JSON 배열로 지정합니다.
+    예: [{"tool": "search_tickets", "args": {"keywords": ["datadog"]}, "tenant": "acme"}]
+
+    Returns:
+        {"tool": 도구 이름, "args": 파라미터, "tenant": 테넌트 이름 (선택)} 목록
+        (JSON 형식이 잘못되었으면 오류를 기록하고 빈 목록)
+    """
+    raw = os.getenv("ZENDESK_WARM_QUERIES")
+    if raw is None:
+        return DEFAULT_WARM_QUERIES
+
+    try:
+        items = json.loads(raw)
+        if not isinstance(items, list):
+            raise ValueError("expected a JSON array")
+    except ValueError as e:
+        logger.error("Ignoring invalid ZENDESK_WARM_QUERIES (%s)", e)
+        return []
+
+    queries = []
+    for item in items:
+        if item.get("tool") not in WARMABLE_TOOLS:
+            logger.warning("Ignoring warm query for unknown tool: %s", item.get("tool"))
+            continue
+        query = {"tool": item["tool"], "args": item.get("args", {})}
+        if item.get("tenant"):
+            query["tenant"] = item["tenant"]
+        queries.append(query)
+    return queries
+
+
+class WarmerElection:
+    """
+    워머를 실행할 워커 선출
+
+    - redis 백엔드: SET NX PX 임대 키를 잡은 워커 (워밍 중 주기적으로 연장, 워커가 죽으면
+      임대 만료 후 다른 워커가 이어받음)
+    - memory 백엔드 + MCP_WORKERS > 1: 잠금 파일(flock)을 먼저 잡은 워커 (프로세스 종료 시 해제)
+    - 그 외 (단일 워커): 항상 실행
+    """
+
+    def __init__(self, lease_seconds: float):
+        """
+        Args:
+            lease_seconds: redis 임대 유지 시간 (초)
+        """
+        self.lease_seconds = lease_seconds
+        self.owner = uuid.uuid4().hex
+        self._lock_file: IO[str] | None = None
+
+    async def is_leader(self) -> bool:
+        """이 워커가 워머를 실행할지 (redis 백엔드는 호출할 때마다 임대 연장)"""
+        cache = get_cache()
+        if isinstance(cache, RedisCache):
+            return await cache.hold_lease(LEADER_KEY, self.owner, self.lease_seconds)
+        if int(os.getenv("MCP_WORKERS", "1")) <= 1:
+            return True
+        return self._hold_lock_file()
+
+    def _hold_lock_file(self) -> bool:
+        if self._lock_file is not None:
+            return True
+        try:
+            import fcntl
+        except ImportError:  # flock 미지원 플랫폼 (멀티 워커 미지원)
+            return True
+
+        lock_file = open(LEADER_LOCK_FILE, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+
+class CacheWarmer:
+    """인기/설정 쿼리 캐시 워머"""
+
+    def __init__(
+        self,
+        warm_queries: list[dict[str, Any]] | None = None,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        top_n: int = WARM_TOP_N,
+        min_headroom: float = WARM_MIN_HEADROOM,
+        interval: int = WARM_INTERVAL_SECONDS,
+    ):
+        # 설정 쿼리는 워머 실행 시 로드 (설정 오류가 도구 모듈 import를 막지 않도록)
+        self._warm_queries = warm_queries
+        self.refresh_after = ttl * REFRESH_AHEAD_RATIO
+        self.top_n = top_n
+        self.min_headroom = min_headroom
+        self.interval = interval
+        # 임대는 점검 주기보다 길게 (연장 전에 만료되어 두 워커가 동시에 워밍하지 않도록)
+        self.election = WarmerElection(lease_seconds=max(60, 3 * interval))
+
+        # 쿼리 키 → (인기도 점수, 마지막 갱신 시각)
+        self._popularity: dict[str, tuple[float, float]] = {}
+        # 쿼리 키 → 마지막 워밍 시각
+        self._last_warmed: dict[str, float] = {}
+        self._backoff = 0.0
+
+    @property
+    def warm_queries(self) -> list[dict[str, Any]]:
+        """설정된 워밍 쿼리 (처음 사용할 때 ZENDESK_WARM_QUERIES에서 로드)"""
+        if self._warm_queries is None:
+            self._warm_queries = load_warm_queries()
+        return self._warm_queries
+
+    def record(self, tool: str, args: dict[str, Any], tenant: str) -> None:
+        """
+        도구 호출 기록 (인기도 점수 +1, 기존 점수는 경과 시간만큼 감쇠)
+
+        Args:
+            tool: 도구 이름
+            args: 도구 파라미터
+            tenant: 테넌트 이름
+        """
+        if tool not in WARMABLE_TOOLS:
+            return
+
+        key = _query_key(tool, args, tenant)
+        now = time.time()
+        score, updated_at = self._popularity.get(key, (0.0, now))
+        decay = math.pow(0.5, (now - updated_at) / POPULARITY_HALF_LIFE_SECONDS)
+        self._popularity[key] = (score * decay + 1.0, now)
+
+        if len(self._popularity) > MAX_TRACKED_QUERIES:
+            coldest = min(self._popularity, key=lambda k: self._popularity[k][0])
+            del self._popularity[coldest]
+
+    def targets(self) -> list[str]:
+        """워밍 대상 쿼리 키 목록 (설정 쿼리 + 인기 상위 N개)"""
+        tenants = [tenant.name for tenant in get_registry()]
+        configured = [
+            _query_key(q["tool"], q["args"], tenant)
+            for q in self.warm_queries
+            for tenant in ([q["tenant"]] if "tenant" in q else tenants)
+        ]
+        popular = sorted(self._popularity, key=lambda k: self._popularity[k][0], reverse=True)
+        return list(dict.fromkeys([*configured, *popular[: self.top_n]]))
+
+    async def warm(self, query_key: str) -> None:
+        """
+        쿼리 하나를 캐시 갱신 모드로 다시 실행
+
+        Args:
+            query_key: _query_key로 만든 쿼리 식별 키
+        """
+        query = json.loads(query_key)
+        tool_fn = _get_tool(query["tool"])
+        tenant = get_registry().get(query["tenant"])
+
+        with use_tenant(tenant), refreshing(), reserve_headroom(self.min_headroom):
+            await tool_fn(**_complete_args(query["tool"], query["args"]))
+
+    async def run_once(self) -> int:
+        """
+        갱신 시점이 된 대상 쿼리를 워밍
+
+        Rate Limit 여유가 기준 미만인 테넌트의 남은 쿼리는 다음 주기로 미룹니다.
+        선출되지 않은 워커는 아무것도 하지 않습니다.
+
+        Returns:
+            워밍한 쿼리 수
+        """
+        if not await self.election.is_leader():
+            return 0
+
+        registry = get_registry()
+        warmed = 0
+        paused: set[str] = set()
+        for i, query_key in enumerate(self.targets()):
+            last = self._last_warmed.get(query_key)
+            if last is not None and time.time() - last < self.refresh_after:
+                continue
+            # 쿼리마다 임대 연장 (그 사이 다른 워커가 이어받았으면 중단)
+            if i and not await self.election.is_leader():
+                break
+
+            tenant = registry.tenants.get(json.loads(query_key)["tenant"])
+            if tenant is None or tenant.name in paused:
+                continue
+            if tenant.rate_limit.headroom() < self.min_headroom:
+                paused.add(tenant.name)
+                logger.info(
+                    "Cache warming paused for tenant %s (rate limit headroom %.0f%%)",
+                    tenant.name,
+                    tenant.rate_limit.headroom() * 100,
+                )
+                continue
+
+            try:
+                await self.warm(query_key)
+            except HeadroomExhausted as e:
+                # 워밍 도중 여유가 줄어든 쿼리는 갱신 시각을 남기지 않고 다음 주기에 재시도
+                paused.add(tenant.name)
+                logger.info("Cache warming paused for tenant %s mid-query (%s)", tenant.name, e)
+                continue
+            except Exception:
+                logger.exception("Cache warming failed: %s", query_key)
+            else:
+                warmed += 1
+            # 실패한 쿼리도 바로 재시도하지 않도록 갱신 시각 기록
+            self._last_warmed[query_key] = time.time()
+
+        if paused:
+            self._backoff = min(MAX_BACKOFF_SECONDS, max(self.interval, self._backoff * 2))
+            logger.info("Cache warming retry in %ds", self._backoff)
+        else:
+            self._backoff = 0.0
+        return warmed
+
+    async def run(self) -> None:
+        """워밍 루프 (서버 lifespan 동안 실행)"""
+        logger.info("Cache warmer started with %d configured queries", len(self.warm_queries))
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self._backoff or self.interval)
+
+
+# 프로세스 단위 워머 인스턴스
+warmer = CacheWarmer()
+
+
+def record_query(tool: str, args: dict[str, Any]) -> None:
+    """
+    현재 테넌트의 도구 호출을 인기도에 기록 (워밍 실행 중 호출은 제외)
+
+    Args:
+        tool: 도구 이름
+        args: 도구 파라미터
+    """
+    if not is_refreshing():
+        warmer.record(tool, args, current_tenant().name)
@@ -0,0 +1,312 @@
+"""
+Zendesk Webhook 처리
+
+서명 검증 후 티켓/사용자 변경 이벤트를 캐시에 반영합니다.
+
+- ticket 생성/수정: 해당 티켓을 포함하거나 쿼리 조건에 새로 맞을 수 있는 검색 결과 캐시 무효화
+  (status/priority/tags 조건이 티켓과 확실히 어긋나는 검색만 유지)
+- ticket 수정: 티켓 캐시를 변경 내용으로 갱신 (남은 TTL 유지), 로컬 검색 인덱스도 갱신
+- ticket 생성: 로컬 검색 인덱스의 색인 완료 시점을 티켓 생성 시각 이전으로 조정
+- user 수정: 사용자 캐시 갱신 (남은 TTL 유지)
+- 집계 결과: 이벤트 일자가 집계 기간에 포함되면 무효화
+
+검색/집계 결과는 함께 저장한 무효화 요약(invalidation_key)만 읽어 판단하므로, 캐시가 커져도
+이벤트마다 결과 본문을 읽거나 압축을 풀지 않습니다.
+"""
+
+import base64
+import hashlib
+import hmac
+import math
+import os
+from datetime import datetime, timezone
+from typing import Any
+
+from src.services.cache import (
+    AGGREGATES,
+    SEARCH,
+    TICKET_METRICS,
+    TICKETS,
+    USERS,
+    CacheBackend,
+    invalidation_key,
+    make_key,
+)
+from src.services.search_index import get_search_index
+from src.services.tenants import current_tenant
+from src.utils.date_utils import parse_zendesk_datetime
+
+# Zendesk Webhook 서명 헤더
+SIGNATURE_HEADER = "X-Zendesk-Webhook-Signature"
+TIMESTAMP_HEADER = "X-Zendesk-Webhook-Signature-Timestamp"
+
+# 서명 타임스탬프 허용 오차 (초, 0이면 검사하지 않음)
+SIGNATURE_TOLERANCE_SECONDS = int(os.getenv("ZENDESK_WEBHOOK_TOLERANCE_SECONDS", "300"))
+
+# 이벤트 본문(detail)에서 티켓 캐시로 반영할 필드
+TICKET_FIELDS = (
+    "subject",
+    "description",
+    "status",
+    "priority",
+    "tags",
+    "created_at",
+    "updated_at",
+    "assignee_id",
+    "requester_id",
+)
+
+# 이벤트 본문(detail)에서 사용자 캐시로 반영할 필드
+USER_FIELDS = ("name", "email", "role")
+
+# 검색 결과 유지 여부를 판단할 때 비교하는 쿼리 조건 (필드 → 티켓 필드)
+QUERY_FIELDS = {"status": "status", "priority": "priority", "tags": "tags", "tag": "tags"}
+
+
+def get_webhook_secret() -> str | None:
+    """현재 테넌트의 Webhook 서명 시크릿 반환 (미설정 시 None)"""
+    return current_tenant().webhook_secret
+
+
+def sign_payload(secret: str, timestamp: str, body: bytes) -> str:
+    """
+    Zendesk 방식으로 Webhook 본문 서명 생성
+
+    base64(HMAC-SHA256(secret, timestamp + body)) 형식이며,
+    로컬에서 서명된 페이로드를 재전송할 때도 사용합니다.
+
+    Args:
+        secret: Webhook 서명 시크릿
+        timestamp: 서명 타임스탬프 헤더 값
+        body: 요청 본문
+
+    Returns:
+        서명 문자열
+    """
+    digest = hmac.new(
+        secret.encode("utf-8"), timestamp.encode("utf-8") + body, hashlib.sha256
+    ).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def verify_signature(
+    secret: str, signature: str | None, timestamp: str | None, body: bytes
+) -> bool:
+    """
+    Webhook 서명 검증
+
+    Args:
+        secret: Webhook 서명 시크릿
+        signature: 서명 헤더 값
+        timestamp: 서명 타임스탬프 헤더 값
+        body: 요청 본문
+
+    Returns:
+        서명이 유효하고 타임스탬프가 허용 범위 내이면 True
+    """
+    if not signature or not timestamp:
+        return False
+
+    if SIGNATURE_TOLERANCE_SECONDS > 0:
+        signed_at = parse_zendesk_datetime(timestamp)
+        if signed_at is None:
+            return False
+        age = abs((datetime.now(timezone.utc) - signed_at).total_seconds())
+        if age > SIGNATURE_TOLERANCE_SECONDS:
+            return False
+
+    expected = sign_payload(secret, timestamp, body)
+    return hmac.compare_digest(expected, signature)
+
+
+def _event_name(payload: dict[str, Any]) -> str:
+    """이벤트 유형에서 접두사 제거 (예: "zen:event-type:ticket.created" → "ticket.created")"""
+    return str(payload.get("type", "")).rsplit(":", 1)[-1]
+
+
+def _normalize_detail(detail: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    """이벤트 detail을 REST API 응답 형식에 맞게 정리 (ID 정수화, 상태 소문자화)"""
+    normalized: dict[str, Any] = {}
+    for field in fields:
+        if field not in detail:
+            continue
+        value = detail[field]
+        if field.endswith("_id") and value is not None:
+            value = int(value)
+        elif field in ("status", "priority") and isinstance(value, str):
+            value = value.lower()
+        normalized[field] = value
+    return normalized
+
+
+def _event_date(value: str | None) -> str | None:
+    """이벤트 날짜 문자열을 집계 기간 비교용 YYYY-MM-DD로 변환"""
+    parsed = parse_zendesk_datetime(value)
+    return parsed.strftime("%Y-%m-%d") if parsed else None
+
+
+async def _patch(cache: CacheBackend, key: str, changes: dict[str, Any]) -> bool:
+    """
+    캐시된 값에 변경 내용 반영 (남은 TTL 유지 - 오래된 항목의 만료 시각을 늦추지 않음)
+
+    Returns:
+        캐시된 값이 있어 반영했으면 True
+    """
+    cached = await cache.get(key)
+    remaining = await cache.ttl(key) if cached is not None else None
+    if cached is None or remaining is None:
+        return False
+    await cache.set(key, {**cached, **changes}, math.ceil(remaining))
+    return True
+
+
+def _query_may_match(query: str, ticket: dict[str, Any]) -> bool:
+    """
+    검색 쿼리가 티켓과 일치할 수 있는지 (보수적 판단)
+
+    status/priority/tags 조건 중 티켓 값과 확실히 어긋나는 조건이 있을 때만 False를
+    반환합니다. 같은 필드의 긍정 조건은 하나만 맞아도 일치로 보고, 알 수 없는 조건이나
+    티켓에 없는 필드는 일치할 수 있는 것으로 봅니다.
+    """
+    matched: dict[str, bool] = {}
+    for term in query.split():
+        negated = term.startswith("-")
+        name, sep, value = term.lstrip("-").partition(":")
+        field = QUERY_FIELDS.get(name.lower())
+        if not sep or field is None or ticket.get(field) is None:
+            continue
+
+        value = value.strip('"').lower()
+        if field == "tags":
+            hit = value in {str(tag).lower() for tag in ticket[field]}
+        else:
+            hit = str(ticket[field]).lower() == value
+        if negated:
+            if hit:
+                return False
+        else:
+            matched[field] = matched.get(field, False) or hit
+    return all(matched.values())
+
+
+async def _summaries(cache: CacheBackend, namespace: str) -> list[dict[str, Any]]:
+    """네임스페이스 캐시 항목의 무효화 요약 목록 (결과 본문은 읽지 않음)"""
+    keys = await cache.keys(invalidation_key(f"{namespace}:"))
+    return list((await cache.get_many(keys)).values()) if keys else []
+
+
+async def _invalidate(cache: CacheBackend, key: str) -> None:
+    """캐시 항목과 무효화 요약 삭제"""
+    await cache.delete(key)
+    await cache.delete(invalidation_key(key))
+
+
+async def _invalidate_aggregates(
+    cache: CacheBackend,
+    ticket: dict[str, Any] | None = None,
+    user_id: int | None = None,
+) -> int:
+    """
+    이벤트에 영향을 받는 집계 결과 캐시 무효화
+
+    Args:
+        cache: 캐시 인스턴스
+        ticket: 변경된 티켓 필드 (집계 기준 일자가 기간 내이면 무효화)
+        user_id: 변경된 사용자 ID (집계 결과에 포함되어 있으면 무효화)
+
+    Returns:
+        무효화된 항목 수
+    """
+    invalidated = 0
+    for summary in await _summaries(cache, AGGREGATES):
+        affected = False
+        if ticket is not None:
+            event_day = _event_date(ticket.get(summary.get("date_field", "created_at")))
+            affected = event_day is None or event_day >= summary.get("window_start", "")
+        if user_id is not None and user_id in summary.get("user_ids", []):
+            affected = True
+
+        if affected:
+            await _invalidate(cache, summary["key"])
+            invalidated += 1
+    return invalidated
+
+
+async def _apply_ticket_event(
+    cache: CacheBackend, event: str, detail: dict[str, Any]
+) -> dict[str, int]:
+    """티켓 생성/수정 이벤트를 캐시에 반영"""
+    ticket_id = int(detail["id"])
+    changes = _normalize_detail(detail, TICKET_FIELDS)
+    stats = {"tickets": 0, "search_invalidated": 0}
+
+    # 티켓 상세 캐시 갱신 (커스텀 필드 등 이벤트에 없는 필드는 유지)
+    ticket_key = make_key(TICKETS, ticket_id)
+    ticket = {**(await cache.get(ticket_key) or {}), **changes}
+    if await _patch(cache, ticket_key, changes):
+        stats["tickets"] += 1
+
+    # 재오픈/재해결 시 응답·해결 시간이 바뀌므로 티켓 지표 캐시 삭제
+    await cache.delete(make_key(TICKET_METRICS, ticket_id))
+
+    # 검색 결과는 패치하지 않고 무효화 (변경 후 티켓이 쿼리 조건에 맞는지는 Zendesk만 판단 가능)
+    for summary in await _summaries(cache, SEARCH):
+        contains = ticket_id in summary.get("ids", [])
+        if contains or _query_may_match(summary.get("query", ""), ticket):
+            await _invalidate(cache, summary["key"])
+            stats["search_invalidated"] += 1
+
+    index = get_search_index()
+    if index and event == "ticket.created":
+        # 새 티켓은 색인에 없으므로 생성 시각 이후는 원격 검색으로 조회
+        created_at = parse_zendesk_datetime(changes.get("created_at"))
+        stats["coverage_truncated"] = await index.truncate_coverage(
+            created_at or datetime.now(timezone.utc)
+        )
+    elif index:
+        stats["indexed"] = int(await index.update_ticket(ticket_id, changes))
+
+    stats["aggregates_invalidated"] = await _invalidate_aggregates(cache, ticket=changes)
+    return stats
+
+
+async def _apply_user_event(cache: CacheBackend, detail: dict[str, Any]) -> dict[str, int]:
+    """사용자 수정 이벤트를 캐시에 반영"""
+    user_id = int(detail["id"])
+    changes = _normalize_detail(detail, USER_FIELDS)
+    stats = {"users": 0}
+
+    if await _patch(cache, make_key(USERS, user_id), changes):
+        stats["users"] += 1
+
+    stats["aggregates_invalidated"] = await _invalidate_aggregates(cache, user_id=user_id)
+    return stats
+
+
+async def apply_event(cache: CacheBackend, payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Zendesk 이벤트를 캐시에 반영
+
+    Args:
+        cache: 캐시 인스턴스
+        payload: Webhook 본문 (Zendesk 이벤트 형식)
+
+    Returns:
+        반영 결과 요약 (이벤트 유형, 갱신/무효화 건수)
+
+    Raises:
+        ValueError: 이벤트 본문에 대상 ID가 없는 경우
+    """
+    event = _event_name(payload)
+    detail = payload.get("detail") or {}
+    if "id" not in detail:
+        raise ValueError("Webhook payload has no detail.id")
+
+    if event.startswith("ticket."):
+        stats = await _apply_ticket_event(cache, event, detail)
+    elif event.startswith("user."):
+        stats = await _apply_user_event(cache, detail)
+    else:
+        return {"event": event, "ignored": True}
+
+    return {"event": event, **stats}
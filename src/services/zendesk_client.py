@@ -4,23 +4,132 @@ Zendesk API Client
 Zendesk API v2와 통신하는 비동기 HTTP 클라이언트
 """
 
+import asyncio
+import logging
 import os
-from typing import Any
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
 
+from src.services.cache import (
+    SEARCH,
+    TICKET_METRICS,
+    TICKETS,
+    USERS,
+    VALIDATORS,
+    hash_query,
+    invalidation_key,
+    make_key,
+)
+from src.services.resilience import (
+    BREAKER_STALL_SECONDS,
+    CircuitOpenError,
+    EndpointGuard,
+    endpoint_class,
+)
+from src.services.search_index import get_search_index
+from src.services.tenants import Tenant, current_tenant, get_registry
+from src.utils.date_utils import parse_zendesk_datetime
+from src.utils.deadline import MAX_REQUEST_TIMEOUT, Deadline, DeadlineExceeded
+from src.utils.spill import MemoryBudget, TicketSpool
+
+logger = logging.getLogger(__name__)
+
+# 연결 미리 열기 요청의 시간 예산 (초)
+PREWARM_TIMEOUT_SECONDS = 5.0
+
+# show_many API 한 번에 조회할 수 있는 최대 ID 수
+SHOW_MANY_LIMIT = 100
+
+# 검색 내보내기(export) 페이지 크기 (API 최대값)
+EXPORT_PAGE_SIZE = 1000
+
+# 티켓 지표 일괄 조회 동시 요청 수 (테넌트 Rate Limit 보호)
+METRICS_CONCURRENCY = int(os.getenv("ZENDESK_METRICS_CONCURRENCY", "4"))
+
+# 해결된 티켓 지표 캐시 TTL (초, 공유 캐시 백엔드 전용) - 해결 후에는 거의 변하지 않고
+# 재오픈은 Webhook으로 무효화
+METRICS_TTL_SECONDS = int(os.getenv("ZENDESK_METRICS_TTL_SECONDS", str(24 * 60 * 60)))
+
+# 조건부 요청 검증자(ETag/updated_at) 보관 기간 (초) - 캐시 만료 후에도 304로 재사용
+VALIDATOR_TTL_SECONDS = int(
+    os.getenv("ZENDESK_VALIDATOR_TTL_SECONDS", str(7 * 24 * 60 * 60))
+)
+
+# Zendesk 장애 시 대신 응답할 마지막 검색 결과 보관 기간 (초)
+STALE_SEARCH_TTL_SECONDS = int(os.getenv("ZENDESK_STALE_SEARCH_TTL_SECONDS", "3600"))
+
+# Retry-After 헤더가 없거나 해석할 수 없을 때의 재시도 대기 시간 (초, 시도마다 2배, 상한)
+RETRY_BACKOFF_SECONDS = 1.0
+RETRY_BACKOFF_MAX_SECONDS = 30.0
+
+
+def _retry_after_seconds(value: str | None, attempt: int) -> float:
+    """
+    429 응답의 재시도 대기 시간
+
+    Args:
+        value: Retry-After 헤더 (초 또는 HTTP 날짜)
+        attempt: 이번 요청의 재시도 횟수 (0부터)
+
+    Returns:
+        대기 시간 (초, 헤더를 해석할 수 없으면 지수 백오프)
+    """
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is not None:
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    return min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_SECONDS * 2**attempt)
+
+
+def _is_degraded(error: Exception) -> bool:
+    """Zendesk 장애로 볼 오류인지 (서킷 열림, 연결/타임아웃 오류, 5xx)"""
+    if isinstance(error, (CircuitOpenError, httpx.TransportError)):
+        return True
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code >= 500
+
+
+def _conditional_headers(validator: dict[str, Any] | None) -> dict[str, str]:
+    """검증자로 조건부 요청 헤더 구성 (ETag 우선, 없으면 updated_at)"""
+    if not validator:
+        return {}
+    if validator.get("etag"):
+        return {"If-None-Match": validator["etag"]}
+    updated_at = parse_zendesk_datetime(validator.get("updated_at"))
+    if updated_at:
+        modified = format_datetime(updated_at.astimezone(timezone.utc), usegmt=True)
+        return {"If-Modified-Since": modified}
+    return {}
+
 
 class ZendeskClient:
     """Zendesk API v2 클라이언트"""
 
-    # 요청 회사 커스텀 필드 ID
-    COMPANY_FIELD_ID = "360028549453"
-
-    def __init__(self):
-        self.subdomain = os.getenv("ZENDESK_SUBDOMAIN")
-        self.email = os.getenv("ZENDESK_EMAIL")
-        self.api_token = os.getenv("ZENDESK_API_TOKEN")
-        self.oauth_access_token = os.getenv("ZENDESK_OAUTH_ACCESS_TOKEN")
+    def __init__(self, tenant: Tenant | None = None):
+        """
+        Args:
+            tenant: 대상 테넌트 (None이면 현재 요청의 테넌트)
+        """
+        self.tenant = tenant or current_tenant()
+        self.subdomain = self.tenant.subdomain
+        self.email = self.tenant.email
+        self.api_token = self.tenant.api_token
+        self.oauth_access_token = self.tenant.oauth_access_token
+        # 요청 회사 커스텀 필드 ID
+        self.company_field_id = self.tenant.company_field_id
 
         # OAuth 액세스 토큰이 있으면 우선 사용, 없으면 API 토큰 사용
         self.use_oauth = bool(self.oauth_access_token)
@@ -37,7 +146,8 @@ class ZendeskClient:
                 "Missing Zendesk subdomain. Please set ZENDESK_SUBDOMAIN."
             )
 
-        self.base_url = f"https://{self.subdomain}.zendesk.com/api/v2"
+        self.base_url = self.tenant.api_base_url or f"https://{self.subdomain}.zendesk.com/api/v2"
+        self.cache = self.tenant.cache
 
     def _get_auth(self) -> tuple[str, str] | None:
         """API Token 인증 정보 반환 (OAuth 사용 시 None)"""
@@ -51,88 +161,596 @@ class ZendeskClient:
             return {"Authorization": f"Bearer {self.oauth_access_token}"}
         return {}
 
-    async def search_tickets(self, query: str) -> list[dict[str, Any]]:
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        GET 요청 전송 (인증, 타임아웃, 데드라인, Rate Limit 재시도)
+
+        Args:
+            client: httpx 비동기 클라이언트 (테넌트 연결 풀)
+            url: 요청 URL
+            params: 쿼리 파라미터
+            deadline: 시간 예산 (None이면 기본 타임아웃만 적용)
+            headers: 추가 요청 헤더 (조건부 요청 등)
+
+        Returns:
+            응답 (상태 코드 검사 전, 본문 미해석)
+
+        Raises:
+            DeadlineExceeded: 요청 전 또는 요청 중 시간 예산이 소진된 경우
+            CircuitOpenError: 엔드포인트 서킷이 열려 요청을 보내지 않은 경우
         """
-        티켓 검색 API 호출
+        attempt = 0
+        while True:
+            response = await self._send_once(client, url, params, deadline, headers)
+            if response.status_code != 429 or not deadline:
+                return response
+
+            # Rate Limit 초과: Retry-After 만큼 기다려도 시간 예산 안이면 재시도
+            retry_after = _retry_after_seconds(response.headers.get("Retry-After"), attempt)
+            if retry_after >= deadline.remaining():
+                return response
+            await asyncio.sleep(retry_after)
+            attempt += 1
+
+    async def _send_once(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict[str, Any] | None,
+        deadline: Deadline | None,
+        headers: dict[str, str] | None,
+    ) -> httpx.Response:
+        """GET 요청 한 번 전송 (서킷 브레이커, 헤지, Rate Limit 상태 갱신)"""
+        if deadline and deadline.expired:
+            raise DeadlineExceeded()
+        # 캐시 워밍 등 백그라운드 작업은 페이지마다 호출 여유 확인
+        self.tenant.rate_limit.check_reserve()
+
+        guard = self.tenant.endpoint(endpoint_class(url))
+        if not guard.breaker.allow():
+            raise CircuitOpenError(guard.name)
+        guard.requests += 1
+
+        send = partial(
+            client.get,
+            url,
+            params=params,
+            auth=self._get_auth(),
+            headers={**self._get_headers(), **(headers or {})},
+        )
+        started = time.monotonic()
+        try:
+            response = await self._send_hedged(guard, send, deadline)
+        except httpx.TimeoutException:
+            # 시간 예산이 짧아 끊긴 요청은 Zendesk 장애로 보지 않음
+            budget_cut = deadline is not None and deadline.expired
+            if not budget_cut or time.monotonic() - started >= BREAKER_STALL_SECONDS:
+                guard.breaker.record_failure()
+            if budget_cut:
+                raise DeadlineExceeded() from None
+            raise
+        except httpx.TransportError:
+            guard.breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            guard.breaker.record_failure()
+        else:
+            guard.breaker.record_success()
+        self.tenant.rate_limit.update(response.headers)
+        return response
+
+    async def _send_hedged(
+        self,
+        guard: EndpointGuard,
+        send: Callable[..., Awaitable[httpx.Response]],
+        deadline: Deadline | None,
+    ) -> httpx.Response:
+        """
+        헤지 GET 요청
+
+        응답이 엔드포인트의 최근 p95 지연보다 늦어지면 같은 요청을 한 번 더 보내고,
+        먼저 성공한 응답을 사용합니다 (나머지 요청은 취소). 헤지 요청은 테넌트 Rate Limit
+        여유에서 차감하며, 여유가 적거나 헤지 비율 예산을 넘으면 보내지 않습니다.
+
+        Args:
+            guard: 엔드포인트 상태
+            send: timeout 인자를 받아 요청을 보내는 함수
+            deadline: 시간 예산
+
+        Returns:
+            먼저 성공한 응답 (모두 실패하면 마지막 오류 발생)
+        """
+
+        def timeout() -> float:
+            return deadline.timeout() if deadline else MAX_REQUEST_TIMEOUT
+
+        started = time.monotonic()
+        primary = asyncio.create_task(send(timeout=timeout()))
+        tasks = {primary}
+        try:
+            delay = guard.hedge_delay(self.tenant.rate_limit.headroom())
+            if delay is not None and (deadline is None or delay < deadline.remaining()):
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    guard.hedges += 1
+                    self.tenant.rate_limit.consume()
+                    tasks.add(asyncio.create_task(send(timeout=timeout())))
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded or not pending:
+                    winner = succeeded[0] if succeeded else done.pop()
+                    break
+
+            response = winner.result()
+            if winner is not primary:
+                guard.hedge_wins += 1
+            guard.latency.observe(time.monotonic() - started)
+            return response
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """
+        GET 요청 공통 처리
+
+        Args:
+            client: httpx 비동기 클라이언트 (테넌트 연결 풀)
+            url: 요청 URL
+            params: 쿼리 파라미터
+            deadline: 시간 예산 (None이면 기본 타임아웃만 적용)
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            DeadlineExceeded: 요청 전 또는 요청 중 시간 예산이 소진된 경우
+        """
+        response = await self._send(client, url, params, deadline)
+        response.raise_for_status()
+        return response.json()
+
+    async def _get_revalidated(
+        self,
+        url: str,
+        validator_key: str,
+        extract: Callable[[dict[str, Any]], Any],
+        params: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        """
+        검증자를 이용한 조건부 GET
+
+        이전 응답의 ETag(없으면 updated_at)를 If-None-Match(If-Modified-Since)로 보내고,
+        304 응답이면 본문을 받거나 해석하지 않고 보관해 둔 값을 그대로 사용합니다.
+        검증자는 일반 캐시보다 오래(VALIDATOR_TTL_SECONDS) 보관되어 캐시 만료 후 재조회에 쓰이고,
+        Zendesk 장애(서킷 열림, 연결 오류, 5xx) 중에는 보관 값을 그대로 반환합니다.
+
+        Args:
+            url: 요청 URL
+            validator_key: 검증자 캐시 키
+            extract: 응답 JSON에서 보관할 값을 꺼내는 함수
+            params: 쿼리 파라미터
+            deadline: 시간 예산
+
+        Returns:
+            최신 값 (보관 값 또는 새로 받은 값)
+
+        Raises:
+            DeadlineExceeded: 시간 예산 소진
+        """
+        validator = await self.cache.get(validator_key)
+        try:
+            response = await self._send(
+                self.tenant.http_client(),
+                url,
+                params,
+                deadline,
+                headers=_conditional_headers(validator),
+            )
+            if response.status_code != 304 or not validator:
+                response.raise_for_status()
+        except Exception as e:
+            if validator and _is_degraded(e):
+                logger.warning("Serving stale %s (%s)", validator_key, e)
+                return validator["value"]
+            raise
+
+        if response.status_code == 304 and validator:
+            value = validator["value"]
+            etag = response.headers.get("ETag") or validator.get("etag")
+        else:
+            value = extract(response.json())
+            etag = response.headers.get("ETag")
+
+        updated_at = value.get("updated_at") if isinstance(value, dict) else None
+        await self.cache.set(
+            validator_key,
+            {"etag": etag, "updated_at": updated_at, "value": value},
+            VALIDATOR_TTL_SECONDS,
+        )
+        return value
+
+    async def prewarm(self) -> dict[str, Any]:
+        """
+        연결 미리 열기 (DNS 조회, TLS 핸드셰이크, 인증 확인)
+
+        테넌트 연결 풀에 연결을 만들어 두어 첫 도구 호출이 연결 수립 비용을 치르지 않게 하고,
+        Rate Limit 상태도 함께 갱신합니다.
+
+        Returns:
+            API 사용자 정보
+        """
+        data = await self._get(
+            self.tenant.http_client(),
+            f"{self.base_url}/users/me.json",
+            deadline=Deadline(PREWARM_TIMEOUT_SECONDS),
+        )
+        return data.get("user", {})
+
+    async def search_tickets(
+        self,
+        query: str,
+        deadline: Deadline | None = None,
+        mirror_since: str | None = None,
+        on_page: Callable[[list[dict[str, Any]]], Awaitable[None]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        티켓 검색 API 호출 (결과 전체를 목록으로 반환)
+
+        결과를 모두 메모리에 올리므로 기간이 긴 스캔은 scan_tickets를 사용합니다.
 
         Args:
             query: Zendesk 검색 쿼리 문자열
+            deadline: 시간 예산
+            mirror_since: scan_tickets 참고
+            on_page: 페이지를 받을 때마다 호출할 콜백 (진행 알림용, 캐시된 결과는 한 번에 전달)
 
         Returns:
             검색된 티켓 목록
+
+        Raises:
+            DeadlineExceeded: 시간 예산 소진 또는 Zendesk 장애 (partial에 수집된/마지막 결과 목록)
         """
-        all_results = []
-        url = f"{self.base_url}/search.json"
-        params = {"query": query}
+        try:
+            spool = await self.scan_tickets(query, deadline, mirror_since, on_page)
+        except DeadlineExceeded as e:
+            spool = e.partial
+            e.partial = await spool.to_list()
+            spool.close()
+            raise
+        try:
+            return await spool.to_list()
+        finally:
+            spool.close()
+
+    async def scan_tickets(
+        self,
+        query: str,
+        deadline: Deadline | None = None,
+        mirror_since: str | None = None,
+        on_page: Callable[[list[dict[str, Any]]], Awaitable[None]] | None = None,
+        budget: MemoryBudget | None = None,
+    ) -> TicketSpool:
+        """
+        티켓 검색 API 호출 (결과를 메모리 예산 안에서 보관)
 
-        async with httpx.AsyncClient() as client:
-            while url:
-                response = await client.get(
-                    url,
-                    params=params if "search.json" in url else None,
-                    auth=self._get_auth(),
-                    headers=self._get_headers(),
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+        로컬 검색 인덱스가 활성화되어 있으면 수집한 티켓을 색인합니다.
+        결과가 메모리 예산을 넘으면 임시 파일로 옮기며, 이 경우 검색 결과 캐시에 저장하지 않습니다.
+
+        Args:
+            query: Zendesk 검색 쿼리 문자열
+            deadline: 시간 예산
+            mirror_since: 이 쿼리가 해당 일자 이후 생성된 (제외 조건 외) 모든 티켓을
+                조회하는 경우 그 시작일 (YYYY-MM-DD). 전체 결과 수만큼 받았으면
+                로컬 인덱스에 색인 완료 기간으로 기록
+            on_page: 페이지를 받을 때마다 호출할 콜백 (진행 알림용, 캐시된 결과는 한 번에 전달)
+            budget: 메모리 예산 (같은 요청의 여러 스캔이 공유, None이면 기본 예산)
+
+        Returns:
+            검색된 티켓 (사용 후 close()로 임시 파일 정리)
 
-                all_results.extend(data.get("results", []))
+        Raises:
+            DeadlineExceeded: 시간 예산 소진 (partial에 수집된 페이지 결과 TicketSpool),
+                또는 Zendesk 장애로 마지막 검색 결과를 대신 사용하는 경우 (partial에 그 결과)
+        """
+        cache_key = make_key(SEARCH, hash_query(query))
+        stale_key = make_key(VALIDATORS, cache_key)
+        spool = TicketSpool(budget)
+        fetched = False
+
+        async def fetch_all_pages() -> dict[str, Any] | None:
+            nonlocal fetched
+            fetched = True
+            started_at = datetime.now(timezone.utc)
+            url = f"{self.base_url}/search.json"
+            params = {"query": query}
+
+            client = self.tenant.http_client()
+            reported_count = None
+            while url:
+                try:
+                    data = await self._get(client, url, params, deadline)
+                except DeadlineExceeded as e:
+                    e.partial = spool
+                    raise
+
+                if reported_count is None and data.get("count") is not None:
+                    reported_count = int(data["count"])
+                await spool.add(data.get("results", []))
+                if on_page:
+                    await on_page(data.get("results", []))
 
                 # 페이지네이션 처리
                 url = data.get("next_page")
                 params = None  # next_page URL에는 이미 파라미터가 포함됨
 
-        return all_results
+            index = get_search_index()
+            if index:
+                async for chunk in spool.chunks():
+                    await index.add_tickets(chunk)
+                if mirror_since:
+                    # 일반 검색은 최대 1,000건까지만 반환하므로 전체 결과 수만큼 받은 경우에만
+                    # 색인 완료 기간으로 기록 (잘린 결과로 기록하면 나머지 티켓이 검색되지 않음)
+                    if reported_count is None:
+                        try:
+                            reported_count = await self.count_tickets(query, deadline)
+                        except DeadlineExceeded:
+                            # 결과 수를 확인하지 못하면 기록하지 않음 (모든 페이지는 받았으므로
+                            # 결과는 그대로 반환)
+                            logger.info("Search index coverage not recorded: count unavailable")
+                    if reported_count is not None and len(spool) >= reported_count:
+                        await index.mark_covered(mirror_since, started_at)
+                    elif reported_count is not None:
+                        logger.info(
+                            "Search index coverage not recorded: %d of %d results scanned",
+                            len(spool),
+                            reported_count,
+                        )
+
+            # 메모리 예산을 넘은 결과는 캐시하지 않음
+            if spool.spilled:
+                return None
+
+            # Zendesk 장애 시 대신 응답할 마지막 결과 (검색 캐시보다 오래 보관)
+            await self.cache.set(
+                stale_key,
+                {"etag": None, "updated_at": None, "value": spool.tickets},
+                STALE_SEARCH_TTL_SECONDS,
+            )
+            # Webhook이 결과 본문을 읽지 않고 무효화 여부를 판단할 요약 (쿼리, 티켓 ID)
+            await self.cache.set(
+                invalidation_key(cache_key),
+                {"key": cache_key, "query": query, "ids": [t.get("id") for t in spool.tickets]},
+            )
+            return {"query": query, "results": spool.tickets}
+
+        # 같은 쿼리의 동시 요청(다른 워커 포함)은 한 번만 스캔하고 결과를 공유
+        # 모든 페이지를 수집한 경우에만 캐시 (부분 결과는 캐시하지 않음)
+        try:
+            entry = await self.cache.get_or_compute(
+                cache_key,
+                fetch_all_pages,
+                wait_timeout=deadline.remaining() if deadline else None,
+            )
+        except Exception as e:
+            stale = await self.cache.get(stale_key) if _is_degraded(e) else None
+            if stale is None:
+                if not isinstance(e, DeadlineExceeded):
+                    spool.close()
+                raise
+            # 마지막 결과로 부분 응답 (도구는 complete=false로 표시)
+            spool.close()
+            logger.warning("Serving stale search results for %s (%s)", cache_key, e)
+            raise DeadlineExceeded(partial=TicketSpool(tickets=stale["value"])) from e
+        if fetched:
+            return spool
+        if on_page:
+            await on_page(entry["results"])
+        return TicketSpool(tickets=entry["results"])
+
+    async def count_tickets(self, query: str, deadline: Deadline | None = None) -> int:
+        """
+        검색 결과 수 조회 (결과를 받지 않으므로 전체 스캔보다 훨씬 빠름)
+
+        Args:
+            query: Zendesk 검색 쿼리 문자열
+            deadline: 시간 예산
+
+        Returns:
+            검색 결과 수 (근사값일 수 있음)
+        """
+        data = await self._get(
+            self.tenant.http_client(),
+            f"{self.base_url}/search/count.json",
+            params={"query": query},
+            deadline=deadline,
+        )
+        return int(data.get("count") or 0)
+
+    async def export_search(
+        self, query: str, deadline: Deadline | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        티켓 검색 내보내기 (커서 페이지네이션)
+
+        일반 검색 API의 1,000건 제한 없이 전체 결과를 페이지 단위로 전달합니다.
+        결과를 모아 두지 않으므로 호출하는 쪽에서 페이지별로 집계하면 메모리가 일정하게 유지됩니다.
+        (페이지 단위로 소비되므로 검색 결과 캐시를 사용하지 않습니다)
+
+        Args:
+            query: Zendesk 검색 쿼리 (type:ticket 제외)
+            deadline: 시간 예산
+
+        Yields:
+            티켓 목록 (페이지당 최대 1,000건)
 
-    async def get_ticket(self, ticket_id: int) -> dict[str, Any]:
+        Raises:
+            DeadlineExceeded: 시간 예산 소진 (이미 전달한 페이지까지 유효)
+        """
+        url = f"{self.base_url}/search/export.json"
+        params: dict[str, Any] | None = {
+            "query": query,
+            "filter[type]": "ticket",
+            "page[size]": EXPORT_PAGE_SIZE,
+        }
+        client = self.tenant.http_client()
+        while url:
+            data = await self._get(client, url, params, deadline)
+            yield data.get("results", [])
+
+            # 다음 페이지 URL에는 커서와 파라미터가 포함됨
+            has_more = data.get("meta", {}).get("has_more")
+            url = data.get("links", {}).get("next") if has_more else None
+            params = None
+
+    async def get_ticket_metrics(
+        self, ticket_ids: list[int], deadline: Deadline | None = None
+    ) -> dict[int, dict[str, Any]]:
+        """
+        여러 티켓의 지표(응답/해결 시간) 일괄 조회
+
+        공유 캐시 백엔드(redis)는 티켓별 지표를 한 번의 다중 조회(get_many)로 확인하고,
+        캐시에 없는 티켓만 tickets/show_many(include=metric_sets)로 100건씩 나누어
+        동시에(METRICS_CONCURRENCY개까지) 조회한 뒤 한 번에 저장합니다.
+        인메모리 캐시는 티켓 수만큼 항목이 늘어나므로 티켓별 지표를 캐시하지 않습니다
+        (반복 조회는 도구의 집계 결과 캐시가 처리).
+
+        Args:
+            ticket_ids: 티켓 ID 목록
+            deadline: 시간 예산
+
+        Returns:
+            {ticket_id: metric_set} 형태의 딕셔너리 (지표가 없는 티켓은 제외)
+
+        Raises:
+            DeadlineExceeded: 시간 예산 소진
+        """
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        use_cache = not self.cache.in_process
+        metrics: dict[int, dict[str, Any]] = {}
+        if use_cache:
+            cached = await self.cache.get_many(
+                [make_key(TICKET_METRICS, ticket_id) for ticket_id in ticket_ids]
+            )
+            for ticket_id in ticket_ids:
+                metric_set = cached.get(make_key(TICKET_METRICS, ticket_id))
+                if metric_set is not None:
+                    metrics[ticket_id] = metric_set
+        missing_ids = [ticket_id for ticket_id in ticket_ids if ticket_id not in metrics]
+        fetched: dict[str, dict[str, Any]] = {}
+
+        semaphore = asyncio.Semaphore(METRICS_CONCURRENCY)
+        client = self.tenant.http_client()
+
+        async def fetch(chunk: list[int]) -> None:
+            async with semaphore:
+                data = await self._get(
+                    client,
+                    f"{self.base_url}/tickets/show_many.json",
+                    params={"ids": ",".join(str(tid) for tid in chunk), "include": "metric_sets"},
+                    deadline=deadline,
+                )
+            for metric_set in data.get("metric_sets", []):
+                ticket_id = metric_set.get("ticket_id")
+                if ticket_id is None:
+                    continue
+                metrics[ticket_id] = metric_set
+                fetched[make_key(TICKET_METRICS, ticket_id)] = metric_set
+
+        chunks = [
+            missing_ids[i : i + SHOW_MANY_LIMIT]
+            for i in range(0, len(missing_ids), SHOW_MANY_LIMIT)
+        ]
+        try:
+            await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        finally:
+            # 시간 예산이 소진되어도 이미 받은 지표는 저장
+            if use_cache and fetched:
+                await self.cache.set_many(fetched, METRICS_TTL_SECONDS)
+        return metrics
+
+    async def get_ticket(
+        self, ticket_id: int, deadline: Deadline | None = None
+    ) -> dict[str, Any]:
         """
         티켓 상세 조회
 
         Args:
             ticket_id: Zendesk 티켓 ID
+            deadline: 시간 예산
 
         Returns:
             티켓 상세 정보
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/tickets/{ticket_id}.json",
-                auth=self._get_auth(),
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("ticket", {})
-
-    async def get_user(self, user_id: int) -> dict[str, Any]:
+        cache_key = make_key(TICKETS, ticket_id)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        ticket = await self._get_revalidated(
+            f"{self.base_url}/tickets/{ticket_id}.json",
+            make_key(VALIDATORS, cache_key),
+            lambda data: data.get("ticket", {}),
+            deadline=deadline,
+        )
+        await self.cache.set(cache_key, ticket)
+        return ticket
+
+    async def get_user(
+        self, user_id: int, deadline: Deadline | None = None
+    ) -> dict[str, Any]:
         """
         사용자 정보 조회
 
         Args:
             user_id: Zendesk 사용자 ID
+            deadline: 시간 예산
 
         Returns:
             사용자 정보
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/users/{user_id}.json",
-                auth=self._get_auth(),
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("user", {})
-
-    async def get_users_batch(self, user_ids: list[int]) -> dict[int, dict[str, Any]]:
+        cache_key = make_key(USERS, user_id)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        user = await self._get_revalidated(
+            f"{self.base_url}/users/{user_id}.json",
+            make_key(VALIDATORS, cache_key),
+            lambda data: data.get("user", {}),
+            deadline=deadline,
+        )
+        await self.cache.set(cache_key, user)
+        return user
+
+    async def get_users_batch(
+        self, user_ids: list[int], deadline: Deadline | None = None
+    ) -> dict[int, dict[str, Any]]:
         """
         여러 사용자 정보 일괄 조회
 
         Args:
             user_ids: 사용자 ID 목록
+            deadline: 시간 예산
 
         Returns:
             {user_id: user_info} 형태의 딕셔너리
@@ -140,23 +758,33 @@ class ZendeskClient:
         if not user_ids:
             return {}
 
-        # 중복 제거
-        unique_ids = list(set(user_ids))
-        ids_param = ",".join(str(uid) for uid in unique_ids)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/users/show_many.json",
-                params={"ids": ids_param},
-                auth=self._get_auth(),
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            users = data.get("users", [])
-            return {user["id"]: user for user in users}
+        # 중복 제거 후 캐시에 없는 사용자만 조회
+        users: dict[int, dict[str, Any]] = {}
+        missing_ids = []
+        for uid in set(user_ids):
+            cached = await self.cache.get(make_key(USERS, uid))
+            if cached is not None:
+                users[uid] = cached
+            else:
+                missing_ids.append(uid)
+
+        if not missing_ids:
+            return users
+
+        # 같은 ID 묶음(예: 상위 담당자 목록)의 반복 조회는 묶음 단위 ETag로 재검증
+        ids_param = ",".join(str(uid) for uid in sorted(missing_ids))
+        fetched = await self._get_revalidated(
+            f"{self.base_url}/users/show_many.json",
+            make_key(VALIDATORS, USERS, "show_many", hash_query(ids_param)),
+            lambda data: data.get("users", []),
+            params={"ids": ids_param},
+            deadline=deadline,
+        )
+
+        for user in fetched:
+            users[user["id"]] = user
+            await self.cache.set(make_key(USERS, user["id"]), user)
+        return users
 
     def extract_company_name(self, ticket: dict[str, Any]) -> str:
         """
@@ -170,7 +798,7 @@ class ZendeskClient:
         """
         custom_fields = ticket.get("custom_fields", [])
         for field in custom_fields:
-            if str(field.get("id")) == self.COMPANY_FIELD_ID:
+            if str(field.get("id")) == self.company_field_id:
                 return field.get("value") or "Unknown"
         return "Unknown"
 
@@ -185,3 +813,25 @@ class ZendeskClient:
             태그 목록
         """
         return ticket.get("tags", [])
+
+
+async def prewarm_connections() -> int:
+    """
+    모든 테넌트의 Zendesk 연결을 동시에 미리 열기 (서버 시작 시)
+
+    자격 증명이 없거나 연결에 실패한 테넌트는 경고만 남기고 건너뜁니다.
+
+    Returns:
+        연결에 성공한 테넌트 수
+    """
+
+    async def prewarm(tenant: Tenant) -> bool:
+        try:
+            await ZendeskClient(tenant).prewarm()
+        except Exception as e:
+            logger.warning("Connection prewarm failed for tenant %s: %s", tenant.name, e)
+            return False
+        return True
+
+    results = await asyncio.gather(*(prewarm(tenant) for tenant in get_registry()))
+    return sum(results)
@@ -4,10 +4,16 @@ from src.tools.search_tickets import search_tickets
 from src.tools.get_ticket_details import get_ticket_details
 from src.tools.get_top_agents import get_top_agents
 from src.tools.get_service_trends import get_service_trends
+from src.tools.fetch_search_page import fetch_search_page
+from src.tools.get_agent_response_times import get_agent_response_times
+from src.tools.get_ticket_changes import get_ticket_changes
 
 __all__ = [
     "search_tickets",
     "get_ticket_details",
     "get_top_agents",
     "get_service_trends",
+    "fetch_search_page",
+    "get_agent_response_times",
+    "get_ticket_changes",
 ]
@@ -0,0 +1,88 @@
+"""
+fetch_search_page Tool
+
+search_tickets가 반환한 결과 핸들로 다음 고객사 그룹 페이지 또는
+특정 고객사의 전체 티켓 목록을 조회합니다. Zendesk 검색을 다시 실행하지 않습니다.
+"""
+
+from typing import Optional
+
+from pydantic import Field
+
+from src.models.schemas import CompanyGroup, SearchPage
+from src.services.result_handles import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    load_result,
+    next_cursor,
+)
+from src.services.tenants import current_tenant
+from src.utils.grouping import sample_tickets
+
+
+async def fetch_search_page(
+    handle: str = Field(description="search_tickets 결과의 handle"),
+    cursor: Optional[str] = Field(
+        default=None,
+        description="이전 응답의 next_cursor (미지정 시 첫 페이지)",
+    ),
+    company: Optional[str] = Field(
+        default=None,
+        description="고객사명 (지정 시 해당 고객사의 전체 티켓을 페이지 단위로 조회)",
+    ),
+    page_size: int = Field(
+        default=20,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="페이지 크기 (고객사 그룹 수, company 지정 시 티켓 수. 기본값: 20, 최대: 100)",
+    ),
+) -> SearchPage:
+    """
+    보관된 검색 결과의 다음 페이지를 조회합니다.
+
+    **사용 예시:**
+    - 다음 고객사 그룹: handle="...", cursor="20"
+    - 특정 고객사의 전체 티켓: handle="...", company="이지샵"
+
+    고객사 그룹 페이지는 고객사당 샘플 티켓(최대 10건)만 포함하며, 전체 티켓은 company를
+    지정해 조회합니다. 결과 핸들은 일정 시간(기본 15분) 후 만료되며, 만료 시
+    search_tickets를 다시 호출해야 합니다.
+
+    Args:
+        handle: 검색 결과 핸들
+        cursor: 페이지 커서
+        company: 고객사명
+        page_size: 페이지 크기
+
+    Returns:
+        SearchPage: 검색 결과 페이지
+    """
+    stored = await load_result(current_tenant().cache, handle)
+    if stored is None:
+        raise ValueError(
+            f"Search handle not found or expired: {handle}. Run search_tickets again."
+        )
+
+    offset = decode_cursor(cursor)
+    groups = [CompanyGroup.model_validate(group) for group in stored["companies"]]
+
+    if company:
+        group = next((g for g in groups if g.name == company), None)
+        if group is None:
+            raise ValueError(f"Company not found in search result: {company}")
+        page = [group.model_copy(update={"tickets": group.tickets[offset : offset + page_size]})]
+        cursor_total = len(group.tickets)
+    else:
+        # 첫 페이지(search_tickets)와 같이 고객사당 샘플 티켓만 응답
+        page = sample_tickets(groups[offset : offset + page_size])
+        cursor_total = len(groups)
+
+    return SearchPage(
+        handle=handle,
+        search_params=stored["search_params"],
+        period=stored["period"],
+        total_tickets=stored["total_tickets"],
+        total_companies=len(groups),
+        companies=page,
+        next_cursor=next_cursor(offset, page_size, cursor_total),
+    )
@@ -0,0 +1,185 @@
+"""
+get_agent_response_times Tool
+
+담당자별 첫 응답 시간 / 전체 해결 시간 분위수(p50, p90) 분석
+"""
+
+from typing import Any, Optional
+
+from fastmcp import Context
+from pydantic import Field
+
+from src.models.schemas import (
+    AgentResponseTime,
+    AgentResponseTimesResult,
+    ResponseTimeStats,
+)
+from src.services.cache import AGGREGATES, is_refreshing, make_key, set_with_summary
+from src.services.warmer import record_query
+from src.services.zendesk_client import ZendeskClient
+from src.utils.date_utils import format_period_string, get_date_range
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.progress import ProgressReporter
+from src.utils.quantile_sketch import KLLSketch
+from src.utils.query_filters import get_exclusion_query
+
+
+class _ResponseTimeSketch:
+    """첫 응답 / 전체 해결 시간 스케치 쌍"""
+
+    def __init__(self):
+        self.ticket_count = 0
+        self.first_reply = KLLSketch()
+        self.resolution = KLLSketch()
+
+    def add(self, reply_minutes: float | None, resolution_minutes: float | None) -> None:
+        self.ticket_count += 1
+        if reply_minutes is not None:
+            self.first_reply.add(reply_minutes)
+        if resolution_minutes is not None:
+            self.resolution.add(resolution_minutes)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ticket_count": self.ticket_count,
+            "first_reply_p50_minutes": self.first_reply.quantile(0.5),
+            "first_reply_p90_minutes": self.first_reply.quantile(0.9),
+            "resolution_p50_minutes": self.resolution.quantile(0.5),
+            "resolution_p90_minutes": self.resolution.quantile(0.9),
+        }
+
+
+def _minutes(metric_set: dict[str, Any], field: str, business_hours: bool) -> float | None:
+    """metric_set의 {calendar, business} 시간 값 추출"""
+    value = (metric_set.get(field) or {}).get("business" if business_hours else "calendar")
+    return float(value) if value is not None else None
+
+
+async def get_agent_response_times(
+    period_days: int = Field(
+        default=30,
+        description="분석 기간 (일 단위, 기본값: 30)",
+    ),
+    limit: int = Field(
+        default=10,
+        description="반환할 담당자 수 (기본값: 10, 해결 티켓 수순)",
+    ),
+    business_hours: bool = Field(
+        default=False,
+        description="업무 시간 기준으로 계산 (기본값: false, 달력 시간)",
+    ),
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        description="응답 시간 예산 (초, 미지정 시 서버 기본값). "
+                    "초과 시 그때까지 수집된 티켓으로 집계하여 complete=false로 반환",
+    ),
+    ctx: Context | None = None,
+) -> AgentResponseTimesResult:
+    """
+    기간 내 해결된 티켓의 담당자별 첫 응답 시간과 전체 해결 시간 분위수(p50, p90)를 분석합니다.
+
+    티켓을 페이지 단위로 내보내며 지표를 일괄 조회하고, 값은 스트리밍 분위수 스케치에
+    누적하므로 티켓 수와 무관하게 메모리 사용량이 일정합니다. 분위수는 근사값입니다.
+
+    Args:
+        period_days: 분석 기간 (기본값: 30일)
+        limit: 반환할 담당자 수 (기본값: 10)
+        business_hours: 업무 시간 기준 여부 (기본값: 달력 시간)
+        deadline_seconds: 응답 시간 예산 (초)
+        ctx: FastMCP 요청 컨텍스트 (진행 알림)
+
+    Returns:
+        AgentResponseTimesResult: 담당자별 응답/해결 시간 분위수
+    """
+    record_query(
+        "get_agent_response_times",
+        {"period_days": period_days, "limit": limit, "business_hours": business_hours},
+    )
+
+    client = ZendeskClient()
+    deadline = Deadline.from_seconds(deadline_seconds)
+    start_date, _ = get_date_range(period_days)
+
+    # 집계 결과 캐시 조회 (티켓/사용자 Webhook 수신 시 무효화)
+    cache_key = make_key(
+        AGGREGATES, "get_agent_response_times", start_date, limit, business_hours
+    )
+    cached = None if is_refreshing() else await client.cache.get(cache_key)
+    if cached is not None:
+        return AgentResponseTimesResult.model_validate(cached["result"])
+
+    # 해결된 티켓을 페이지 단위로 내보내며 지표를 일괄 조회해 스케치에 누적
+    exclusion = get_exclusion_query(client.company_field_id)
+    query = f"status:solved solved>{start_date} {exclusion}"
+    sketches: dict[int, _ResponseTimeSketch] = {}
+    overall = _ResponseTimeSketch()
+    complete = True
+    # 내보내기 결과는 중복이 없으므로 티켓 ID를 보관하지 않음
+    progress = ProgressReporter(ctx, dedupe=False)
+    progress.start_estimate(
+        lambda q: client.count_tickets(f"type:ticket {q}", deadline=deadline), [query]
+    )
+    try:
+        async for tickets in client.export_search(query, deadline=deadline):
+            await progress.page(tickets)
+            assignees = {
+                ticket["id"]: ticket["assignee_id"]
+                for ticket in tickets
+                if ticket.get("assignee_id")
+            }
+            metrics = await client.get_ticket_metrics(list(assignees), deadline=deadline)
+            for ticket_id, metric_set in metrics.items():
+                reply = _minutes(metric_set, "reply_time_in_minutes", business_hours)
+                resolution = _minutes(
+                    metric_set, "full_resolution_time_in_minutes", business_hours
+                )
+                sketch = sketches.setdefault(assignees[ticket_id], _ResponseTimeSketch())
+                sketch.add(reply, resolution)
+                overall.add(reply, resolution)
+    except DeadlineExceeded:
+        # 시간 예산 초과 시 누적된 티켓까지만 집계
+        complete = False
+    await progress.finish()
+
+    # 해결 티켓 수 상위 N명
+    top_agents = sorted(sketches.items(), key=lambda x: x[1].ticket_count, reverse=True)[:limit]
+
+    # 담당자 정보 조회
+    agent_ids = [agent_id for agent_id, _ in top_agents]
+    try:
+        users = await client.get_users_batch(agent_ids, deadline=deadline)
+    except DeadlineExceeded:
+        # 이름 조회 시간이 부족하면 ID로 표시 (이 결과는 캐시하지 않음)
+        users = {}
+        names_resolved = False
+    else:
+        names_resolved = True
+
+    # 결과 구성
+    agents = []
+    for agent_id, sketch in top_agents:
+        user = users.get(agent_id, {})
+        agents.append(
+            AgentResponseTime(
+                name=user.get("name", f"User #{agent_id}"),
+                email=user.get("email"),
+                **sketch.stats(),
+            )
+        )
+
+    result = AgentResponseTimesResult(
+        period=format_period_string(period_days),
+        business_hours=business_hours,
+        agents=agents,
+        overall=ResponseTimeStats(**overall.stats()),
+        complete=complete,
+    )
+
+    if complete and names_resolved:
+        await set_with_summary(
+            client.cache,
+            cache_key,
+            {"result": result.model_dump(mode="json")},
+            {"window_start": start_date, "date_field": "updated_at", "user_ids": agent_ids},
+        )
+    return result
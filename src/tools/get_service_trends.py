@@ -5,12 +5,18 @@ get_service_trends Tool
 """
 
 from collections import Counter
+from typing import Optional
 
+from fastmcp import Context
 from pydantic import Field
 
 from src.models.schemas import ServiceTrend, ServiceTrendsResult
+from src.services.cache import AGGREGATES, is_refreshing, make_key, set_with_summary
+from src.services.warmer import record_query
 from src.services.zendesk_client import ZendeskClient
 from src.utils.date_utils import format_period_string, get_date_range
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.progress import ProgressReporter
 from src.utils.query_filters import get_exclusion_query
 
 # 서비스 관련 태그 목록 (필터링용)
@@ -43,6 +49,11 @@ SERVICE_TAGS = {
 }
 
 
+def _service_tags(client: ZendeskClient, ticket: dict) -> list[str]:
+    """티켓의 서비스 관련 태그 (소문자로 비교)"""
+    return [tag for tag in client.extract_tags(ticket) if tag.lower() in SERVICE_TAGS]
+
+
 async def get_service_trends(
     period_days: int = Field(
         default=90,
@@ -52,33 +63,65 @@ async def get_service_trends(
         default=10,
         description="반환할 서비스 수 (기본값: 10)",
     ),
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        description="응답 시간 예산 (초, 미지정 시 서버 기본값). "
+                    "초과 시 그때까지 수집된 티켓으로 집계하여 complete=false로 반환",
+    ),
+    ctx: Context | None = None,
 ) -> ServiceTrendsResult:
     """
     서비스별 문의 빈도를 분석합니다.
 
+    스캔 결과가 요청 메모리 예산을 넘으면 임시 파일로 옮기고 페이지 묶음 단위로 집계합니다.
+
     Args:
         period_days: 검색 기간 (기본값: 90일)
         limit: 반환할 서비스 수 (기본값: 10)
+        deadline_seconds: 응답 시간 예산 (초)
+        ctx: FastMCP 요청 컨텍스트 (진행 알림)
 
     Returns:
         ServiceTrendsResult: 서비스별 문의 트렌드
     """
+    record_query("get_service_trends", {"period_days": period_days, "limit": limit})
+
     client = ZendeskClient()
+    deadline = Deadline.from_seconds(deadline_seconds)
     start_date, _ = get_date_range(period_days)
 
+    # 집계 결과 캐시 조회 (티켓 생성/수정 Webhook 수신 시 무효화)
+    cache_key = make_key(AGGREGATES, "get_service_trends", start_date, limit)
+    cached = None if is_refreshing() else await client.cache.get(cache_key)
+    if cached is not None:
+        return ServiceTrendsResult.model_validate(cached["result"])
+
     # 기간 내 모든 티켓 검색
-    query = f"type:ticket created>{start_date} {get_exclusion_query()}"
-    tickets = await client.search_tickets(query)
+    exclusion = get_exclusion_query(client.company_field_id)
+    query = f"type:ticket created>{start_date} {exclusion}"
+    complete = True
+    progress = ProgressReporter(ctx, labels=lambda t: _service_tags(client, t))
+    progress.start_estimate(lambda q: client.count_tickets(q, deadline=deadline), [query])
+    try:
+        # 기간 내 전체 티켓 스캔 (결과가 잘리지 않았으면 로컬 검색 인덱스의 색인 완료 기간으로 기록)
+        tickets = await client.scan_tickets(
+            query, deadline=deadline, mirror_since=start_date, on_page=progress.page
+        )
+    except DeadlineExceeded as e:
+        # 시간 예산 초과 시 수집된 페이지까지만 집계
+        tickets = e.partial
+        complete = False
+    await progress.finish()
 
-    # 태그별 집계
+    # 태그별 집계 (임시 파일로 옮긴 결과는 페이지 묶음 단위로 읽으며 집계)
+    total_tickets = len(tickets)
     tag_counter: Counter[str] = Counter()
-    for ticket in tickets:
-        tags = client.extract_tags(ticket)
-        for tag in tags:
-            # 서비스 관련 태그만 집계 (소문자로 비교)
-            tag_lower = tag.lower()
-            if tag_lower in SERVICE_TAGS:
-                tag_counter[tag] += 1
+    try:
+        async for chunk in tickets.chunks():
+            for ticket in chunk:
+                tag_counter.update(_service_tags(client, ticket))
+    finally:
+        tickets.close()
 
     # 상위 N개 추출
     top_services = tag_counter.most_common(limit)
@@ -88,8 +131,18 @@ async def get_service_trends(
         for tag, count in top_services
     ]
 
-    return ServiceTrendsResult(
+    result = ServiceTrendsResult(
         period=format_period_string(period_days),
-        total_tickets=len(tickets),
+        total_tickets=total_tickets,
         services=services,
+        complete=complete,
     )
+
+    if complete:
+        await set_with_summary(
+            client.cache,
+            cache_key,
+            {"result": result.model_dump(mode="json")},
+            {"window_start": start_date, "date_field": "created_at"},
+        )
+    return result
@@ -0,0 +1,171 @@
+"""
+get_ticket_changes Tool
+
+마지막 조회 이후 생성/수정된 티켓만 고객사별로 조회합니다.
+조회 비용이 기간 길이가 아닌 변경량에 비례하므로 주기적인 "새 소식" 확인에 사용합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastmcp import Context
+from fastmcp.server.dependencies import get_http_headers
+from pydantic import Field
+
+from src.models.schemas import TicketChangesResult
+from src.services.cache import hash_query
+from src.services.change_cursors import (
+    ChangeCursor,
+    cursor_key,
+    format_search_datetime,
+    load_cursor,
+    save_cursor,
+)
+from src.services.tenants import parse_bearer_token
+from src.services.zendesk_client import ZendeskClient
+from src.utils.date_utils import parse_zendesk_datetime
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.grouping import group_by_company
+from src.utils.progress import ProgressReporter
+from src.utils.query_filters import get_exclusion_query
+
+
+def _cursor_owner(subscription: Optional[str]) -> str:
+    """
+    커서 소유자 (구독 이름 → MCP 세션 헤더 → 클라이언트 Bearer 토큰 → 기본값)
+
+    stdio 전송은 프로세스당 클라이언트가 하나이므로 기본값이 곧 세션별 커서입니다.
+    """
+    if subscription:
+        return f"subscription:{subscription}"
+    headers = get_http_headers(include={"authorization", "mcp-session-id"})
+    if headers.get("mcp-session-id"):
+        return f"session:{headers['mcp-session-id']}"
+    token = parse_bearer_token(headers.get("authorization"))
+    if token:
+        return f"client:{hash_query(token)}"
+    return "subscription:default"
+
+
+async def get_ticket_changes(
+    company: Optional[str] = Field(
+        default=None,
+        description="고객사명 필터 (Zendesk 커스텀 필드 기반 정확한 매칭)",
+    ),
+    tags: Optional[list[str]] = Field(
+        default=None,
+        description="태그 필터 (모든 태그가 있는 티켓만)",
+    ),
+    status: Optional[str] = Field(
+        default=None,
+        description="티켓 상태 필터 (open, pending, hold, solved, closed)",
+    ),
+    subscription: Optional[str] = Field(
+        default=None,
+        description="구독 이름 (여러 세션/클라이언트가 같은 커서를 이어 쓰려면 지정, "
+                    "미지정 시 MCP 세션 또는 클라이언트 토큰별 커서)",
+    ),
+    period_days: int = Field(
+        default=1,
+        description="첫 조회(또는 reset) 시 확인할 기간 (일 단위, 기본값: 1)",
+    ),
+    reset: bool = Field(
+        default=False,
+        description="저장된 커서를 버리고 period_days 전부터 다시 조회",
+    ),
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        description="응답 시간 예산 (초, 미지정 시 서버 기본값). "
+                    "초과 시 그때까지 조회한 변경을 complete=false로 반환하고 "
+                    "나머지는 다음 조회에서 반환",
+    ),
+    ctx: Context | None = None,
+) -> TicketChangesResult:
+    """
+    마지막 조회 이후 생성되거나 수정된 티켓을 고객사별로 반환합니다.
+
+    **사용 예시:**
+    - 특정 고객사의 새 소식: company="이지샵"
+    - 여러 에이전트가 공유하는 구독: subscription="ops-daily", tags=["monitoring"]
+
+    조건(company, tags, status)과 구독 이름(없으면 MCP 세션/클라이언트)별로 커서를 서버에 보관하고,
+    다음 호출에서는 그 이후의 변경만 조회합니다. 첫 호출은 period_days 전부터 조회합니다.
+
+    Args:
+        company: 고객사명 필터
+        tags: 태그 필터
+        status: 티켓 상태 필터
+        subscription: 구독 이름
+        period_days: 첫 조회 기간 (기본값: 1일)
+        reset: 커서 초기화 여부
+        deadline_seconds: 응답 시간 예산 (초)
+        ctx: FastMCP 요청 컨텍스트 (진행 알림)
+
+    Returns:
+        TicketChangesResult: 고객사별 변경 티켓과 다음 조회 기준 시각
+
+    Raises:
+        ValueError: 같은 커서를 조회 중인 다른 호출이 시간 예산 안에 끝나지 않은 경우
+    """
+    client = ZendeskClient()
+    deadline = Deadline.from_seconds(deadline_seconds)
+    owner = _cursor_owner(subscription)
+    key = cursor_key(
+        owner, {"company": company, "tags": sorted(tags or []), "status": status}
+    )
+
+    # 같은 커서를 동시에 조회하면 같은 변경을 두 번 전달하지 않도록 직렬화
+    async with client.cache.lock(key, deadline.remaining()) as acquired:
+        if not acquired:
+            # 잠금 없이 진행하면 앞선 조회와 같은 변경을 다시 전달하거나 커서를 덮어씀
+            raise ValueError(
+                f"Change cursor is busy: another call is reading {owner}. Retry later."
+            )
+        cursor = None if reset else await load_cursor(client.cache, key)
+        if cursor is None:
+            cursor = ChangeCursor(datetime.now(timezone.utc) - timedelta(days=period_days))
+        since = cursor.watermark
+
+        parts = [
+            f"updated>{format_search_datetime(cursor.search_since)}",
+            get_exclusion_query(client.company_field_id),
+        ]
+        if status:
+            parts.append(f"status:{status}")
+        if company:
+            parts.append(f"custom_field_{client.company_field_id}:{company}")
+        for tag in tags or []:
+            parts.append(f"tags:{tag.lower().replace(' ', '-')}")
+
+        # 겹침 구간에서 이미 전달한 버전을 빼고 수집 (페이지 사이에 다시 수정된 티켓은 최신 버전만)
+        changed: dict[int, dict] = {}
+        complete = True
+        progress = ProgressReporter(ctx, labels=lambda t: [client.extract_company_name(t)])
+        try:
+            async for tickets in client.export_search(" ".join(parts), deadline=deadline):
+                await progress.page(tickets)
+                for ticket in tickets:
+                    if cursor.is_new(ticket):
+                        changed[ticket["id"]] = ticket
+        except DeadlineExceeded:
+            complete = False
+        await progress.finish()
+
+        tickets = list(changed.values())
+        cursor.advance(tickets, move_watermark=complete)
+        await save_cursor(client.cache, key, cursor)
+
+    created = sum(
+        1
+        for ticket in tickets
+        if (parse_zendesk_datetime(ticket.get("created_at")) or since) > since
+    )
+    return TicketChangesResult(
+        subscription=owner,
+        since=since,
+        until=cursor.watermark,
+        total_tickets=len(tickets),
+        created_tickets=created,
+        companies=group_by_company(tickets, client),
+        complete=complete,
+    )
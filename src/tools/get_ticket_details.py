@@ -4,29 +4,38 @@ get_ticket_details Tool
 특정 티켓의 상세 정보 조회
 """
 
+from typing import Optional
+
 from pydantic import Field
 
 from src.models.schemas import TicketDetails
 from src.services.zendesk_client import ZendeskClient
 from src.utils.date_utils import parse_zendesk_datetime
+from src.utils.deadline import Deadline
 
 
 async def get_ticket_details(
     ticket_id: int = Field(description="Zendesk 티켓 ID"),
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        description="응답 시간 예산 (초, 미지정 시 서버 기본값)",
+    ),
 ) -> TicketDetails:
     """
     특정 티켓의 상세 정보를 조회합니다.
 
     Args:
         ticket_id: Zendesk 티켓 ID
+        deadline_seconds: 응답 시간 예산 (초)
 
     Returns:
         TicketDetails: 티켓 상세 정보
     """
     client = ZendeskClient()
+    deadline = Deadline.from_seconds(deadline_seconds)
 
     # 티켓 조회
-    ticket = await client.get_ticket(ticket_id)
+    ticket = await client.get_ticket(ticket_id, deadline=deadline)
 
     # 담당자 및 요청자 정보 조회
     assignee_name = None
@@ -39,7 +48,7 @@ async def get_ticket_details(
         user_ids.append(ticket["requester_id"])
 
     if user_ids:
-        users = await client.get_users_batch(user_ids)
+        users = await client.get_users_batch(user_ids, deadline=deadline)
         if ticket.get("assignee_id"):
             assignee = users.get(ticket["assignee_id"], {})
             assignee_name = assignee.get("name")
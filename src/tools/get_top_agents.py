@@ -4,11 +4,18 @@ get_top_agents Tool
 기간 내 가장 많은 티켓을 해결한 담당자 조회
 """
 
+from typing import Optional
+
+from fastmcp import Context
 from pydantic import Field
 
 from src.models.schemas import AgentPerformance, TopAgentsResult
+from src.services.cache import AGGREGATES, is_refreshing, make_key, set_with_summary
+from src.services.warmer import record_query
 from src.services.zendesk_client import ZendeskClient
 from src.utils.date_utils import format_period_string, get_date_range
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.progress import ProgressReporter
 from src.utils.query_filters import get_exclusion_query
 
 
@@ -21,6 +28,12 @@ async def get_top_agents(
         default=10,
         description="반환할 담당자 수 (기본값: 10)",
     ),
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        description="응답 시간 예산 (초, 미지정 시 서버 기본값). "
+                    "초과 시 그때까지 수집된 티켓으로 집계하여 complete=false로 반환",
+    ),
+    ctx: Context | None = None,
 ) -> TopAgentsResult:
     """
     기간 내 가장 많은 티켓을 해결한 담당자를 조회합니다.
@@ -28,16 +41,37 @@ async def get_top_agents(
     Args:
         period_days: 검색 기간 (기본값: 30일)
         limit: 반환할 담당자 수 (기본값: 10)
+        deadline_seconds: 응답 시간 예산 (초)
+        ctx: FastMCP 요청 컨텍스트 (진행 알림)
 
     Returns:
         TopAgentsResult: 담당자 성과 순위
     """
+    record_query("get_top_agents", {"period_days": period_days, "limit": limit})
+
     client = ZendeskClient()
+    deadline = Deadline.from_seconds(deadline_seconds)
     start_date, _ = get_date_range(period_days)
 
+    # 집계 결과 캐시 조회 (티켓/사용자 Webhook 수신 시 무효화)
+    cache_key = make_key(AGGREGATES, "get_top_agents", start_date, limit)
+    cached = None if is_refreshing() else await client.cache.get(cache_key)
+    if cached is not None:
+        return TopAgentsResult.model_validate(cached["result"])
+
     # 해결된 티켓 검색
-    query = f"type:ticket status:solved solved>{start_date} {get_exclusion_query()}"
-    tickets = await client.search_tickets(query)
+    exclusion = get_exclusion_query(client.company_field_id)
+    query = f"type:ticket status:solved solved>{start_date} {exclusion}"
+    complete = True
+    progress = ProgressReporter(ctx)
+    progress.start_estimate(lambda q: client.count_tickets(q, deadline=deadline), [query])
+    try:
+        tickets = await client.search_tickets(query, deadline=deadline, on_page=progress.page)
+    except DeadlineExceeded as e:
+        # 시간 예산 초과 시 수집된 페이지까지만 집계
+        tickets = e.partial
+        complete = False
+    await progress.finish()
 
     # 담당자별 해결 티켓 수 집계
     agent_counts: dict[int, int] = {}
@@ -51,7 +85,14 @@ async def get_top_agents(
 
     # 담당자 정보 조회
     agent_ids = [agent_id for agent_id, _ in sorted_agents]
-    users = await client.get_users_batch(agent_ids)
+    try:
+        users = await client.get_users_batch(agent_ids, deadline=deadline)
+    except DeadlineExceeded:
+        # 이름 조회 시간이 부족하면 ID로 표시 (이 결과는 캐시하지 않음)
+        users = {}
+        names_resolved = False
+    else:
+        names_resolved = True
 
     # 결과 구성
     agents = []
@@ -65,7 +106,17 @@ async def get_top_agents(
             )
         )
 
-    return TopAgentsResult(
+    result = TopAgentsResult(
         period=format_period_string(period_days),
         agents=agents,
+        complete=complete,
     )
+
+    if complete and names_resolved:
+        await set_with_summary(
+            client.cache,
+            cache_key,
+            {"result": result.model_dump(mode="json")},
+            {"window_start": start_date, "date_field": "updated_at", "user_ids": agent_ids},
+        )
+    return result
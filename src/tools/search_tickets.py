@@ -8,12 +8,25 @@ search_tickets Tool (통합)
 import asyncio
 from typing import Optional
 
+from fastmcp import Context
 from pydantic import Field
 
-from src.models.schemas import CompanyGroup, SearchResult, TicketInfo
+from src.models.schemas import SearchCoverage, SearchResult
+from src.services.cache import is_refreshing
+from src.services.rate_limit import HeadroomExhausted
+from src.services.result_handles import MAX_PAGE_SIZE, next_cursor, save_result
+from src.services.search_index import gap_start_date, get_search_index
+from src.services.warmer import record_query
 from src.services.zendesk_client import ZendeskClient
-from src.utils.date_utils import format_period_string, get_date_range, parse_zendesk_datetime
-from src.utils.query_filters import COMPANY_FIELD_ID, get_exclusion_query
+from src.utils.date_utils import format_period_string, get_date_range
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.grouping import group_by_company, sample_tickets
+from src.utils.progress import ClientDisconnected, ProgressReporter
+from src.utils.query_filters import get_exclusion_query
+from src.utils.spill import IdSet, MemoryBudget, TicketSpool
+
+# 데드라인 도달 후 진행 중인 요청이 정리될 때까지 기다리는 여유 시간 (초)
+CANCEL_GRACE_SECONDS = 0.5
 
 
 def _build_keyword_queries(
@@ -40,76 +53,108 @@ def _build_keyword_queries(
     return queries
 
 
-def _merge_tickets(ticket_lists: list[list[dict]]) -> list[dict]:
-    """여러 검색 결과를 합치고 중복을 제거합니다."""
-    seen_ids: set[int] = set()
-    merged: list[dict] = []
-
-    for tickets in ticket_lists:
-        for ticket in tickets:
-            ticket_id = ticket.get("id")
-            if ticket_id and ticket_id not in seen_ids:
-                seen_ids.add(ticket_id)
-                merged.append(ticket)
-
-    return merged
-
-
-def _group_by_company(
-    tickets: list[dict], client: ZendeskClient, limit_per_company: int = 10
-) -> list[CompanyGroup]:
+async def _run_searches(
+    client: ZendeskClient,
+    queries: list[str],
+    deadline: Deadline,
+    progress: ProgressReporter | None = None,
+) -> tuple[list[TicketSpool], SearchCoverage]:
     """
-    티켓을 고객사별로 그룹핑합니다.
+    검색 쿼리들을 병렬 실행하고, 시간 예산 내에 수집된 결과만 반환합니다.
+
+    시간 예산이 소진되면 남은 작업은 취소되며, 페이지 일부만 수집한 쿼리는
+    부분 결과를 그대로 사용합니다. 모든 쿼리가 하나의 메모리 예산을 나눠 쓰며,
+    예산을 넘은 결과는 임시 파일로 옮겨집니다 (사용 후 close 필요).
 
     Args:
-        tickets: 티켓 목록
         client: Zendesk 클라이언트
-        limit_per_company: 각 고객사당 최대 티켓 수
+        queries: 검색 쿼리 목록
+        deadline: 시간 예산
+        progress: 페이지별 진행 알림
 
     Returns:
-        고객사별 그룹 목록 (티켓 수 내림차순)
+        (쿼리 순서대로의 결과 목록, 커버리지 정보) 튜플
     """
-    company_tickets: dict[str, list[TicketInfo]] = {}
-    company_total_count: dict[str, int] = {}
-
-    for ticket in tickets:
-        company_name = client.extract_company_name(ticket)
-        if not company_name or company_name == "Unknown":
+    on_page = progress.page if progress else None
+    budget = MemoryBudget()
+    tasks = [
+        asyncio.create_task(
+            client.scan_tickets(q, deadline=deadline, on_page=on_page, budget=budget)
+        )
+        for q in queries
+    ]
+    try:
+        _, pending = await asyncio.wait(
+            tasks, timeout=deadline.remaining() + CANCEL_GRACE_SECONDS
+        )
+    finally:
+        # 시간 예산 소진 또는 호출 자체가 취소된 경우 남은 작업 정리
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    results: list[TicketSpool] = []
+    completed = partial = failed = 0
+    errors: list[BaseException] = []
+
+    for task in tasks:
+        if task in pending:
+            failed += 1
+            results.append(TicketSpool())
             continue
 
-        # 총 티켓 수 카운트
-        company_total_count[company_name] = company_total_count.get(company_name, 0) + 1
-
-        ticket_info = TicketInfo(
-            id=ticket.get("id"),
-            subject=ticket.get("subject", ""),
-            status=ticket.get("status", ""),
-            priority=ticket.get("priority"),
-            created_at=parse_zendesk_datetime(ticket.get("created_at")),
-            company_name=company_name,
-        )
+        exc = task.exception()
+        if exc is None:
+            completed += 1
+            results.append(task.result())
+        elif isinstance(exc, DeadlineExceeded):
+            if exc.partial:
+                partial += 1
+            else:
+                failed += 1
+            results.append(exc.partial)
+        else:
+            failed += 1
+            errors.append(exc)
+            results.append(TicketSpool())
+
+    # 모든 쿼리가 시간 예산이 아닌 오류로 실패한 경우 (인증 오류 등) 그대로 전달
+    if errors and len(errors) == len(tasks):
+        raise errors[0]
+    # 클라이언트 연결 종료 또는 캐시 워밍이 호출 여유 부족으로 중단된 경우 부분 결과 대신 중단
+    for exc in errors:
+        if isinstance(exc, (ClientDisconnected, HeadroomExhausted)):
+            raise exc
+
+    coverage = SearchCoverage(
+        total_queries=len(tasks),
+        completed_queries=completed,
+        partial_queries=partial,
+        failed_queries=failed,
+    )
+    return results, coverage
 
-        if company_name not in company_tickets:
-            company_tickets[company_name] = []
 
-        # 각 고객사당 티켓 수 제한 (샘플링)
-        if len(company_tickets[company_name]) < limit_per_company:
-            company_tickets[company_name].append(ticket_info)
+async def _merge_tickets(spools: list[TicketSpool], limit: Optional[int] = None) -> list[dict]:
+    """
+    여러 검색 결과를 순서대로 합치고 중복을 제거합니다.
 
-    # 그룹 생성 및 정렬
-    groups = [
-        CompanyGroup(
-            name=name,
-            ticket_count=company_total_count[name],  # 실제 전체 티켓 수
-            tickets=tickets_list,  # 샘플 티켓 (limit_per_company개)
-        )
-        for name, tickets_list in company_tickets.items()
-    ]
+    임시 파일로 옮겨진 결과는 페이지 묶음 단위로 읽으며, limit개를 채우면 중단합니다.
+    """
+    seen_ids = IdSet()
+    merged: list[dict] = []
 
-    # 티켓 수 내림차순 정렬
-    groups.sort(key=lambda x: x.ticket_count, reverse=True)
+    for spool in spools:
+        async for tickets in spool.chunks():
+            for ticket in tickets:
+                ticket_id = ticket.get("id")
+                if ticket_id and seen_ids.add(ticket_id):
+                    merged.append(ticket)
+                    if limit is not None and len(merged) >= limit:
+                        return merged
 
-    return groups
+    return merged
 
 
 async def search_tickets(
@@ -139,6 +184,19 @@ async def search_tickets(
         default=500,
         description="최대 티켓 수 (기본값: 500)",
     ),
+    page_size: int = Field(
+        default=20,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="첫 응답에 포함할 고객사 그룹 수 (기본값: 20, 최대: 100). "
+                    "나머지는 handle과 next_cursor로 fetch_search_page에서 조회",
+    ),
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        description="응답 시간 예산 (초, 미지정 시 서버 기본값). "
+                    "초과 시 그때까지 수집된 부분 결과를 complete=false로 반환",
+    ),
+    ctx: Context | None = None,
 ) -> SearchResult:
     """
     티켓을 검색하고 고객사별로 그룹핑하여 반환합니다.
@@ -161,6 +219,10 @@ async def search_tickets(
     - 고객사별로 그룹핑하여 티켓 목록과 URL 제공
     - 티켓 수 기준 내림차순 정렬
     - 각 고객사당 최대 10개 티켓 샘플 제공
+    - 첫 page_size개 고객사 그룹만 반환하고, 전체 결과는 handle로 보관
+      (다음 그룹은 next_cursor, 특정 고객사의 전체 티켓은 company로 fetch_search_page 호출)
+    - 시간 예산 초과 시 부분 결과 반환 (complete=false, coverage에 수집 현황)
+    - 진행 토큰을 보낸 클라이언트에는 수집 현황과 중간 고객사 순위를 진행 알림으로 전송
 
     Args:
         keywords: 검색 키워드 목록 (OR 조건)
@@ -169,6 +231,9 @@ async def search_tickets(
         company: 고객사명 필터
         period_days: 검색 기간
         limit: 최대 티켓 수
+        page_size: 첫 응답의 고객사 그룹 수
+        deadline_seconds: 응답 시간 예산 (초)
+        ctx: FastMCP 요청 컨텍스트 (진행 알림)
 
     Returns:
         SearchResult: 고객사별 그룹핑된 검색 결과
@@ -182,9 +247,22 @@ async def search_tickets(
             companies=[],
         )
 
+    record_query(
+        "search_tickets",
+        {
+            "keywords": keywords,
+            "tags": tags,
+            "status": status,
+            "company": company,
+            "period_days": period_days,
+            "limit": limit,
+        },
+    )
+
     client = ZendeskClient()
+    deadline = Deadline.from_seconds(deadline_seconds)
     start_date, _ = get_date_range(period_days)
-    exclusion = get_exclusion_query()
+    exclusion = get_exclusion_query(client.company_field_id)
 
     # 공통 쿼리 조건 생성
     def build_common_conditions() -> str:
@@ -194,53 +272,64 @@ async def search_tickets(
             parts.append(f"status:{status}")
         if company:
             # 요청 회사 커스텀 필드로 검색
-            parts.append(f"custom_field_{COMPANY_FIELD_ID}:{company}")
+            parts.append(f"custom_field_{client.company_field_id}:{company}")
         return " ".join(parts)
 
     common_conditions = build_common_conditions()
-    all_tickets: list[dict] = []
+    queries: list[str] = []
 
-    # 1. 키워드 검색 처리 (병렬)
+    # 1. 키워드 검색 쿼리
+    local_tickets: list[dict] = []
     if keywords:
-        queries = _build_keyword_queries(keywords, start_date, exclusion)
+        # 로컬 인덱스에 색인 완료된 기간은 로컬에서 검색하고, 이후 기간만 원격 검색
+        keyword_start = start_date
+        index = get_search_index()
+        covered_until = await index.covered_until(start_date) if index else None
+        if covered_until:
+            local_tickets = await index.search(keywords, start_date, status, company)
+            keyword_start = gap_start_date(covered_until, start_date)
+
+        keyword_queries = _build_keyword_queries(keywords, keyword_start, exclusion)
 
         # 상태/고객사 필터 추가
         additional = ""
         if status:
             additional += f" status:{status}"
         if company:
-            additional += f" custom_field_{COMPANY_FIELD_ID}:{company}"
+            additional += f" custom_field_{client.company_field_id}:{company}"
         if additional:
-            queries = [f"{q}{additional}" for q in queries]
+            keyword_queries = [f"{q}{additional}" for q in keyword_queries]
 
-        search_tasks = [client.search_tickets(q) for q in queries]
-        results = await asyncio.gather(*search_tasks, return_exceptions=True)
-        valid_results = [r for r in results if isinstance(r, list)]
-        keyword_tickets = _merge_tickets(valid_results)
-        all_tickets.extend(keyword_tickets)
+        queries.extend(keyword_queries)
 
-    # 2. 태그 검색 처리
+    # 2. 태그 검색 쿼리
     if tags:
         for tag in tags:
             normalized_tag = tag.lower().replace(" ", "-")
-            tag_query = f"type:ticket tags:{normalized_tag} {common_conditions}"
-            tickets = await client.search_tickets(tag_query)
-            all_tickets.extend(tickets)
+            queries.append(f"type:ticket tags:{normalized_tag} {common_conditions}")
 
     # 3. company만 지정된 경우 (keywords, tags 없이)
     if company and not any([keywords, tags]):
-        company_query = f"type:ticket {common_conditions}"
-        tickets = await client.search_tickets(company_query)
-        all_tickets.extend(tickets)
-
-    # 중복 제거
-    all_tickets = _merge_tickets([all_tickets])
-
-    # 제한 적용
-    all_tickets = all_tickets[:limit]
-
-    # 고객사별 그룹핑
-    company_groups = _group_by_company(all_tickets, client)
+        queries.append(f"type:ticket {common_conditions}")
+
+    # 모든 쿼리를 시간 예산 내에서 병렬 실행 (진행 알림에 중간 고객사 순위 포함)
+    progress = ProgressReporter(ctx, labels=lambda t: [client.extract_company_name(t)])
+    progress.start_estimate(lambda q: client.count_tickets(q, deadline=deadline), queries)
+    if local_tickets:
+        await progress.page(local_tickets)
+    results, coverage = await _run_searches(client, queries, deadline, progress)
+    await progress.finish()
+    coverage.indexed_tickets = len(local_tickets)
+
+    # 중복 제거 및 제한 적용
+    try:
+        all_tickets = await _merge_tickets([TicketSpool(tickets=local_tickets), *results], limit)
+    finally:
+        for spool in results:
+            spool.close()
+
+    # 고객사별 그룹핑 (핸들에는 고객사별 전체 티켓 보관)
+    company_groups = group_by_company(all_tickets, client)
 
     # 검색 조건 요약 생성
     search_parts = []
@@ -253,10 +342,30 @@ async def search_tickets(
     if company:
         search_parts.append(f"company='{company}'")
     search_params = ", ".join(search_parts) if search_parts else "전체"
+    period = format_period_string(period_days)
+
+    # 전체 결과 보관 후 첫 페이지만 응답 (캐시 워밍은 검색 결과 캐시만 갱신하고 핸들은 만들지 않음)
+    handle = None
+    if not is_refreshing():
+        handle = await save_result(
+            client.cache,
+            {
+                "search_params": search_params,
+                "period": period,
+                "total_tickets": len(all_tickets),
+                "companies": [group.model_dump(mode="json") for group in company_groups],
+            },
+        )
+    first_page = sample_tickets(company_groups[:page_size])
 
     return SearchResult(
         search_params=search_params,
         total_tickets=len(all_tickets),
-        period=format_period_string(period_days),
-        companies=company_groups,
+        period=period,
+        companies=first_page,
+        total_companies=len(company_groups),
+        handle=handle,
+        next_cursor=next_cursor(0, page_size, len(company_groups)) if handle else None,
+        complete=coverage.completed_queries == coverage.total_queries,
+        coverage=coverage,
     )
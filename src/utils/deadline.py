@@ -0,0 +1,59 @@
+"""
+요청 데드라인(시간 예산) 유틸리티
+
+Tool 호출 단위로 시간 예산을 정하고, 하위 Zendesk API 요청의 타임아웃을
+남은 예산에 맞춰 줄입니다.
+"""
+
+import os
+import time
+
+# 개별 HTTP 요청 최대 타임아웃 (초)
+MAX_REQUEST_TIMEOUT = 30.0
+
+# Tool 호출 기본 시간 예산 (초)
+DEFAULT_DEADLINE_SECONDS = float(os.getenv("ZENDESK_TOOL_DEADLINE_SECONDS", "25"))
+
+
+class DeadlineExceeded(Exception):
+    """시간 예산 초과 (그때까지 수집된 부분 결과 포함)"""
+
+    def __init__(self, partial: list | None = None):
+        super().__init__("Deadline exceeded")
+        self.partial = partial if partial is not None else []
+
+
+class Deadline:
+    """Tool 호출 시간 예산"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def from_seconds(cls, seconds: float | None) -> "Deadline":
+        """
+        시간 예산 생성 (미지정 또는 0 이하이면 서버 기본값 사용)
+
+        Args:
+            seconds: 시간 예산 (초)
+
+        Returns:
+            Deadline 인스턴스
+        """
+        if not seconds or seconds <= 0:
+            seconds = DEFAULT_DEADLINE_SECONDS
+        return cls(seconds)
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 음수 없음)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """시간 예산 소진 여부"""
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float = MAX_REQUEST_TIMEOUT) -> float:
+        """개별 요청에 적용할 타임아웃 (남은 시간과 상한 중 작은 값)"""
+        return min(cap, self.remaining())
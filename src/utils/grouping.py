@@ -0,0 +1,93 @@
+"""
+고객사별 티켓 그룹핑
+
+search_tickets, get_ticket_changes 등 고객사별로 결과를 묶어 반환하는 도구가 공유합니다.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from src.models.schemas import CompanyGroup, TicketInfo
+from src.utils.date_utils import parse_zendesk_datetime
+
+if TYPE_CHECKING:
+    from src.services.zendesk_client import ZendeskClient
+
+# 고객사 그룹 목록 응답에 포함할 고객사당 샘플 티켓 수
+# (전체 목록은 fetch_search_page의 company 지정 조회로 페이지 단위 조회)
+SAMPLE_TICKETS_PER_COMPANY = 10
+
+
+def group_by_company(
+    tickets: list[dict],
+    client: "ZendeskClient",
+    limit_per_company: Optional[int] = None,
+) -> list[CompanyGroup]:
+    """
+    티켓을 고객사별로 그룹핑합니다.
+
+    Args:
+        tickets: 티켓 목록
+        client: Zendesk 클라이언트 (고객사 커스텀 필드 조회)
+        limit_per_company: 각 고객사당 최대 티켓 수 (None이면 전체)
+
+    Returns:
+        고객사별 그룹 목록 (티켓 수 내림차순)
+    """
+    company_tickets: dict[str, list[TicketInfo]] = {}
+    company_total_count: dict[str, int] = {}
+
+    for ticket in tickets:
+        company_name = client.extract_company_name(ticket)
+        if not company_name or company_name == "Unknown":
+            continue
+
+        # 총 티켓 수 카운트
+        company_total_count[company_name] = company_total_count.get(company_name, 0) + 1
+
+        ticket_info = TicketInfo(
+            id=ticket.get("id"),
+            subject=ticket.get("subject", ""),
+            status=ticket.get("status", ""),
+            priority=ticket.get("priority"),
+            created_at=parse_zendesk_datetime(ticket.get("created_at")),
+            updated_at=parse_zendesk_datetime(ticket.get("updated_at")),
+            company_name=company_name,
+        )
+
+        if company_name not in company_tickets:
+            company_tickets[company_name] = []
+
+        # 각 고객사당 티켓 수 제한 (샘플링)
+        if limit_per_company is None or len(company_tickets[company_name]) < limit_per_company:
+            company_tickets[company_name].append(ticket_info)
+
+    # 그룹 생성 및 정렬
+    groups = [
+        CompanyGroup(
+            name=name,
+            ticket_count=company_total_count[name],  # 실제 전체 티켓 수
+            tickets=tickets_list,  # 샘플 티켓 (limit_per_company개)
+        )
+        for name, tickets_list in company_tickets.items()
+    ]
+
+    # 티켓 수 내림차순 정렬
+    groups.sort(key=lambda x: x.ticket_count, reverse=True)
+
+    return groups
+
+
+def sample_tickets(groups: list[CompanyGroup]) -> list[CompanyGroup]:
+    """
+    고객사 그룹별 티켓을 SAMPLE_TICKETS_PER_COMPANY개로 줄인 사본
+
+    Args:
+        groups: 고객사별 그룹 목록 (전체 티켓 포함)
+
+    Returns:
+        샘플 티켓만 포함한 그룹 목록 (ticket_count는 전체 티켓 수 유지)
+    """
+    return [
+        group.model_copy(update={"tickets": group.tickets[:SAMPLE_TICKETS_PER_COMPANY]})
+        for group in groups
+    ]
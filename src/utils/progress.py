@@ -0,0 +1,150 @@
+"""
+도구 진행 알림 유틸리티
+
+긴 스캔 중 MCP 진행 알림(notifications/progress)으로 수집한 페이지/티켓 수,
+예상 전체 티켓 수, 중간 상위 N 스냅샷을 보냅니다. 클라이언트가 진행 토큰
+(progressToken)을 보내지 않으면 아무것도 하지 않습니다 (예상 전체 수 조회도 생략).
+
+진행 알림을 보내다 클라이언트 연결이 끊긴 것을 알게 되면 ClientDisconnected를 발생시키고,
+이후 page() 호출도 같은 예외를 발생시켜 병렬 스캔이 다음 페이지에서 모두 멈추게 합니다.
+도구 호출 단위의 처리는 DisconnectMiddleware가 맡습니다.
+"""
+
+import asyncio
+import os
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable
+
+import anyio
+
+from src.utils.spill import IdSet
+
+if TYPE_CHECKING:
+    from fastmcp import Context
+
+# 진행 알림 최소 간격 (초)
+PROGRESS_INTERVAL_SECONDS = float(os.getenv("MCP_PROGRESS_INTERVAL_SECONDS", "1.0"))
+
+# 중간 스냅샷에 포함할 상위 항목 수
+SNAPSHOT_TOP_N = 5
+
+
+class ClientDisconnected(Exception):
+    """진행 알림 전송 중 클라이언트 연결 종료 확인 (남은 스캔 중단)"""
+
+
+class ProgressReporter:
+    """스캔 진행 상황 집계 및 MCP 진행 알림 전송"""
+
+    def __init__(
+        self,
+        ctx: "Context | None" = None,
+        labels: Callable[[dict[str, Any]], Iterable[str]] | None = None,
+        top_n: int = SNAPSHOT_TOP_N,
+        dedupe: bool = True,
+    ):
+        """
+        Args:
+            ctx: FastMCP 요청 컨텍스트 (None이면 비활성화, 직접 호출/캐시 워머 등)
+            labels: 티켓에서 스냅샷 집계 항목(고객사, 태그 등)을 꺼내는 함수
+            top_n: 스냅샷에 포함할 상위 항목 수
+            dedupe: 여러 쿼리 결과에 중복된 티켓을 한 번만 집계 (티켓 ID 보관)
+        """
+        request = ctx.request_context if ctx is not None else None
+        meta = (request.meta if request is not None else None) or {}
+        self.ctx = ctx
+        self.enabled = meta.get("progressToken") is not None
+        self.pages = 0
+        self.tickets = 0
+        self.total: int | None = None
+        self.labels = labels
+        self.top_n = top_n
+        self._seen: IdSet | None = IdSet() if dedupe else None
+        self._counts: Counter[str] = Counter()
+        self._last_sent = 0.0
+        self._estimate_task: asyncio.Task | None = None
+        self.disconnected = False
+
+    def start_estimate(
+        self, count: Callable[[str], Awaitable[int]], queries: list[str]
+    ) -> None:
+        """
+        예상 전체 티켓 수를 스캔과 동시에 조회 (검색 count API, 쿼리별 합산)
+
+        여러 쿼리의 결과가 겹치면 실제보다 크게 잡히며, 조회 실패는 무시합니다.
+
+        Args:
+            count: 쿼리의 결과 수를 반환하는 함수
+            queries: 검색 쿼리 목록
+        """
+        if self.enabled:
+            self._estimate_task = asyncio.create_task(self._estimate(count, queries))
+
+    async def _estimate(
+        self, count: Callable[[str], Awaitable[int]], queries: list[str]
+    ) -> None:
+        counts = await asyncio.gather(
+            *(count(query) for query in queries), return_exceptions=True
+        )
+        self.total = sum(c for c in counts if isinstance(c, int))
+
+    async def page(self, tickets: list[dict[str, Any]]) -> None:
+        """
+        수집한 페이지 반영 (여러 쿼리에서 중복된 티켓은 한 번만 집계)
+
+        Args:
+            tickets: 페이지의 티켓 목록
+
+        Raises:
+            ClientDisconnected: 클라이언트 연결이 끊긴 경우
+        """
+        if self.disconnected:
+            raise ClientDisconnected()
+        if not self.enabled:
+            return
+        self.pages += 1
+        for ticket in tickets:
+            ticket_id = ticket.get("id")
+            if self._seen is not None and ticket_id and not self._seen.add(ticket_id):
+                continue
+            self.tickets += 1
+            if self.labels:
+                self._counts.update(self.labels(ticket))
+
+        if time.monotonic() - self._last_sent >= PROGRESS_INTERVAL_SECONDS:
+            await self._send()
+
+    async def finish(self) -> None:
+        """마지막 진행 상황 전송 (끝나지 않은 예상치 조회는 취소)"""
+        if self._estimate_task is not None and not self._estimate_task.done():
+            self._estimate_task.cancel()
+        if self.enabled:
+            await self._send()
+
+    def _message(self) -> str:
+        message = f"{self.pages}페이지, 티켓 {self.tickets}건"
+        if self.total is not None:
+            message += f" / 약 {self.total}건"
+        if self._counts:
+            top = ", ".join(
+                f"{name} {count}" for name, count in self._counts.most_common(self.top_n)
+            )
+            message += f" · 상위: {top}"
+        return message
+
+    async def _send(self) -> None:
+        self._last_sent = time.monotonic()
+        # 중복 제거로 수집 수가 예상치를 넘을 수 있으므로 total은 수집 수 이상으로 보정
+        total = max(self.total, self.tickets) if self.total is not None else None
+        try:
+            await self.ctx.report_progress(
+                progress=self.tickets, total=total, message=self._message()
+            )
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            # 클라이언트 연결 종료 - 더 볼 사람이 없으므로 남은 스캔 중단
+            self.enabled = False
+            self.disconnected = True
+            if self._estimate_task is not None:
+                self._estimate_task.cancel()
+            raise ClientDisconnected() from None
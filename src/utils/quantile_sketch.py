@@ -0,0 +1,130 @@
+"""
+스트리밍 분위수 스케치 (KLL)
+
+값을 모두 보관하지 않고 p50/p90 같은 분위수를 근사합니다.
+메모리는 입력 개수와 무관하게 O(k) 수준으로 유지되고, 스케치끼리 병합할 수 있어
+담당자별 스케치를 합쳐 전체 분포를 구할 수 있습니다.
+
+Karnin, Lang, Liberty, "Optimal Quantile Approximation in Streams" (2016)
+"""
+
+import math
+import random
+
+# 기본 정확도 파라미터 (k=200이면 순위 오차 약 1.3%, 입력 k개 이하는 정확한 값)
+DEFAULT_K = 200
+
+# 상위 레벨 대비 하위 레벨 용량 비율
+CAPACITY_RATIO = 2 / 3
+
+
+class KLLSketch:
+    """KLL 분위수 스케치 (병합 가능)"""
+
+    def __init__(self, k: int = DEFAULT_K, seed: int | None = None):
+        """
+        Args:
+            k: 정확도 파라미터 (클수록 정확하고 메모리 증가)
+            seed: 압축 시 난수 시드 (재현 가능한 결과가 필요할 때)
+        """
+        self.k = k
+        self.count = 0
+        self.min: float | None = None
+        self.max: float | None = None
+        # 레벨 h의 항목은 원래 값 2^h개를 대표
+        self._levels: list[list[float]] = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+        self._random = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return int(math.ceil(self.k * CAPACITY_RATIO**depth)) + 1
+
+    def _grow(self) -> None:
+        self._levels.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        """가득 찬 가장 낮은 레벨을 정렬 후 절반만 다음 레벨로 올림"""
+        for level in range(len(self._levels)):
+            items = self._levels[level]
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 == len(self._levels):
+                self._grow()
+
+            items.sort()
+            # 홀수 개면 하나는 현재 레벨에 남김
+            leftover = [items.pop(0)] if len(items) % 2 else []
+            offset = self._random.randint(0, 1)
+            self._levels[level + 1].extend(items[offset::2])
+            self._levels[level] = leftover
+
+            self._size = sum(len(items) for items in self._levels)
+            if self._size < self._max_size:
+                break
+
+    def add(self, value: float) -> None:
+        """값 추가"""
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        self._levels[0].append(value)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """
+        다른 스케치를 병합
+
+        Args:
+            other: 병합할 스케치 (변경되지 않음)
+        """
+        if other.count == 0:
+            return
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+        self._size = sum(len(items) for items in self._levels)
+        while self._size >= self._max_size:
+            self._compress()
+
+    def quantile(self, q: float) -> float | None:
+        """
+        분위수 근사값
+
+        Args:
+            q: 분위 (0.0 ~ 1.0, 예: 0.5 → 중앙값, 0.9 → p90)
+
+        Returns:
+            근사 분위수 (값이 없으면 None)
+        """
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        weighted = sorted(
+            (value, 1 << level) for level, items in enumerate(self._levels) for value in items
+        )
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return self.max
+
+    def __len__(self) -> int:
+        return self.count
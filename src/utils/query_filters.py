@@ -4,6 +4,8 @@
 공통으로 적용되는 티켓 제외 조건 정의
 """
 
+import os
+
 # 검색에서 제외할 조건들
 EXCLUDED_CC_EMAILS = ["alarm@saltware.co.kr"]
 EXCLUDED_TAGS = ["matrixtalk", "proactive-phd"]
@@ -12,11 +14,11 @@ EXCLUDED_COMPANIES = ["솔트웨어"]
 # 제목에 포함된 경우 제외할 문자열 (쿼리 단에서 필터링)
 EXCLUDED_SUBJECT_KEYWORDS = ["PHD_"]
 
-# 요청 회사 커스텀 필드 ID
-COMPANY_FIELD_ID = "360028549453"
+# 요청 회사 커스텀 필드 ID (기본 테넌트, 테넌트별 값은 ZENDESK_TENANTS의 company_field_id)
+COMPANY_FIELD_ID = os.getenv("ZENDESK_COMPANY_FIELD_ID", "360028549453")
 
 
-def get_exclusion_query() -> str:
+def get_exclusion_query(company_field_id: str = COMPANY_FIELD_ID) -> str:
     """
     검색 쿼리에 추가할 제외 조건 문자열을 반환합니다.
 
@@ -26,6 +28,9 @@ def get_exclusion_query() -> str:
     - 특정 요청 회사의 티켓
     - 특정 문자열이 제목에 포함된 티켓
 
+    Args:
+        company_field_id: 테넌트의 요청 회사 커스텀 필드 ID
+
     Returns:
         Zendesk 검색 쿼리에 추가할 제외 조건 문자열
     """
@@ -41,7 +46,7 @@ def get_exclusion_query() -> str:
 
     # 요청 회사 제외
     for company in EXCLUDED_COMPANIES:
-        exclusions.append(f"-custom_field_{COMPANY_FIELD_ID}:{company}")
+        exclusions.append(f"-custom_field_{company_field_id}:{company}")
 
     # 제목 키워드 제외
     for keyword in EXCLUDED_SUBJECT_KEYWORDS:
@@ -0,0 +1,241 @@
+"""
+메모리 예산 기반 티켓 보관 (임시 파일로 내보내기)
+
+긴 기간을 스캔하면 수집한 티켓 dict가 모두 메모리에 남아 작은 컨테이너에서 OOM으로
+종료될 수 있습니다. 요청마다 메모리 예산(MemoryBudget)을 두고, 예산을 넘은 스캔의
+페이지는 압축(zlib JSON)하여 임시 파일에 쓴 뒤 집계할 때 페이지 묶음 단위로 다시 읽습니다.
+
+- TicketSpool: 페이지 단위 추가/순회, 예산 초과 시 임시 파일로 이동
+- IdSet: 중복 제거용 정수 집합 (정렬된 array 묶음, ID당 약 8바이트)
+- peak_rss_mb(): 프로세스 최대 RSS (메트릭용)
+"""
+
+import array
+import asyncio
+import bisect
+import heapq
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from typing import IO, Any, AsyncIterator
+
+# 요청당 스캔 메모리 예산 (MB, 0이면 제한 없음)
+SCAN_MEMORY_BUDGET_MB = float(os.getenv("ZENDESK_SCAN_MEMORY_BUDGET_MB", "64"))
+
+# 임시 파일 디렉토리 (미설정 시 시스템 임시 디렉토리)
+SPILL_DIR = os.getenv("ZENDESK_SPILL_DIR") or None
+
+# JSON 크기 대비 Python 객체 메모리 배율 (dict/str 오버헤드 추정치)
+OBJECT_OVERHEAD_RATIO = 4
+
+# 압축 수준 (속도 우선)
+COMPRESS_LEVEL = 1
+
+# IdSet이 정렬 배열로 옮기기 전까지 set에 모아 두는 ID 수
+ID_BUFFER_SIZE = 4096
+
+# 임시 파일 레코드 헤더 (압축된 페이지 묶음 길이)
+_RECORD_HEADER = struct.Struct("<I")
+
+# 프로세스 누적 통계 (메트릭용)
+_stats = {"spilled_scans": 0, "spilled_bytes": 0}
+
+
+def _encode(tickets: list[dict[str, Any]]) -> bytes:
+    return json.dumps(tickets, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class MemoryBudget:
+    """요청 하나의 스캔 메모리 예산 (같은 요청의 여러 TicketSpool이 공유)"""
+
+    def __init__(self, megabytes: float | None = None):
+        """
+        Args:
+            megabytes: 예산 (MB, None이면 ZENDESK_SCAN_MEMORY_BUDGET_MB, 0이면 제한 없음)
+        """
+        megabytes = SCAN_MEMORY_BUDGET_MB if megabytes is None else megabytes
+        self.limit = int(megabytes * 1024 * 1024)
+        self.used = 0
+
+    @property
+    def exceeded(self) -> bool:
+        return self.limit > 0 and self.used > self.limit
+
+
+class TicketSpool:
+    """
+    스캔한 티켓 보관
+
+    예산 안에서는 리스트로 보관하고, 예산을 넘으면 모아 둔 티켓과 이후 페이지를
+    임시 파일에 씁니다. 파일은 close() 또는 객체 해제 시 삭제됩니다.
+    """
+
+    def __init__(
+        self,
+        budget: MemoryBudget | None = None,
+        tickets: list[dict[str, Any]] | None = None,
+    ):
+        """
+        Args:
+            budget: 메모리 예산 (None이면 기본 예산을 단독 사용)
+            tickets: 이미 메모리에 있는 티켓 목록 (캐시된 결과 등, 예산에 포함하지 않음)
+        """
+        self.budget = budget or MemoryBudget()
+        self._tickets: list[dict[str, Any]] = tickets if tickets is not None else []
+        self._count = len(self._tickets)
+        self._charged = 0
+        self._file: IO[bytes] | None = None
+        self.spilled_bytes = 0
+
+    @property
+    def spilled(self) -> bool:
+        """임시 파일 사용 여부"""
+        return self._file is not None
+
+    @property
+    def tickets(self) -> list[dict[str, Any]]:
+        """메모리에 있는 티켓 목록 (spilled이면 파일에 쓰지 않은 나머지만)"""
+        return self._tickets
+
+    def __len__(self) -> int:
+        return self._count
+
+    async def add(self, tickets: list[dict[str, Any]]) -> None:
+        """
+        페이지 추가
+
+        Args:
+            tickets: 페이지의 티켓 목록
+        """
+        if not tickets:
+            return
+        self._count += len(tickets)
+        if self._file is not None:
+            await asyncio.to_thread(self._write, tickets)
+            return
+
+        self._tickets.extend(tickets)
+        size = len(_encode(tickets)) * OBJECT_OVERHEAD_RATIO
+        self._charged += size
+        self.budget.used += size
+        if self.budget.exceeded:
+            # 모아 둔 티켓을 파일로 옮기고 예산 반환
+            await asyncio.to_thread(self._write, self._tickets)
+            self._tickets = []
+            self._release()
+            _stats["spilled_scans"] += 1
+
+    async def chunks(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """보관한 티켓을 페이지 묶음 단위로 순회 (추가한 순서)"""
+        offset = 0
+        while self._file is not None:
+            chunk, offset = await asyncio.to_thread(self._read, offset)
+            if chunk is None:
+                break
+            yield chunk
+        if self._tickets:
+            yield self._tickets
+
+    async def to_list(self) -> list[dict[str, Any]]:
+        """전체 티켓 목록 (spilled이면 파일 내용을 모두 메모리로 읽음)"""
+        if self._file is None:
+            return self._tickets
+        return [ticket async for chunk in self.chunks() for ticket in chunk]
+
+    def close(self) -> None:
+        """임시 파일 삭제 및 예산 반환"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._tickets = []
+        self._count = 0
+        self._release()
+
+    def _release(self) -> None:
+        self.budget.used -= self._charged
+        self._charged = 0
+
+    def _write(self, tickets: list[dict[str, Any]]) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="zendesk-spool-", dir=SPILL_DIR)
+        data = zlib.compress(_encode(tickets), COMPRESS_LEVEL)
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(_RECORD_HEADER.pack(len(data)))
+        self._file.write(data)
+        written = _RECORD_HEADER.size + len(data)
+        self.spilled_bytes += written
+        _stats["spilled_bytes"] += written
+
+    def _read(self, offset: int) -> tuple[list[dict[str, Any]] | None, int]:
+        self._file.seek(offset)
+        header = self._file.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            return None, offset
+        (length,) = _RECORD_HEADER.unpack(header)
+        data = self._file.read(length)
+        return json.loads(zlib.decompress(data)), offset + _RECORD_HEADER.size + length
+
+
+class IdSet:
+    """
+    중복 제거용 정수 ID 집합
+
+    최근 추가된 ID는 set에 모으고, ID_BUFFER_SIZE개가 쌓이면 정렬된 array('q')
+    묶음으로 옮깁니다. 묶음은 크기가 비슷해지면 병합하므로 묶음 수는 O(log n)입니다.
+    """
+
+    def __init__(self):
+        self._recent: set[int] = set()
+        self._runs: list[array.array] = []
+
+    def __contains__(self, value: int) -> bool:
+        if value in self._recent:
+            return True
+        for run in self._runs:
+            i = bisect.bisect_left(run, value)
+            if i < len(run) and run[i] == value:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._recent) + sum(len(run) for run in self._runs)
+
+    def add(self, value: int) -> bool:
+        """
+        ID 추가
+
+        Returns:
+            새로 추가되었으면 True (이미 있으면 False)
+        """
+        if value in self:
+            return False
+        self._recent.add(value)
+        if len(self._recent) >= ID_BUFFER_SIZE:
+            self._flush()
+        return True
+
+    def _flush(self) -> None:
+        run = array.array("q", sorted(self._recent))
+        self._recent.clear()
+        while self._runs and len(self._runs[-1]) <= 2 * len(run):
+            run = array.array("q", heapq.merge(self._runs.pop(), run))
+        self._runs.append(run)
+
+
+def peak_rss_mb() -> float | None:
+    """프로세스 최대 RSS (MB, 지원하지 않는 플랫폼이면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def spill_stats() -> dict[str, Any]:
+    """메트릭용 통계 (최대 RSS, 임시 파일로 옮긴 스캔 수/바이트)"""
+    return {"peak_rss_mb": peak_rss_mb(), **_stats}
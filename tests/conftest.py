@@ -0,0 +1,51 @@
+"""
+공용 테스트 픽스처
+
+Zendesk API는 httpx.MockTransport로 대체하고, 프로세스 단위 캐시/테넌트 레지스트리는
+테스트마다 새로 만듭니다.
+"""
+
+import asyncio
+import os
+from typing import Callable
+
+import httpx
+import pytest
+
+os.environ.setdefault("ZENDESK_SUBDOMAIN", "test")
+os.environ.setdefault("ZENDESK_EMAIL", "agent@example.com")
+os.environ.setdefault("ZENDESK_API_TOKEN", "test-token")
+
+from src.services import cache as cache_module  # noqa: E402
+from src.services import tenants as tenants_module  # noqa: E402
+from src.services.cache import TTLCache  # noqa: E402
+from src.services.tenants import Tenant  # noqa: E402
+
+API_BASE_URL = "https://test.zendesk.test/api/v2"
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """공용 캐시와 테넌트 레지스트리 초기화"""
+    monkeypatch.setattr(cache_module, "_cache", TTLCache())
+    monkeypatch.setattr(tenants_module, "_registry", None)
+
+
+@pytest.fixture
+def tenant() -> Tenant:
+    return Tenant(
+        name="test",
+        subdomain="test",
+        email="agent@example.com",
+        api_token="test-token",
+        api_base_url=API_BASE_URL,
+        cache_prefix="",
+    )
+
+
+def install_transport(
+    tenant: Tenant, handler: Callable[[httpx.Request], httpx.Response]
+) -> None:
+    """테넌트 연결 풀을 MockTransport로 교체 (실행 중인 이벤트 루프 안에서 호출)"""
+    tenant._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    tenant._http_loop = asyncio.get_running_loop()
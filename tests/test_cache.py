@@ -0,0 +1,76 @@
+import asyncio
+
+from src.services.cache import NamespacedCache, TTLCache
+
+
+async def test_ttl_cache_expires_entries():
+    cache = TTLCache()
+    await cache.set("a", 1, ttl=0.01)
+    await asyncio.sleep(0.02)
+    assert await cache.get("a") is None
+    assert await cache.ttl("a") is None
+
+
+async def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1  # a를 최근 사용으로 이동
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert len(cache._entries) == 2
+
+
+async def test_ttl_cache_evicts_expired_entries_first():
+    cache = TTLCache(max_entries=2)
+    await cache.set("expired", 1, ttl=0.01)
+    await cache.set("b", 2)
+    await asyncio.sleep(0.02)
+    await cache.set("c", 3)
+
+    assert await cache.get("b") == 2
+    assert await cache.get("c") == 3
+
+
+async def test_namespaced_cache_ttl_and_keys():
+    backend = TTLCache()
+    cache = NamespacedCache(backend, "tenant:a:")
+    await cache.set("search:1", {"results": []}, ttl=30)
+
+    assert await cache.keys("search:") == ["search:1"]
+    assert 0 < await cache.ttl("search:1") <= 30
+    assert await backend.get("search:1") is None
+
+
+async def test_get_or_compute_runs_once_and_skips_none():
+    cache = TTLCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+    assert calls == 1
+    assert all(result == {"value": 1} for result in results)
+
+    async def compute_none():
+        return None
+
+    assert await cache.get_or_compute("none", compute_none) is None
+    assert await cache.get("none") is None
+
+
+async def test_namespaced_get_many_and_set_many():
+    backend = TTLCache()
+    cache = NamespacedCache(backend, "tenant:a:")
+    await cache.set_many({"k1": 1, "k2": 2}, ttl=30)
+
+    assert await cache.get_many(["k1", "k2", "k3"]) == {"k1": 1, "k2": 2}
+    assert await backend.get_many(["tenant:a:k1"]) == {"tenant:a:k1": 1}
+    assert cache.in_process
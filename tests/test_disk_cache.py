@@ -0,0 +1,59 @@
+import sqlite3
+
+from src.services.disk_cache import DiskCache
+
+
+def _stored_size(path: str) -> tuple[int, int]:
+    conn = sqlite3.connect(path)
+    try:
+        (tracked,) = conn.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()
+        (actual,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+    finally:
+        conn.close()
+    return tracked, actual
+
+
+async def test_total_size_tracks_writes_overwrites_and_deletes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = DiskCache(path)
+    await cache.set("a", {"value": "x" * 100}, 60)
+    await cache.set("b", [1, 2, 3], 60)
+    await cache.set("a", "short", 60)
+    await cache.delete("b")
+
+    tracked, actual = _stored_size(path)
+    assert tracked == actual > 0
+    assert (await cache.get("a"))[0] == "short"
+
+    await cache.clear()
+    assert _stored_size(path) == (0, 0)
+
+
+async def test_total_size_is_seeded_for_existing_database(tmp_path):
+    path = str(tmp_path / "cache.db")
+    await DiskCache(path).set("a", "value", 60)
+
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TABLE meta")
+    conn.close()
+
+    cache = DiskCache(path)
+    await cache.set("b", "value", 60)
+    tracked, actual = _stored_size(path)
+    assert tracked == actual > 0
+
+
+async def test_eviction_removes_least_recently_used(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = DiskCache(path, max_bytes=2000)
+    for i in range(10):
+        await cache.set(f"k{i}", f"{i}-" + "".join(chr(0x4E00 + j * 7 + i) for j in range(100)), 60)
+        if i >= 1:
+            # k0은 계속 사용 중
+            await cache.get("k0")
+
+    tracked, actual = _stored_size(path)
+    assert tracked == actual <= 2000
+    assert await cache.get("k0") is not None
+    assert await cache.get("k1") is None
+    assert await cache.get("k9") is not None
@@ -0,0 +1,99 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import anyio
+import httpx
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from src.services.tenants import use_tenant
+from src.tools.get_service_trends import get_service_trends
+from src.utils.progress import ClientDisconnected, ProgressReporter
+from tests.conftest import install_transport
+
+
+class FakeContext:
+    def __init__(self, progress_token: str | None = "token", closed: bool = False):
+        self.request_context = SimpleNamespace(meta={"progressToken": progress_token})
+        self.closed = closed
+        self.sent: list[tuple] = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        if self.closed:
+            raise anyio.ClosedResourceError()
+        self.sent.append((progress, total, message))
+
+
+async def test_progress_disabled_without_token_skips_estimate():
+    counted = []
+
+    async def count(query: str) -> int:
+        counted.append(query)
+        return 10
+
+    for ctx in (None, FakeContext(progress_token=None)):
+        progress = ProgressReporter(ctx)
+        progress.start_estimate(count, ["q"])
+        await progress.page([{"id": 1}])
+        await progress.finish()
+        assert progress.tickets == 0
+    await asyncio.sleep(0)
+    assert counted == []
+
+
+async def test_progress_reports_deduplicated_tickets(monkeypatch):
+    monkeypatch.setattr("src.utils.progress.PROGRESS_INTERVAL_SECONDS", 0)
+    ctx = FakeContext()
+    progress = ProgressReporter(ctx, labels=lambda t: [t["company"]])
+
+    await progress.page([{"id": 1, "company": "a"}, {"id": 2, "company": "b"}])
+    await progress.page([{"id": 2, "company": "b"}, {"id": 3, "company": "a"}])
+    await progress.finish()
+
+    assert progress.tickets == 3
+    assert ctx.sent[-1][0] == 3
+    assert "a 2" in ctx.sent[-1][2]
+
+
+async def test_disconnect_raises_instead_of_cancelling_current_task():
+    progress = ProgressReporter(FakeContext(closed=True))
+
+    with pytest.raises(ClientDisconnected):
+        await progress.page([{"id": 1}])
+    # 병렬 스캔의 다음 페이지도 중단
+    with pytest.raises(ClientDisconnected):
+        await progress.page([{"id": 2}])
+
+    # 현재 작업은 취소되지 않음
+    await asyncio.sleep(0)
+    assert not asyncio.current_task().cancelled()
+
+
+@pytest.mark.parametrize("ctx", [None, FakeContext(progress_token=None)])
+async def test_tool_skips_count_without_progress_token(tenant, ctx):
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(200, json={"results": [], "count": 0, "next_page": None})
+
+    install_transport(tenant, handler)
+    with use_tenant(tenant):
+        await get_service_trends(period_days=7, limit=10, deadline_seconds=None, ctx=ctx)
+
+    assert requested == ["/api/v2/search.json"]
+
+
+async def test_disconnect_becomes_tool_error(monkeypatch):
+    def disconnected_tool(*args, **kwargs):
+        raise ClientDisconnected()
+
+    from src.mcp_app import mcp
+
+    module = sys.modules["src.tools.get_service_trends"]
+    monkeypatch.setattr(module, "ZendeskClient", disconnected_tool)
+    async with Client(mcp) as client:
+        with pytest.raises(ToolError, match="Client disconnected"):
+            await client.call_tool("get_service_trends", {"period_days": 7})
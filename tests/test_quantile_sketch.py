@@ -0,0 +1,42 @@
+from src.utils.quantile_sketch import KLLSketch
+
+
+def test_empty_sketch_has_no_quantiles():
+    sketch = KLLSketch()
+    assert len(sketch) == 0
+    assert sketch.quantile(0.5) is None
+
+
+def test_small_input_is_exact():
+    sketch = KLLSketch()
+    for value in [5, 1, 4, 2, 3]:
+        sketch.add(value)
+
+    assert len(sketch) == 5
+    assert sketch.quantile(0) == 1
+    assert sketch.quantile(0.5) == 3
+    assert sketch.quantile(1) == 5
+
+
+def test_large_input_stays_within_rank_error():
+    sketch = KLLSketch(k=100, seed=1)
+    n = 20000
+    for value in range(n):
+        sketch.add(value)
+
+    assert len(sketch) == n
+    assert sum(len(items) for items in sketch._levels) < n // 10
+    for q in (0.1, 0.5, 0.9):
+        assert abs(sketch.quantile(q) - q * n) < 0.05 * n
+
+
+def test_merge_matches_combined_stream():
+    left, right = KLLSketch(seed=1), KLLSketch(seed=2)
+    for value in range(5000):
+        (left if value % 2 else right).add(value)
+    left.merge(right)
+
+    assert len(left) == 5000
+    assert left.quantile(0) == 0
+    assert left.quantile(1) == 4999
+    assert abs(left.quantile(0.5) - 2500) < 250
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from src.services import redis_cache
+from src.services.redis_cache import RedisCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class UnreachableRedis:
+    """모든 명령이 연결 오류를 내는 클라이언트"""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise ConnectionError("connection refused")
+
+        return fail
+
+    async def scan_iter(self, match=None):
+        raise ConnectionError("connection refused")
+        yield
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture
+def cache(client) -> RedisCache:
+    return RedisCache(client, prefix="test:")
+
+
+async def test_set_get_delete_roundtrip(cache, client):
+    await cache.set("tickets:1", {"id": 1, "subject": "한글"}, ttl=30)
+
+    assert await cache.get("tickets:1") == {"id": 1, "subject": "한글"}
+    assert await client.exists("test:tickets:1")
+    assert 0 < await cache.ttl("tickets:1") <= 30
+
+    await cache.delete("tickets:1")
+    assert await cache.get("tickets:1") is None
+    assert await cache.ttl("tickets:1") is None
+
+
+async def test_keys_strips_prefix_and_escapes_glob(cache):
+    await cache.set("search:a", 1)
+    await cache.set("search:[b]", 2)
+    await cache.set("users:1", 3)
+
+    assert sorted(await cache.keys("search:")) == ["search:[b]", "search:a"]
+    assert await cache.keys("search:[") == ["search:[b]"]
+
+
+async def test_lock_is_released_by_owner(cache, client):
+    async with cache.lock("k", timeout=1) as acquired:
+        assert acquired
+        assert await client.get("test:lock:k") is not None
+    assert await client.get("test:lock:k") is None
+
+
+async def test_lock_release_keeps_lock_taken_over_by_another_worker(cache, client):
+    async with cache.lock("k", timeout=1) as acquired:
+        assert acquired
+        # 잠금 TTL 만료 후 다른 워커가 다시 잡은 상황
+        await client.set("test:lock:k", "other-worker")
+    assert await client.get("test:lock:k") == b"other-worker"
+
+
+async def test_lock_times_out_while_held_elsewhere(cache, client, monkeypatch):
+    monkeypatch.setattr(redis_cache, "LOCK_POLL_INTERVAL", 0.01)
+    await client.set("test:lock:k", "other-worker")
+
+    async with cache.lock("k", timeout=0.05) as acquired:
+        assert not acquired
+
+
+async def test_get_or_compute_shares_result_across_workers(client):
+    workers = [RedisCache(client, prefix="test:") for _ in range(3)]
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"value": 42}
+
+    results = await asyncio.gather(*(w.get_or_compute("search:q", compute) for w in workers))
+    assert calls == 1
+    assert results == [{"value": 42}] * 3
+
+
+async def test_unreachable_redis_falls_back_to_computing(caplog):
+    cache = RedisCache(UnreachableRedis(), prefix="test:")
+
+    assert await cache.get("k") is None
+    await cache.set("k", 1)
+    await cache.delete("k")
+    assert await cache.ttl("k") is None
+    assert await cache.keys() == []
+
+    async def compute():
+        return {"value": 1}
+
+    assert await cache.get_or_compute("k", compute, wait_timeout=1) == {"value": 1}
+    assert "Redis GET failed" in caplog.text
+
+
+async def test_get_many_and_set_many(cache):
+    await cache.set_many({"a": 1, "b": {"x": "한글"}}, ttl=30)
+
+    assert await cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"x": "한글"}}
+    assert await cache.get_many([]) == {}
+    assert 0 < await cache.ttl("b") <= 30
+
+
+async def test_get_many_survives_unreachable_redis():
+    cache = RedisCache(UnreachableRedis(), prefix="test:")
+    assert await cache.get_many(["a"]) == {}
@@ -0,0 +1,103 @@
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from src.services.result_handles import (
+    decode_cursor,
+    encode_cursor,
+    load_result,
+    next_cursor,
+    save_result,
+)
+from src.services.tenants import current_tenant
+
+
+def test_cursor_roundtrip():
+    assert decode_cursor(None) == 0
+    assert decode_cursor(encode_cursor(40)) == 40
+    with pytest.raises(ValueError):
+        decode_cursor("-1")
+
+
+def test_next_cursor_advances_until_last_page():
+    assert next_cursor(0, 20, 45) == "20"
+    assert next_cursor(40, 20, 45) is None
+    assert next_cursor(0, 20, 20) is None
+
+
+def test_next_cursor_never_repeats_offset():
+    assert next_cursor(0, 0, 45) is None
+    assert next_cursor(10, -5, 45) is None
+
+
+async def test_save_and_load_result():
+    cache = current_tenant().cache
+    handle = await save_result(cache, {"companies": []})
+    assert await load_result(cache, handle) == {"companies": []}
+    assert await load_result(cache, "missing") is None
+
+
+async def _fetch_page(**args):
+    from src.mcp_app import mcp
+
+    async with Client(mcp) as client:
+        return await client.call_tool("fetch_search_page", args)
+
+
+async def _save_groups(*names: str) -> str:
+    return await save_result(
+        current_tenant().cache,
+        {
+            "search_params": "keywords: test",
+            "period": "최근 30일",
+            "total_tickets": len(names),
+            "companies": [{"name": name, "ticket_count": 1, "tickets": []} for name in names],
+        },
+    )
+
+
+@pytest.mark.parametrize("page_size", [0, -1, 101])
+async def test_fetch_search_page_rejects_invalid_page_size(page_size):
+    handle = await _save_groups("a", "b")
+    with pytest.raises(ToolError, match="page_size"):
+        await _fetch_page(handle=handle, page_size=page_size)
+
+
+async def test_fetch_search_page_pages_through_groups():
+    handle = await _save_groups("a", "b", "c")
+
+    first = await _fetch_page(handle=handle, page_size=2)
+    assert [c["name"] for c in first.structured_content["companies"]] == ["a", "b"]
+    assert first.structured_content["next_cursor"] == "2"
+
+    last = await _fetch_page(handle=handle, page_size=2, cursor="2")
+    assert [c["name"] for c in last.structured_content["companies"]] == ["c"]
+    assert last.structured_content["next_cursor"] is None
+
+
+async def test_fetch_search_page_samples_groups_but_not_company_drill_down():
+    tickets = [
+        {"id": i, "subject": f"ticket {i}", "status": "open", "company_name": "a"}
+        for i in range(1, 26)
+    ]
+    handle = await save_result(
+        current_tenant().cache,
+        {
+            "search_params": "keywords: test",
+            "period": "최근 30일",
+            "total_tickets": len(tickets),
+            "companies": [
+                {"name": "z", "ticket_count": 1, "tickets": []},
+                {"name": "a", "ticket_count": len(tickets), "tickets": tickets},
+            ],
+        },
+    )
+
+    groups = await _fetch_page(handle=handle, cursor="1")
+    group = groups.structured_content["companies"][0]
+    assert group["ticket_count"] == 25
+    assert [t["id"] for t in group["tickets"]] == list(range(1, 11))
+
+    company = await _fetch_page(handle=handle, company="a", page_size=20)
+    assert len(company.structured_content["companies"][0]["tickets"]) == 20
+    assert company.structured_content["next_cursor"] == "20"
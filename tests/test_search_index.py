@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services import search_index as search_index_module
+from src.services.cache import TTLCache
+from src.services.search_index import SearchIndex, get_search_index
+from src.services.tenants import use_tenant
+from src.services.webhooks import apply_event
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "index.db")
+    monkeypatch.setattr(search_index_module, "SEARCH_INDEX_PATH", path)
+    monkeypatch.setattr(search_index_module, "_indexes", {})
+    return path
+
+
+async def test_coverage_expires_after_ttl(index_path):
+    index = SearchIndex(index_path, coverage_ttl=60)
+    await index.mark_covered("2026-09-01", NOW - timedelta(minutes=5))
+    assert await index.covered_until("2026-09-01") is None
+
+    await index.mark_covered("2026-09-01", NOW)
+    assert await index.covered_until("2026-09-01") == NOW
+    assert await index.covered_until("2026-08-01") is None
+
+
+async def test_coverage_ttl_depends_on_webhook_secret(index_path, tenant):
+    with use_tenant(tenant):
+        assert get_search_index().coverage_ttl is not None
+
+    search_index_module._indexes.clear()
+    tenant.webhook_secret = "secret"
+    with use_tenant(tenant):
+        assert get_search_index().coverage_ttl is None
+
+
+async def test_created_ticket_event_truncates_coverage(index_path, tenant):
+    created_at = NOW - timedelta(hours=1)
+    tenant.webhook_secret = "secret"
+    with use_tenant(tenant):
+        index = get_search_index()
+        await index.mark_covered("2026-09-01", NOW)
+        stats = await apply_event(
+            TTLCache(),
+            {
+                "type": "zen:event-type:ticket.created",
+                "detail": {"id": "7", "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ")},
+            },
+        )
+
+        assert stats["coverage_truncated"] == 1
+        assert await index.covered_until("2026-09-01") == created_at.replace(microsecond=0)
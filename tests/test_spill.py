@@ -0,0 +1,106 @@
+import httpx
+
+from src.services.tenants import use_tenant
+from src.tools.get_service_trends import get_service_trends
+from src.utils import spill
+from src.utils.spill import IdSet, MemoryBudget, TicketSpool
+from tests.conftest import API_BASE_URL, install_transport
+
+
+def _tickets(start: int, count: int) -> list[dict]:
+    return [{"id": i, "subject": f"ticket {i}"} for i in range(start, start + count)]
+
+
+async def test_spool_within_budget_stays_in_memory():
+    budget = MemoryBudget(1)
+    spool = TicketSpool(budget)
+    await spool.add(_tickets(1, 3))
+    await spool.add([])
+
+    assert not spool.spilled
+    assert len(spool) == 3
+    assert [t["id"] for t in await spool.to_list()] == [1, 2, 3]
+    spool.close()
+    assert budget.used == 0
+
+
+async def test_spool_spills_over_budget_and_keeps_order():
+    budget = MemoryBudget(0.001)
+    spool = TicketSpool(budget)
+    for start in range(1, 100, 10):
+        await spool.add(_tickets(start, 10))
+
+    assert spool.spilled
+    assert spool.spilled_bytes > 0
+    assert budget.used == 0
+    assert len(spool) == 100
+    chunks = [chunk async for chunk in spool.chunks()]
+    assert len(chunks) > 1
+    assert [t["id"] for chunk in chunks for t in chunk] == list(range(1, 101))
+    spool.close()
+    assert [chunk async for chunk in spool.chunks()] == []
+
+
+async def test_spools_share_request_budget():
+    budget = MemoryBudget(0.001)
+    first, second = TicketSpool(budget), TicketSpool(budget)
+    await first.add(_tickets(1, 5))
+    await second.add(_tickets(6, 20))
+
+    assert not first.spilled
+    assert second.spilled
+    first.close()
+    second.close()
+    assert budget.used == 0
+
+
+async def test_zero_budget_never_spills():
+    spool = TicketSpool(MemoryBudget(0))
+    await spool.add(_tickets(1, 500))
+    assert not spool.spilled
+    assert len(spool) == 500
+
+
+def test_id_set_deduplicates_across_flushed_runs(monkeypatch):
+    monkeypatch.setattr(spill, "ID_BUFFER_SIZE", 4)
+    ids = IdSet()
+
+    assert all(ids.add(i) for i in range(50))
+    assert not any(ids.add(i) for i in range(0, 50, 7))
+    assert len(ids) == 50
+    assert 0 in ids and 49 in ids
+    assert 50 not in ids and -1 not in ids
+
+
+async def test_service_trends_aggregates_spilled_scan(tenant, monkeypatch):
+    monkeypatch.setattr(spill, "SCAN_MEMORY_BUDGET_MB", 0.001)
+    per_page, total = 10, 40
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        start = (page - 1) * per_page
+        results = [
+            {"id": i, "tags": ["monitoring"] if i % 2 else ["security"]}
+            for i in range(start + 1, min(start + per_page, total) + 1)
+        ]
+        has_next = start + per_page < total
+        return httpx.Response(
+            200,
+            json={
+                "results": results,
+                "count": total,
+                "next_page": f"{API_BASE_URL}/search.json?page={page + 1}" if has_next else None,
+            },
+        )
+
+    install_transport(tenant, handler)
+    spilled_before = spill.spill_stats()["spilled_scans"]
+    with use_tenant(tenant):
+        result = await get_service_trends(period_days=7, limit=10, deadline_seconds=None, ctx=None)
+
+    assert spill.spill_stats()["spilled_scans"] > spilled_before
+    assert result.total_tickets == total
+    assert {s.category: s.ticket_count for s in result.services} == {
+        "monitoring": 20,
+        "security": 20,
+    }
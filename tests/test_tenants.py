@@ -0,0 +1,61 @@
+import pytest
+
+from src.services.tenants import Tenant, TenantError, TenantRegistry, parse_bearer_token
+
+
+def _tenant(name: str, tokens: list[str] | None = None) -> Tenant:
+    return Tenant(name=name, subdomain=name, email="a@example.com", api_token="t", tokens=tokens)
+
+
+def test_single_tenant_without_tokens_needs_no_token():
+    registry = TenantRegistry([_tenant("acme")], default="acme")
+    assert registry.resolve().name == "acme"
+    assert registry.resolve("acme").name == "acme"
+
+
+def test_token_selects_tenant():
+    registry = TenantRegistry([_tenant("acme", ["a-token"]), _tenant("globex", ["g-token"])])
+    assert registry.resolve(token="g-token").name == "globex"
+    assert registry.resolve("acme", "a-token").name == "acme"
+
+
+def test_header_requires_matching_token():
+    registry = TenantRegistry([_tenant("acme", ["a-token"]), _tenant("globex", ["g-token"])])
+    with pytest.raises(TenantError, match="Access denied"):
+        registry.resolve("acme")
+    with pytest.raises(TenantError, match="Access denied"):
+        registry.resolve("acme", "g-token")
+
+
+def test_multi_tenant_rejects_header_only_selection():
+    registry = TenantRegistry([_tenant("acme"), _tenant("globex", ["g-token"])], default="acme")
+    with pytest.raises(TenantError, match="ZENDESK_ALLOW_TENANT_HEADER_ONLY"):
+        registry.resolve("acme")
+    with pytest.raises(TenantError, match="Access denied"):
+        registry.resolve()
+
+
+def test_header_only_selection_is_opt_in():
+    registry = TenantRegistry(
+        [_tenant("acme"), _tenant("globex", ["g-token"])],
+        default="acme",
+        allow_header_only=True,
+    )
+    assert registry.resolve("acme").name == "acme"
+    assert registry.resolve().name == "acme"
+    with pytest.raises(TenantError):
+        registry.resolve("globex")
+
+
+def test_unknown_tenant():
+    registry = TenantRegistry([_tenant("acme"), _tenant("globex")], allow_header_only=True)
+    with pytest.raises(TenantError, match="Unknown tenant"):
+        registry.resolve("initech")
+    with pytest.raises(TenantError, match="No tenant selected"):
+        registry.resolve()
+
+
+def test_parse_bearer_token():
+    assert parse_bearer_token("Bearer abc ") == "abc"
+    assert parse_bearer_token("Basic abc") is None
+    assert parse_bearer_token(None) is None
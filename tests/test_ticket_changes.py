@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from src.services.change_cursors import (
+    CHANGE_OVERLAP_SECONDS,
+    ChangeCursor,
+    cursor_key,
+    format_search_datetime,
+)
+from src.services.tenants import use_tenant
+from src.services.zendesk_client import ZendeskClient
+from src.tools.get_ticket_changes import get_ticket_changes
+from src.utils.grouping import group_by_company
+from tests.conftest import install_transport
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _ticket(ticket_id: int, updated: datetime, company: str, field_id: str) -> dict:
+    stamp = format_search_datetime(updated)
+    return {
+        "id": ticket_id,
+        "subject": f"ticket {ticket_id}",
+        "status": "open",
+        "created_at": stamp,
+        "updated_at": stamp,
+        "custom_fields": [{"id": int(field_id), "value": company}],
+    }
+
+
+def test_cursor_skips_delivered_versions_in_overlap():
+    cursor = ChangeCursor(NOW - timedelta(hours=1))
+    ticket = {"id": 1, "updated_at": format_search_datetime(NOW)}
+    old = {"id": 2, "updated_at": format_search_datetime(cursor.search_since)}
+
+    assert cursor.is_new(ticket)
+    assert not cursor.is_new(old)
+    cursor.advance([ticket])
+
+    assert cursor.watermark == NOW
+    assert not cursor.is_new(ticket)
+    assert cursor.is_new({"id": 1, "updated_at": format_search_datetime(NOW + timedelta(1))})
+
+
+def test_cursor_keeps_watermark_on_partial_scan_and_prunes_old_versions():
+    start = NOW - timedelta(hours=1)
+    cursor = ChangeCursor(start)
+    cursor.advance([{"id": 1, "updated_at": format_search_datetime(NOW)}], move_watermark=False)
+    assert cursor.watermark == start
+    assert "1" in cursor.delivered
+
+    later = NOW + timedelta(seconds=CHANGE_OVERLAP_SECONDS * 2)
+    cursor.advance([{"id": 2, "updated_at": format_search_datetime(later)}])
+    assert set(cursor.delivered) == {"2"}
+    assert ChangeCursor.from_dict(cursor.to_dict()).to_dict() == cursor.to_dict()
+
+
+def test_group_by_company_sorts_and_skips_unknown(tenant):
+    client = ZendeskClient(tenant)
+    field = client.company_field_id
+    tickets = [
+        _ticket(1, NOW, "acme", field),
+        _ticket(2, NOW, "globex", field),
+        _ticket(3, NOW, "globex", field),
+        {"id": 4, "subject": "no company"},
+    ]
+
+    groups = group_by_company(tickets, client)
+    assert [(g.name, g.ticket_count) for g in groups] == [("globex", 2), ("acme", 1)]
+
+    sampled = group_by_company(tickets, client, limit_per_company=1)
+    assert sampled[0].ticket_count == 2
+    assert len(sampled[0].tickets) == 1
+
+
+async def test_second_call_returns_only_new_changes(tenant):
+    field = ZendeskClient(tenant).company_field_id
+    served = [_ticket(1, NOW - timedelta(minutes=30), "acme", field)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": list(served), "meta": {"has_more": False}})
+
+    install_transport(tenant, handler)
+    with use_tenant(tenant):
+        first = await get_ticket_changes(
+            company=None, tags=None, status=None, subscription="ops", period_days=1,
+            reset=False, deadline_seconds=None, ctx=None,
+        )
+        served.append(_ticket(2, NOW, "globex", field))
+        second = await get_ticket_changes(
+            company=None, tags=None, status=None, subscription="ops", period_days=1,
+            reset=False, deadline_seconds=None, ctx=None,
+        )
+
+    assert first.total_tickets == 1
+    assert [g.name for g in second.companies] == ["globex"]
+    assert second.since == first.until
+
+
+async def test_busy_cursor_is_reported_instead_of_read_unlocked(tenant):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"results": [], "meta": {"has_more": False}})
+
+    install_transport(tenant, handler)
+    with use_tenant(tenant):
+        cache = ZendeskClient(tenant).cache
+        key = cursor_key("subscription:ops", {"company": None, "tags": [], "status": None})
+        async with cache.lock(key) as held:
+            assert held
+            with pytest.raises(ValueError, match="busy"):
+                await get_ticket_changes(
+                    company=None, tags=None, status=None, subscription="ops", period_days=1,
+                    reset=False, deadline_seconds=0.1, ctx=None,
+                )
+
+    assert calls == []
@@ -0,0 +1,118 @@
+import httpx
+import pytest
+
+from src.services import cache as cache_module
+from src.services.rate_limit import HeadroomExhausted, reserve_headroom
+from src.services.redis_cache import RedisCache
+from src.services.tenants import use_tenant
+from src.services.warmer import (
+    CacheWarmer,
+    WarmerElection,
+    _complete_args,
+    _get_tool,
+    _tool_defaults,
+)
+from src.services.zendesk_client import ZendeskClient
+from tests.conftest import API_BASE_URL, install_transport
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_backend(monkeypatch) -> RedisCache:
+    backend = RedisCache(fakeredis.FakeAsyncRedis(), prefix="test:")
+    monkeypatch.setattr(cache_module, "_cache", backend)
+    return backend
+
+
+async def test_single_warmer_elected_with_redis(redis_backend):
+    first, second = WarmerElection(60), WarmerElection(60)
+
+    assert await first.is_leader()
+    assert not await second.is_leader()
+    assert await first.is_leader()  # 보유자는 연장
+
+    # 보유 워커가 죽어 임대가 만료되면 다른 워커가 이어받음
+    await redis_backend.client.delete("test:warmer:leader")
+    assert await second.is_leader()
+    assert not await first.is_leader()
+
+
+async def test_non_leader_does_not_warm(redis_backend):
+    await WarmerElection(60).is_leader()
+    warmer = CacheWarmer(warm_queries=[{"tool": "get_top_agents", "args": {}}])
+    assert await warmer.run_once() == 0
+
+
+async def test_single_worker_memory_backend_always_warms(monkeypatch):
+    monkeypatch.setenv("MCP_WORKERS", "1")
+    assert await WarmerElection(60).is_leader()
+
+
+async def test_headroom_checked_between_pages(tenant):
+    pages = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        pages.append(request.url.params.get("page", "1"))
+        return httpx.Response(
+            200,
+            headers={"X-Rate-Limit": "100", "X-Rate-Limit-Remaining": "10"},
+            json={
+                "results": [{"id": len(pages)}],
+                "next_page": f"{API_BASE_URL}/search.json?query=x&page={len(pages) + 1}",
+            },
+        )
+
+    install_transport(tenant, handler)
+    client = ZendeskClient(tenant)
+    with reserve_headroom(0.5), pytest.raises(HeadroomExhausted):
+        await client.search_tickets("type:ticket")
+
+    # 첫 페이지 응답으로 여유가 10%가 된 뒤 다음 페이지는 요청하지 않음
+    assert pages == ["1"]
+
+
+async def test_requests_outside_reserve_ignore_headroom(tenant):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"X-Rate-Limit": "100", "X-Rate-Limit-Remaining": "1"},
+            json={"results": [{"id": 1}], "next_page": None},
+        )
+
+    install_transport(tenant, handler)
+    client = ZendeskClient(tenant)
+    await client.search_tickets("type:ticket")
+    assert len(await client.search_tickets("type:ticket status:open")) == 1
+
+
+def test_invalid_warm_queries_do_not_break_construction(monkeypatch):
+    monkeypatch.setenv("ZENDESK_WARM_QUERIES", "{not json")
+    warmer = CacheWarmer()
+    assert warmer.warm_queries == []
+
+
+def test_tool_defaults_computed_once():
+    _tool_defaults.cache_clear()
+    first = _complete_args("get_top_agents", {"period_days": 7})
+    second = _complete_args("get_top_agents", {})
+
+    assert first["period_days"] == 7
+    assert second["period_days"] == 30
+    assert _tool_defaults.cache_info().misses == 1
+
+
+async def test_warming_search_does_not_create_result_handle(tenant):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": [], "count": 0, "next_page": None})
+
+    install_transport(tenant, handler)
+    args = _complete_args("search_tickets", {"keywords": ["datadog"]})
+    with use_tenant(tenant):
+        with cache_module.refreshing():
+            warmed = await _get_tool("search_tickets")(**args)
+        result = await _get_tool("search_tickets")(**args)
+
+    assert warmed.handle is None
+    assert warmed.next_cursor is None
+    assert result.handle is not None
@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta, timezone
+
+from src.services.cache import (
+    AGGREGATES,
+    SEARCH,
+    TICKETS,
+    USERS,
+    TTLCache,
+    hash_query,
+    invalidation_key,
+    make_key,
+    set_with_summary,
+)
+from src.services.webhooks import (
+    _query_may_match,
+    apply_event,
+    sign_payload,
+    verify_signature,
+)
+
+SECRET = "webhook-secret"
+BODY = b'{"type": "zen:event-type:ticket.updated", "detail": {"id": "1"}}'
+
+
+def _timestamp(offset: timedelta = timedelta()) -> str:
+    return (datetime.now(timezone.utc) + offset).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _ticket_event(event: str, **detail) -> dict:
+    return {"type": f"zen:event-type:{event}", "detail": detail}
+
+
+async def _cache_search(cache: TTLCache, query: str, results: list[dict]) -> str:
+    key = make_key(SEARCH, hash_query(query))
+    await set_with_summary(
+        cache,
+        key,
+        {"query": query, "results": results},
+        {"query": query, "ids": [t["id"] for t in results]},
+    )
+    return key
+
+
+def test_valid_signature_is_accepted():
+    timestamp = _timestamp()
+    signature = sign_payload(SECRET, timestamp, BODY)
+    assert verify_signature(SECRET, signature, timestamp, BODY)
+
+
+def test_signature_rejection():
+    timestamp = _timestamp()
+    signature = sign_payload(SECRET, timestamp, BODY)
+    assert not verify_signature(SECRET, None, timestamp, BODY)
+    assert not verify_signature(SECRET, signature, None, BODY)
+    assert not verify_signature("other-secret", signature, timestamp, BODY)
+    assert not verify_signature(SECRET, signature, timestamp, BODY + b" ")
+
+
+def test_stale_signature_timestamp_is_rejected():
+    timestamp = _timestamp(-timedelta(hours=1))
+    signature = sign_payload(SECRET, timestamp, BODY)
+    assert not verify_signature(SECRET, signature, timestamp, BODY)
+
+
+async def test_ticket_patch_keeps_remaining_ttl():
+    cache = TTLCache()
+    key = make_key(TICKETS, 1)
+    await cache.set(key, {"id": 1, "status": "open", "custom_fields": [1]}, ttl=10)
+
+    result = await apply_event(cache, _ticket_event("ticket.updated", id="1", status="SOLVED"))
+
+    assert result["tickets"] == 1
+    assert await cache.get(key) == {"id": 1, "status": "solved", "custom_fields": [1]}
+    assert await cache.ttl(key) <= 10
+
+
+async def test_uncached_ticket_is_not_created():
+    cache = TTLCache()
+    await apply_event(cache, _ticket_event("ticket.updated", id="1", status="solved"))
+    assert await cache.get(make_key(TICKETS, 1)) is None
+
+
+async def test_user_patch_keeps_remaining_ttl():
+    cache = TTLCache(default_ttl=3600)
+    key = make_key(USERS, 7)
+    await cache.set(key, {"id": 7, "name": "old"}, ttl=5)
+
+    event = {"type": "zen:event-type:user.updated", "detail": {"id": 7, "name": "new"}}
+    await apply_event(cache, event)
+
+    assert (await cache.get(key))["name"] == "new"
+    assert await cache.ttl(key) <= 5
+
+
+async def test_search_containing_updated_ticket_is_invalidated():
+    cache = TTLCache()
+    key = await _cache_search(cache, "type:ticket status:open", [{"id": 1, "status": "open"}])
+
+    result = await apply_event(cache, _ticket_event("ticket.updated", id=1, status="solved"))
+
+    assert result["search_invalidated"] == 1
+    assert await cache.get(key) is None
+
+
+async def test_search_that_may_now_match_is_invalidated():
+    cache = TTLCache()
+    key = await _cache_search(cache, "type:ticket status:solved", [{"id": 2, "status": "solved"}])
+
+    await apply_event(cache, _ticket_event("ticket.updated", id=1, status="solved"))
+
+    assert await cache.get(key) is None
+
+
+async def test_search_that_cannot_match_is_kept():
+    cache = TTLCache()
+    open_key = await _cache_search(cache, "type:ticket status:open", [{"id": 2}])
+    tag_key = await _cache_search(cache, "type:ticket tags:vip", [{"id": 3}])
+
+    result = await apply_event(
+        cache, _ticket_event("ticket.created", id=1, status="new", tags=["billing"])
+    )
+
+    assert result["search_invalidated"] == 0
+    assert await cache.get(open_key) is not None
+    assert await cache.get(tag_key) is not None
+
+
+def test_query_may_match():
+    ticket = {"status": "open", "priority": "high", "tags": ["VIP", "billing"]}
+    assert _query_may_match("type:ticket status:open", ticket)
+    assert _query_may_match("status:pending status:open", ticket)
+    assert _query_may_match("tags:vip custom_field_1:acme created>2026-01-01", ticket)
+    assert _query_may_match("status:solved", {"tags": []})
+    assert not _query_may_match("status:solved", ticket)
+    assert not _query_may_match("-tags:billing", ticket)
+    assert not _query_may_match('priority:"low"', ticket)
+
+
+async def test_invalidation_reads_summaries_not_results(monkeypatch):
+    cache = TTLCache()
+    search_key = await _cache_search(cache, "type:ticket status:open", [{"id": 1}])
+    aggregate_key = make_key(AGGREGATES, "get_top_agents", "2026-09-01", 10)
+    await set_with_summary(
+        cache,
+        aggregate_key,
+        {"result": {}},
+        {"window_start": "2026-09-01", "date_field": "updated_at", "user_ids": [5]},
+    )
+    read = []
+    original_get = cache.get
+
+    async def tracking_get(key):
+        read.append(key)
+        return await original_get(key)
+
+    monkeypatch.setattr(cache, "get", tracking_get)
+    stats = await apply_event(
+        cache, _ticket_event("ticket.updated", id=1, updated_at="2026-10-01T00:00:00Z")
+    )
+
+    assert stats["search_invalidated"] == 1
+    assert stats["aggregates_invalidated"] == 1
+    assert search_key not in read and aggregate_key not in read
+    assert await original_get(search_key) is None
+    assert await original_get(invalidation_key(search_key)) is None
+    assert await original_get(aggregate_key) is None
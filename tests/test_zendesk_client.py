@@ -0,0 +1,188 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.services import zendesk_client
+from src.services.zendesk_client import ZendeskClient, _retry_after_seconds
+from src.utils.deadline import Deadline
+from tests.conftest import API_BASE_URL, install_transport
+
+
+def test_retry_after_seconds_value():
+    assert _retry_after_seconds("2", 0) == 2.0
+    assert _retry_after_seconds("0.5", 3) == 0.5
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+    seconds = _retry_after_seconds(format_datetime(retry_at, usegmt=True), 0)
+    assert 8 <= seconds <= 10
+
+
+def test_retry_after_past_http_date_is_zero():
+    retry_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert _retry_after_seconds(format_datetime(retry_at, usegmt=True), 0) == 0.0
+
+
+def test_retry_after_unparseable_falls_back_to_backoff():
+    assert _retry_after_seconds("garbage", 0) == zendesk_client.RETRY_BACKOFF_SECONDS
+    assert _retry_after_seconds(None, 1) == zendesk_client.RETRY_BACKOFF_SECONDS * 2
+    assert _retry_after_seconds(None, 20) == zendesk_client.RETRY_BACKOFF_MAX_SECONDS
+
+
+async def test_rate_limited_request_is_retried(tenant, monkeypatch):
+    monkeypatch.setattr(zendesk_client, "RETRY_BACKOFF_SECONDS", 0.01)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) < 3:
+            return httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00"})
+        return httpx.Response(200, json={"ticket": {"id": 1, "subject": "hello"}})
+
+    install_transport(tenant, handler)
+    client = ZendeskClient(tenant)
+    ticket = await client.get_ticket(1, deadline=Deadline.from_seconds(5))
+
+    assert ticket["subject"] == "hello"
+    assert calls == ["/api/v2/tickets/1.json"] * 3
+    assert client.base_url == API_BASE_URL
+
+
+async def test_rate_limit_retry_stops_at_deadline(tenant):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(429, headers={"Retry-After": "60"})
+
+    install_transport(tenant, handler)
+    client = ZendeskClient(tenant)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_ticket(1, deadline=Deadline.from_seconds(1))
+    assert len(calls) == 1
+
+
+def _search_pages(total: int, per_page: int, served: int):
+    """전체 total건 중 served건까지만 반환하는 검색 API (1,000건 제한 재현)"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        start = (page - 1) * per_page
+        ids = range(start + 1, min(start + per_page, served) + 1)
+        has_next = start + per_page < served
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"id": i, "created_at": "2026-10-01T00:00:00Z", "tags": []} for i in ids
+                ],
+                "count": total,
+                "next_page": f"{API_BASE_URL}/search.json?page={page + 1}" if has_next else None,
+            },
+        )
+
+    return handler
+
+
+@pytest.fixture
+def search_index(tmp_path, monkeypatch, tenant):
+    from src.services import search_index as search_index_module
+    from src.services.tenants import use_tenant
+
+    monkeypatch.setattr(search_index_module, "SEARCH_INDEX_PATH", str(tmp_path / "index.db"))
+    monkeypatch.setattr(search_index_module, "_indexes", {})
+    with use_tenant(tenant):
+        yield search_index_module.get_search_index()
+
+
+async def test_complete_scan_marks_index_coverage(tenant, search_index):
+    install_transport(tenant, _search_pages(total=5, per_page=2, served=5))
+    spool = await ZendeskClient(tenant).scan_tickets("q", mirror_since="2026-09-01")
+
+    assert len(spool) == 5
+    assert await search_index.covered_until("2026-09-01") is not None
+
+
+async def test_truncated_scan_does_not_mark_index_coverage(tenant, search_index):
+    install_transport(tenant, _search_pages(total=1500, per_page=2, served=4))
+    spool = await ZendeskClient(tenant).scan_tickets("q", mirror_since="2026-09-01")
+
+    assert len(spool) == 4
+    assert await search_index.covered_until("2026-09-01") is None
+
+
+async def test_count_timeout_skips_coverage_and_returns_results(tenant, search_index):
+    pages = _search_pages(total=3, per_page=2, served=3)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search/count.json"):
+            # 시간 예산을 넘겨 끊긴 count 요청
+            await asyncio.sleep(0.6)
+            raise httpx.ReadTimeout("timed out", request=request)
+        response = pages(request)
+        body = json.loads(response.content)
+        body.pop("count")
+        return httpx.Response(200, json=body)
+
+    install_transport(tenant, handler)
+    spool = await ZendeskClient(tenant).scan_tickets(
+        "q", deadline=Deadline.from_seconds(0.5), mirror_since="2026-09-01"
+    )
+
+    assert len(spool) == 3
+    assert await search_index.covered_until("2026-09-01") is None
+
+
+def _metrics_handler(requested: list[list[str]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = request.url.params["ids"].split(",")
+        requested.append(ids)
+        return httpx.Response(
+            200,
+            json={"metric_sets": [{"ticket_id": int(i), "reply_time_in_minutes": {}} for i in ids]},
+        )
+
+    return handler
+
+
+async def test_ticket_metrics_not_cached_per_ticket_in_memory(tenant):
+    requested: list[list[str]] = []
+    install_transport(tenant, _metrics_handler(requested))
+    client = ZendeskClient(tenant)
+
+    metrics = await client.get_ticket_metrics([1, 2, 2])
+    assert sorted(metrics) == [1, 2]
+    assert requested == [["1", "2"]]
+    assert await client.cache.keys("ticket_metrics:") == []
+
+
+async def test_ticket_metrics_batched_through_shared_cache(tenant, monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    from src.services import cache as cache_module
+    from src.services.redis_cache import RedisCache
+
+    backend = RedisCache(fakeredis.FakeAsyncRedis(), prefix="test:")
+    monkeypatch.setattr(cache_module, "_cache", backend)
+    requested: list[list[str]] = []
+    install_transport(tenant, _metrics_handler(requested))
+    client = ZendeskClient(tenant)
+
+    await client.get_ticket_metrics([1, 2])
+    mget_calls = []
+    original_mget = backend.client.mget
+
+    async def counting_mget(keys):
+        mget_calls.append(keys)
+        return await original_mget(keys)
+
+    monkeypatch.setattr(backend.client, "mget", counting_mget)
+    metrics = await client.get_ticket_metrics([1, 2, 3])
+
+    assert sorted(metrics) == [1, 2, 3]
+    assert requested == [["1", "2"], ["3"]]
+    assert len(mget_calls) == 1